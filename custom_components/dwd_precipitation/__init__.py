@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .coordinator import BaseProductUpdateCoordinator
-from .const import PLATFORMS
+from .const import (
+    HOT_OPTIONS,
+    MAX_CONCURRENT_FIRST_REFRESHES,
+    OPTION_DEFAULTS,
+    PLATFORMS,
+)
 from .products import (
+    RELEASE_CACHE,
+    RV_CUBES,
     RadvorRS,
     RadvorRV,
     HymecNG,
@@ -20,6 +28,8 @@ from .products import (
     RadolanSF,
     RadolanSFLastYesterday,
 )
+from .release_store import async_get_release_store
+from .scheduler import async_get_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,15 +41,40 @@ class MyData:
     """Runtime data definition."""
 
     coordinators: dict[str, BaseProductUpdateCoordinator]
+    # Entry data/options the coordinators currently run with (see update_listener).
+    data: dict[str, Any] = field(default_factory=dict)
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+def _resolve_grid_cells(coordinators: list[BaseProductUpdateCoordinator]) -> None:
+    """Compute (and cache) every coordinator's grid cell, area and zones."""
+    for coordinator in coordinators:
+        coordinator.index  # noqa: B018 - cached_property
+        coordinator.area  # noqa: B018 - cached_property on products with areas
+        coordinator.zones  # noqa: B018 - cached_property on products with zones
 
 
-def _make_refresh_callback(coordinator: BaseProductUpdateCoordinator):
-    """Return a time-change callback that refreshes the given coordinator."""
+async def _async_first_refresh_all(
+    coordinators: list[BaseProductUpdateCoordinator],
+) -> None:
+    """Run the first refresh of all coordinators concurrently (bounded).
 
-    async def _callback(_now) -> None:
-        await coordinator.async_refresh()
+    Every refresh runs to completion; the first failure in coordinator order is
+    then re-raised, as if the refreshes had run one after another.
+    """
+    slots = asyncio.Semaphore(MAX_CONCURRENT_FIRST_REFRESHES)
 
-    return _callback
+    async def _refresh(coordinator: BaseProductUpdateCoordinator) -> None:
+        async with slots:
+            await coordinator.async_config_entry_first_refresh()
+
+    results = await asyncio.gather(
+        *(_refresh(coordinator) for coordinator in coordinators),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
@@ -58,25 +93,50 @@ async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
         RadolanSFLastYesterday(hass, entry, client, lat, lon),
     ]
 
-    keyed: dict[str, BaseProductUpdateCoordinator] = {}
+    # An RV forecast cube (built only on request) is dropped once the last
+    # entry using RV is unloaded. Unload callbacks run last-in first-out, so
+    # this runs after the unsubscriptions registered below.
+    @callback
+    def _drop_unused_cube() -> None:
+        if not RELEASE_CACHE.subscribers(RadvorRV.PRODUCT_KEY):
+            RV_CUBES.clear()
+
+    entry.async_on_unload(_drop_unused_cube)
+
+    # Resolving the grid cells imports the radar parsers (numpy, h5py); do it
+    # in the executor rather than on the event loop.
+    await hass.async_add_executor_job(_resolve_grid_cells, product_coordinators)
+
+    # Subscribe before the first refresh so the download is shared with every
+    # other entry's coordinator for the same product; only now, as a shared
+    # fetch reads each subscriber's resolved cells on the event loop.
+    for coordinator in product_coordinators:
+        entry.async_on_unload(
+            RELEASE_CACHE.subscribe(coordinator.PRODUCT_KEY, coordinator)
+        )
 
+    # Coordinators whose persisted release is still current start from disk;
+    # their first refresh then has nothing newer to download.
+    store = await async_get_release_store(hass)
     for coordinator in product_coordinators:
-        await coordinator.async_config_entry_first_refresh()
-
-        refresh_callback = _make_refresh_callback(coordinator)
-        for arg in coordinator.track_time_change_args:
-            unsub = async_track_utc_time_change(
-                hass,
-                refresh_callback,
-                hour=arg["hour"],
-                minute=arg["minute"],
-                second=arg["second"],
-            )
-            entry.async_on_unload(unsub)
+        if store.restore(entry.entry_id, coordinator):
+            _LOGGER.debug("%s: restored the current release", coordinator.name)
 
+    await _async_first_refresh_all(product_coordinators)
+
+    for coordinator in product_coordinators:
+        entry.async_on_unload(store.async_track(entry.entry_id, coordinator))
+
+    # Refreshes are driven by the shared scheduler: one set of time trackers per
+    # release schedule across all entries, fanned out to its coordinators.
+    scheduler = async_get_scheduler(hass)
+    keyed: dict[str, BaseProductUpdateCoordinator] = {}
+
+    for coordinator in product_coordinators:
+        entry.async_on_unload(scheduler.async_add(coordinator))
         keyed[coordinator.PRODUCT_KEY] = coordinator
 
-    entry.runtime_data = MyData(keyed)
+    entry.runtime_data = MyData(keyed, dict(entry.data), dict(entry.options))
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -85,10 +145,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
 
 
 async def update_listener(hass: HomeAssistant, entry: MyConfigEntry) -> None:
-    """Handle config entry updates."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle config entry updates.
+
+    A change limited to HOT_OPTIONS is applied in place: the coordinators
+    re-derive their current data (RV from its cached forecast series) and the
+    entities re-render, without a download. Anything else, e.g. the start/end
+    mode that selects the entity classes, reloads the entry.
+    """
+    runtime = entry.runtime_data
+    # Unset options compare as their defaults, so the first save of an entry
+    # that never had options only counts the fields actually changed.
+    previous = {**OPTION_DEFAULTS, **runtime.options}
+    current = {**OPTION_DEFAULTS, **entry.options}
+    changed = {
+        key
+        for key in previous.keys() | current.keys()
+        if previous.get(key) != current.get(key)
+    }
+    if runtime.data != entry.data or not changed <= HOT_OPTIONS:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    runtime.options = dict(entry.options)
+    for coordinator in runtime.coordinators.values():
+        coordinator.async_apply_options()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: MyConfigEntry) -> None:
+    """Drop the persisted releases of a removed config entry."""
+    store = await async_get_release_store(hass)
+    store.async_remove_entry(entry.entry_id)
@@ -28,34 +28,83 @@ from .const import (
     RAIN_END_ALGO_CLEARING,
     CONF_PRECIPITATION_RESET_THRESHOLD,
     DEFAULT_PRECIPITATION_RESET_THRESHOLD,
+    CONF_AREA_RADIUS,
+    DEFAULT_AREA_RADIUS,
+    MAX_AREA_RADIUS,
+    CONF_ZONES,
 )
-from .radar import rs_grid_contains
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _in_rs_grid(lat: float, lon: float) -> bool:
+    """Return whether (lat, lon) lies in the RS grid (imports the parsers)."""
+    from .radar import rs_grid_contains
+
+    return rs_grid_contains(lat, lon)
+
+
+def _valid_zones(geojson: str) -> bool:
+    """Return whether ``geojson`` holds zones on the RS and RADOLAN grids.
+
+    Every product reduces every zone, so each zone must overlap both grids.
+    Zones must be distinct after slugification too, as their entity ids are.
+    Imports the parsers.
+    """
+    from homeassistant.util import slugify
+
+    from .products import RadolanProduct
+    from .radar import (
+        RS_GRID_SHAPE,
+        ZoneIndex,
+        get_radolan_grid_position,
+        parse_zones,
+        rs_grid_position,
+    )
+
+    try:
+        zones = parse_zones(geojson)
+        ZoneIndex.build(zones, rs_grid_position, RS_GRID_SHAPE)
+        ZoneIndex.build(
+            zones, get_radolan_grid_position, RadolanProduct.EXPECTED_SHAPE
+        )
+    except ValueError:
+        return False
+    return len({slugify(name) for name in zones}) == len(zones)
+
+
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for DWD Precipitation."""
 
     async def async_step_init(self, user_input=None) -> FlowResult:
         """Manage the options."""
-        if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+        errors: dict[str, str] = {}
 
+        if user_input is not None:
+            zones = user_input.get(CONF_ZONES, "")
+            if zones.strip() and not await self.hass.async_add_executor_job(
+                _valid_zones, zones
+            ):
+                errors[CONF_ZONES] = "invalid_zones"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        # Re-shown with the rejected input after an error.
+        options = {**self.config_entry.options, **(user_input or {})}
         schema = vol.Schema(
             {
                 vol.Optional(
                     CONF_EXTRA_ATTRIBUTES,
-                    default=self.config_entry.options.get(CONF_EXTRA_ATTRIBUTES, False),
+                    default=options.get(CONF_EXTRA_ATTRIBUTES, False),
                 ): selector.BooleanSelector(),
                 vol.Optional(
                     CONF_UNAVAILABLE_WHEN_STALE,
-                    default=self.config_entry.options.get(CONF_UNAVAILABLE_WHEN_STALE, True),
+                    default=options.get(CONF_UNAVAILABLE_WHEN_STALE, True),
                 ): selector.BooleanSelector(),
                 vol.Optional(
                     CONF_PRECIPITATION_THRESHOLD,
-                    default=self.config_entry.options.get(
+                    default=options.get(
                         CONF_PRECIPITATION_THRESHOLD, DEFAULT_PRECIPITATION_THRESHOLD
                     ),
                 ): selector.NumberSelector(
@@ -68,7 +117,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 ),
                 vol.Optional(
                     CONF_START_END_MODE,
-                    default=self.config_entry.options.get(
+                    default=options.get(
                         CONF_START_END_MODE, DEFAULT_START_END_MODE
                     ),
                 ): selector.SelectSelector(
@@ -83,7 +132,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 ),
                 vol.Optional(
                     CONF_PRECIPITATION_END_ALGORITHM,
-                    default=self.config_entry.options.get(
+                    default=options.get(
                         CONF_PRECIPITATION_END_ALGORITHM, DEFAULT_PRECIPITATION_END_ALGORITHM
                     ),
                 ): selector.SelectSelector(
@@ -98,7 +147,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 ),
                 vol.Optional(
                     CONF_PRECIPITATION_RESET_THRESHOLD,
-                    default=self.config_entry.options.get(
+                    default=options.get(
                         CONF_PRECIPITATION_RESET_THRESHOLD, DEFAULT_PRECIPITATION_RESET_THRESHOLD
                     ),
                 ): selector.NumberSelector(
@@ -109,9 +158,28 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         mode=selector.NumberSelectorMode.BOX,
                     )
                 ),
+                vol.Optional(
+                    CONF_AREA_RADIUS,
+                    default=options.get(
+                        CONF_AREA_RADIUS, DEFAULT_AREA_RADIUS
+                    ),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=MAX_AREA_RADIUS,
+                        step=1,
+                        unit_of_measurement="km",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_ZONES, default=options.get(CONF_ZONES, "")
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(multiline=True)
+                ),
             }
         )
-        return self.async_show_form(step_id="init", data_schema=schema)
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -148,7 +216,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data["latitude"] = coords["latitude"]
             data["longitude"] = coords["longitude"]
 
-            if not rs_grid_contains(data["latitude"], data["longitude"]):
+            if not await self.hass.async_add_executor_job(
+                _in_rs_grid, data["latitude"], data["longitude"]
+            ):
                 errors["base"] = "coordinates_out_of_range"
 
             if not errors:
@@ -13,6 +13,10 @@ DOMAIN = "dwd_precipitation"
 
 PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+# How many product coordinators of one config entry run their first refresh
+# (download + parse) at the same time during setup.
+MAX_CONCURRENT_FIRST_REFRESHES = 3
+
 CONF_COORDS = "coordinates"
 
 CONF_EXTRA_ATTRIBUTES = "extra_state_attributes"
@@ -50,6 +54,43 @@ CONF_PRECIPITATION_RESET_THRESHOLD = "precipitation_reset_threshold"
 # mm; "Precipitation now" at/above this value resets the dry streak counter.
 DEFAULT_PRECIPITATION_RESET_THRESHOLD = 1.0
 
+CONF_AREA_RADIUS = "area_radius"
+
+# km; radius of the area around the location whose precipitation statistics
+# (max / mean / coverage) are exposed as sensors. 0 disables them.
+DEFAULT_AREA_RADIUS = 0
+MAX_AREA_RADIUS = 50
+
+# GeoJSON polygons (e.g. catchments, districts) whose mean precipitation is
+# exposed as sensors, per product; empty disables them.
+CONF_ZONES = "zones"
+
+# Options that only affect derived values or how entities render. Changing only
+# these is applied to the running coordinators in place (no reload, no
+# download); any other change reloads the entry.
+HOT_OPTIONS = frozenset(
+    {
+        CONF_EXTRA_ATTRIBUTES,
+        CONF_UNAVAILABLE_WHEN_STALE,
+        CONF_PRECIPITATION_THRESHOLD,
+        CONF_PRECIPITATION_END_ALGORITHM,
+        CONF_PRECIPITATION_RESET_THRESHOLD,
+    }
+)
+
+# What each option means while it is unset (an entry that never saved its
+# options); the options form offers the same defaults.
+OPTION_DEFAULTS = {
+    CONF_EXTRA_ATTRIBUTES: False,
+    CONF_UNAVAILABLE_WHEN_STALE: True,
+    CONF_PRECIPITATION_THRESHOLD: DEFAULT_PRECIPITATION_THRESHOLD,
+    CONF_START_END_MODE: DEFAULT_START_END_MODE,
+    CONF_PRECIPITATION_END_ALGORITHM: DEFAULT_PRECIPITATION_END_ALGORITHM,
+    CONF_PRECIPITATION_RESET_THRESHOLD: DEFAULT_PRECIPITATION_RESET_THRESHOLD,
+    CONF_AREA_RADIUS: DEFAULT_AREA_RADIUS,
+    CONF_ZONES: "",
+}
+
 # HymecNG precipitation-type classes, indexed by the DWD class value (0..10) as
 # defined by the ODIM legend embedded in the composite. These are the possible
 # states of the "Precipitation type" enum sensor.
@@ -74,4 +115,4 @@ DWD_RADOLAN_URL = f"{DWD_OPENDATA_URL}/weather/radar/radolan"
 
 DWD_RADVOR_URL = f"{DWD_OPENDATA_URL}/weather/radar/radvor"
 
-DWD_COMPOSITE_URL = f"{DWD_OPENDATA_URL}/weather/radar/composite"
\ No newline at end of file
+DWD_COMPOSITE_URL = f"{DWD_OPENDATA_URL}/weather/radar/composite"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import random
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
@@ -11,18 +13,28 @@ from functools import cached_property
 from http import HTTPStatus
 from itertools import product as cartesian_product
 from math import gcd
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_UNAVAILABLE_WHEN_STALE
-from .utils import get_previous_multiple
+from .const import CONF_UNAVAILABLE_WHEN_STALE, CONF_ZONES
+from .utils import (
+    AsyncProbe,
+    ReleaseDelayEstimator,
+    RetryPolicy,
+    async_head,
+    get_previous_multiple,
+)
+
+if TYPE_CHECKING:
+    from .radar.area import AreaQuery, AreaStats
+    from .radar.zones import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,10 +90,13 @@ class CoordinatorData:
 
     ``data``/``metadata`` are a scalar+``ProductMetadata`` for RADOLAN products,
     parallel lists for RS, or parallel dicts keyed by entity sub-key for RV.
+    ``zones`` maps each configured zone to its mean of the product's (first)
+    value, or is None without zones.
     """
 
     data: float | list[float | None] | dict[str, Any]
     metadata: ProductMetadata | list[ProductMetadata] | dict[str, ProductMetadata]
+    zones: dict[str, float | None] | None = None
 
 
 class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
@@ -106,6 +121,30 @@ class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
 
     USE_LOCAL_TIME: ClassVar[bool] = False
 
+    # Backoff of the fast-poll retries while a release is not available yet.
+    RETRY_POLICY: ClassVar[RetryPolicy] = RetryPolicy()
+
+    # Releases whose retry counters are kept (diagnostics).
+    RETRY_HISTORY: ClassVar[int] = 12
+
+    # Most recent availability probe (release, result); set per instance by
+    # _async_release_published.
+    _last_probe: tuple[datetime, AsyncProbe] | None = None
+
+    # Learned publication delay (see ReleaseDelayEstimator); None = static only.
+    _delay_estimator: ReleaseDelayEstimator | None = None
+
+    # Neighbourhood whose statistics are extracted along with the cell (see
+    # radar.area), and those statistics for the current release; products
+    # without area support keep None.
+    area: AreaQuery | None = None
+    area_stats: AreaStats | None = None
+
+    # Polygon zones reduced along with the cell (see radar.zones), and their
+    # means for the current release; None without zones or zone support.
+    zones: ZoneIndex | None = None
+    zone_values: dict[str, float | None] | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -125,16 +164,44 @@ class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
         self.async_client = async_client
         self.coords = (lat, lon)
         self.curr_release: datetime | None = None
+        # Wall time (s) of the last release decode this coordinator ran in the
+        # executor, i.e. work kept off the event loop.
+        self.last_decode_seconds: float | None = None
+        # When DWD published the current release (Last-Modified), and how long
+        # it then took until the coordinator had the data.
+        self.release_published: datetime | None = None
+        self.publication_latency: timedelta | None = None
         self._fast_poll_unsub = None
+        # Per-instance RNG for the retry jitter; retries issued per release.
+        self._retry_rng = random.Random()
+        self.retries_by_release: dict[datetime, int] = {}
+        self._delay_estimator = ReleaseDelayEstimator(
+            self.RELEASE_DELAY, self.RELEASE_INTERVAL
+        )
 
     # ------------------------------------------------------------------
     # Concrete helpers
     # ------------------------------------------------------------------
 
+    @property
+    def effective_release_delay(self) -> timedelta:
+        """Return the learned release delay, or RELEASE_DELAY while learning."""
+        if self._delay_estimator is None:
+            return self.RELEASE_DELAY
+        return self._delay_estimator.delay
+
+    def _now(self) -> datetime:
+        """Return the current time in the clock the release grid uses."""
+        return dt_util.now() if self.USE_LOCAL_TIME else dt_util.utcnow()
+
+    def _latest_release_now(self) -> datetime:
+        """Return the most recent valid release timestamp as of now."""
+        return self._get_latest_release(self._now())
+
     def _get_latest_release(self, now: datetime) -> datetime:
         """Return the most recent valid release timestamp."""
         prev = get_previous_multiple(
-            now - self.RELEASE_DELAY,
+            now - self.effective_release_delay,
             self.RELEASE_INTERVAL,
             self.RELEASE_OFFSET,
         )
@@ -219,18 +286,78 @@ class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
     # ------------------------------------------------------------------
 
     def _start_fast_polling(self) -> None:
-        """Begin 60-second retry polling if not already running."""
+        """Begin backoff retry polling if not already running."""
         if self._fast_poll_unsub is not None:
             return
 
-        async def _trigger(_now) -> None:
-            _LOGGER.debug("%s: fast-poll retry firing", self.PRODUCT_KEY)
-            await self.async_refresh()
+        self._schedule_retry(self._latest_release_now())
+        self.config_entry.async_on_unload(self._stop_fast_polling)
 
-        self._fast_poll_unsub = async_track_time_interval(
-            self.hass, _trigger, timedelta(seconds=60)
+    def _schedule_retry(self, release: datetime) -> None:
+        """Schedule the next retry of ``release`` per RETRY_POLICY."""
+        attempt = self.retries_by_release.get(release, 0)
+        delay = self.RETRY_POLICY.delay(attempt, self.RELEASE_INTERVAL, self._retry_rng)
+        _LOGGER.debug(
+            "%s: retry %d of the %s release in %.0f s",
+            self.PRODUCT_KEY,
+            attempt + 1,
+            release.isoformat(),
+            delay.total_seconds(),
         )
-        self.config_entry.async_on_unload(self._stop_fast_polling)
+        self._fast_poll_unsub = async_call_later(
+            self.hass, delay, self._async_fast_poll_tick
+        )
+
+    def _count_retry(self, release: datetime) -> None:
+        """Count one retry issued for ``release``, keeping RETRY_HISTORY releases."""
+        counts = self.retries_by_release
+        counts[release] = counts.get(release, 0) + 1
+        for stale in sorted(counts)[: -self.RETRY_HISTORY]:
+            del counts[stale]
+
+    async def _async_fast_poll_tick(self, _now: datetime) -> None:
+        """Retry the update, but only download once the release exists.
+
+        Each tick first probes the release with a cheap HEAD request; while DWD
+        has not published it yet (404) the full GET is skipped and the next
+        retry is scheduled. A failing refresh reschedules through
+        _async_update_data; a successful one ends the retries.
+        """
+        self._fast_poll_unsub = None
+        release = self._latest_release_now()
+        self._count_retry(release)
+        if not await self._async_release_published(release):
+            _LOGGER.debug(
+                "%s: fast-poll probe — %s release not published yet",
+                self.PRODUCT_KEY,
+                release.isoformat(),
+            )
+            self._schedule_retry(release)
+            return
+
+        _LOGGER.debug("%s: fast-poll retry firing", self.PRODUCT_KEY)
+        await self.async_refresh()
+
+    async def _async_release_published(self, release: datetime) -> bool:
+        """Return False only if a probe shows the release is not published yet.
+
+        Probe errors are not conclusive and return True, leaving the error
+        handling to the full update.
+        """
+        try:
+            probe = await async_head(self._get_url(release), self.async_client)
+        except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+            _LOGGER.debug("%s: availability probe failed: %s", self.PRODUCT_KEY, err)
+            return True
+
+        self._last_probe = (release, probe)
+        return probe.exists
+
+    def probed_length(self, release: datetime) -> int | None:
+        """Return the Content-Length a probe reported for ``release``, if any."""
+        if self._last_probe is not None and self._last_probe[0] == release:
+            return self._last_probe[1].content_length
+        return None
 
     @callback
     def _stop_fast_polling(self) -> None:
@@ -239,6 +366,46 @@ class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
             self._fast_poll_unsub()
             self._fast_poll_unsub = None
 
+    def payload_settings(self) -> dict[str, Any]:
+        """Return the options the payload was extracted with (JSON-safe).
+
+        The release store persists them with each payload and refetches a
+        release saved under other settings; options read when deriving or
+        rendering are not part of them. With zones, that is a fingerprint of
+        their GeoJSON: a redrawn zone may keep its name.
+        """
+        settings: dict[str, Any] = {}
+        if self.zones is not None:
+            geojson = self.config_entry.options.get(CONF_ZONES, "")
+            settings["zones"] = hashlib.sha256(geojson.encode()).hexdigest()
+        return settings
+
+    def restore(self, release: datetime, data: CoordinatorData) -> bool:
+        """Adopt a persisted payload if ``release`` is still the latest release.
+
+        The first refresh then finds nothing newer and keeps it, without a
+        download. A payload reduced over other zones than the configured ones
+        is refetched. Returns whether the payload was adopted.
+        """
+        if release < self._latest_release_now():
+            return False
+        zone_names = None if self.zones is None else list(self.zones.names)
+        if (None if data.zones is None else list(data.zones)) != zone_names:
+            return False
+        self.curr_release = release
+        self.data = data
+        return True
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply changed entry options to the current data without refetching.
+
+        Options read at render time only need the entities re-rendered;
+        subclasses whose payload depends on options re-derive it first.
+        """
+        if self.data is not None:
+            self.async_update_listeners()
+
     # ------------------------------------------------------------------
     # Abstract interface — subclasses implement these
     # ------------------------------------------------------------------
@@ -247,6 +414,10 @@ class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
     def index(self):
         """Grid cell index for this location. Override with @cached_property."""
 
+    @abstractmethod
+    def _get_url(self, ts: datetime) -> str:
+        """Return the download URL of the release at ``ts``."""
+
     @abstractmethod
     async def _fetch_and_parse(self, ts: datetime) -> tuple[Any, Any]:
         """Fetch and parse the product for release timestamp ts.
@@ -262,7 +433,7 @@ class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
 
     async def _async_update_data(self) -> CoordinatorData:
         """HA coordinator hook — owns the full update lifecycle."""
-        now = dt_util.now() if self.USE_LOCAL_TIME else dt_util.utcnow()
+        now = self._now()
         latest_release = self._get_latest_release(now)
 
         if self.curr_release is not None and self.curr_release >= latest_release:
@@ -284,5 +455,86 @@ class BaseProductUpdateCoordinator(DataUpdateCoordinator[CoordinatorData], ABC):
 
         self._stop_fast_polling()
         self.curr_release = latest_release
+        self._record_publication_latency(latest_release)
+        self._observe_release_delay(latest_release)
 
-        return CoordinatorData(data, metadata)
+        return CoordinatorData(data, metadata, self.zone_values)
+
+    # ------------------------------------------------------------------
+    # Learned release delay
+    # ------------------------------------------------------------------
+
+    def _observe_release_delay(self, release: datetime) -> None:
+        """Feed the publication delay of a freshly fetched release to the estimator.
+
+        Uses the server's Last-Modified when known; otherwise the moment the
+        fetch succeeded, an upper bound on the publication time.
+        """
+        if self._delay_estimator is None:
+            return
+        published = self.release_published or dt_util.utcnow()
+        self._delay_estimator.observe(published - release)
+
+    def learned_refresh_at(self) -> datetime | None:
+        """Return when the next release is due at the learned delay.
+
+        None while the learned delay matches the static one, whose time
+        trackers already cover it. The scheduler refreshes the coordinator's
+        whole schedule group at this time (see ReleaseScheduler); when it is
+        later than the static one, the static refresh finds no newer release
+        and is a no-op.
+        """
+        if self._delay_estimator is None or self.curr_release is None:
+            return None
+        delay = self.effective_release_delay
+        if abs(delay - self.RELEASE_DELAY) < timedelta(seconds=1):
+            return None
+        return self.curr_release + self.RELEASE_INTERVAL + delay
+
+    def timing_diagnostics(self) -> dict[str, Any]:
+        """Return release-timing diagnostics of this coordinator."""
+        estimator = self._delay_estimator
+        learned = estimator.learned if estimator is not None else None
+
+        def _iso(value: datetime | None) -> str | None:
+            return value.isoformat() if value is not None else None
+
+        return {
+            "release_delay_static_s": self.RELEASE_DELAY.total_seconds(),
+            "release_delay_learned_s": (
+                learned.total_seconds() if learned is not None else None
+            ),
+            "release_delay_samples": len(estimator) if estimator is not None else 0,
+            "current_release": _iso(self.curr_release),
+            "release_published": _iso(self.release_published),
+            "publication_latency_s": (
+                self.publication_latency.total_seconds()
+                if self.publication_latency is not None
+                else None
+            ),
+            "last_decode_s": self.last_decode_seconds,
+            "retries_by_release": {
+                release.isoformat(): count
+                for release, count in sorted(self.retries_by_release.items())
+            },
+        }
+
+    def _record_publication_latency(self, release: datetime) -> None:
+        """Record how long after DWD published ``release`` its data arrived."""
+        published = self.release_published
+        if published is None and self._last_probe is not None:
+            probed_release, probe = self._last_probe
+            if probed_release == release:
+                published = probe.last_modified
+
+        self.publication_latency = (
+            dt_util.utcnow() - published if published is not None else None
+        )
+        if self.publication_latency is not None:
+            _LOGGER.debug(
+                "%s: %s release published %s, available %.0f s later",
+                self.PRODUCT_KEY,
+                release.isoformat(),
+                published.isoformat(),
+                self.publication_latency.total_seconds(),
+            )
@@ -0,0 +1,21 @@
+"""Diagnostics support for DWD Precipitation."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import MyConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: MyConfigEntry
+) -> dict[str, Any]:
+    """Return per-product release-timing diagnostics of a config entry."""
+    return {
+        "coordinators": {
+            key: coordinator.timing_diagnostics()
+            for key, coordinator in entry.runtime_data.coordinators.items()
+        }
+    }
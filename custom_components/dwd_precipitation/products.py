@@ -2,27 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import bz2
 import logging
-import tarfile
+import math
+import queue
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from functools import cached_property, lru_cache
-from io import BytesIO
-from typing import ClassVar
-
-import numpy as np
-
-from .coordinator import BaseProductUpdateCoordinator, ProductMetadata
-from .utils import async_get
-from .radar import (
-    read_radolan_composite,
-    get_radolan_grid,
-    read_odim_composite,
-    read_odim_classification,
-    get_rs_grid_index,
-    RS_GRID_SHAPE,
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
+
+from homeassistant.core import callback
+
+from .coordinator import (
+    BaseProductUpdateCoordinator,
+    CoordinatorData,
+    ProductMetadata,
 )
+from .utils import LatestReleaseCache, ReleaseCache, ValidatorCache, async_get
+from .radar.tar import MemoryReader, TarIndex
 from .radar.nowcast import (
     HOUR1_LEADS,
     HOUR2_LEADS,
@@ -33,6 +36,9 @@ from .radar.nowcast import (
     detect_start_end,
 )
 from .const import (
+    CONF_AREA_RADIUS,
+    DEFAULT_AREA_RADIUS,
+    CONF_ZONES,
     CONF_PRECIPITATION_THRESHOLD,
     DEFAULT_PRECIPITATION_THRESHOLD,
     CONF_PRECIPITATION_END_ALGORITHM,
@@ -42,16 +48,294 @@ from .const import (
     DWD_COMPOSITE_URL,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .radar.area import AreaQuery, AreaStats
+    from .radar.cube import ForecastCube
+    from .radar.odim import OdimDecoder
+    from .radar.zones import ZoneIndex
+
+# numpy, h5py and the radar parsers are imported on first use (see
+# radar/__init__.py), normally by the first decode in the executor, so loading
+# the integration does not import them.
+
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every config entry in the process: each (product, release) is
+# downloaded once no matter how many locations are configured.
+RELEASE_CACHE = ReleaseCache()
+
+# Full-grid RV forecast cube (~66 MB) of the newest release a consumer asked
+# for; built on demand only and shared by every entry.
+RV_CUBES = LatestReleaseCache()
+
+# HTTP validators (ETag / Last-Modified) of each product's latest download, so
+# a re-fetch of an unchanged file (retry, reload) is answered by a 304 instead
+# of the body.
+HTTP_VALIDATORS = ValidatorCache()
+
+# Decoding (bz2, tar, HDF5) is CPU-bound and blocking, so it runs in the loop's
+# default executor (Home Assistant's shared pool). At most this many decodes run
+# at once, so a burst of releases cannot starve that pool.
+MAX_CONCURRENT_DECODES = 2
+_DECODE_SLOTS: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    WeakKeyDictionary()
+)
+
+
+def _decode_semaphore() -> asyncio.Semaphore:
+    """Return the decode semaphore of the running loop."""
+    loop = asyncio.get_running_loop()
+    if (slots := _DECODE_SLOTS.get(loop)) is None:
+        slots = _DECODE_SLOTS[loop] = asyncio.Semaphore(MAX_CONCURRENT_DECODES)
+    return slots
+
+
+# Full-grid ODIM decodes read into the buffers of a decoder borrowed from this
+# pool, so the grid arrays are allocated once rather than on every release.
+# Decodes are bounded by the semaphore above, and so is the pool's size.
+_ODIM_DECODERS: queue.SimpleQueue[OdimDecoder] = queue.SimpleQueue()
+
+
+@contextmanager
+def _odim_decoder() -> Iterator[OdimDecoder]:
+    """Borrow an RS-grid decoder for the duration of one decode."""
+    from .radar import OdimDecoder
+
+    try:
+        decoder = _ODIM_DECODERS.get_nowait()
+    except queue.Empty:
+        decoder = OdimDecoder()
+    try:
+        yield decoder
+    finally:
+        _ODIM_DECODERS.put(decoder)
+
+
+# Per-member result of a batch extraction: the gathered cell values (aligned to
+# the extraction's cell list) plus the member's metadata, or None when the
+# member is missing from the archive.
+type MemberCells = tuple[np.ndarray, Any] | None
+
+
+def _gather(grid: np.ndarray, cells: list[tuple[int, int]]) -> np.ndarray:
+    """Return ``grid`` at every (row, col) in ``cells`` with one vectorised gather."""
+    import numpy as np
+
+    rows, cols = np.asarray(cells, dtype=np.intp).reshape(-1, 2).T
+
+    return grid[rows, cols]
+
+
+def _reduce_zones(
+    zones: ZoneIndex, member: MemberCells, cells: list[tuple[int, int]]
+) -> dict[str, float | None]:
+    """Reduce a member's gathered cell values over every zone of ``zones``.
+
+    RADOLAN readers fill nodata cells with the header's ``nodataflag`` rather
+    than NaN; those are left out like the ODIM products' NaN cells.
+    """
+    import numpy as np
+
+    if member is None:
+        return dict.fromkeys(zones.names)
+    values, attrs = member
+    flag = attrs.get("nodataflag") if isinstance(attrs, dict) else None
+    if flag is not None:
+        values = np.where(values == flag, np.nan, values)
+    return zones.reduce_cells(values, cells)
+
+
+def _timed_extract(
+    coordinator: BaseProductUpdateCoordinator,
+    content: bytes,
+    ts: datetime,
+    cells: list[tuple[int, int]],
+    areas: list[AreaQuery] = (),
+    zones: list[ZoneIndex] = (),
+) -> tuple[
+    tuple[list[MemberCells], list[AreaStats | None], list[dict[str, float | None]]],
+    float,
+]:
+    """Run the coordinator's extraction (executor side) and time it in seconds.
+
+    Zones are reduced over the first member (RS: the past hour) from the values
+    just gathered, as ``cells`` includes every zone's cells.
+    """
+    start = time.perf_counter()
+    members = coordinator._extract_cells(content, ts, cells)
+    stats = coordinator._extract_areas(content, ts, areas) if areas else []
+    zone_values = [_reduce_zones(z, members[0], cells) for z in zones]
+
+    return (members, stats, zone_values), time.perf_counter() - start
+
 
-@lru_cache(maxsize=1)
-def _radolan_wgs84_grid() -> np.ndarray:
-    """Return the cached 900×900 RADOLAN WGS84 lon/lat grid.
+@lru_cache(maxsize=8)
+def _zone_index(
+    geojson: str, position: Callable[[float, float], tuple[float, float]], shape
+) -> ZoneIndex:
+    """Rasterise the zones of ``geojson`` onto a grid (executor side).
 
-    Shared across all RADOLAN products, which use an identical grid.
+    Cached, so the products on the same grid (RW / SF) and every location
+    configured with the same zones share one index.
     """
-    return get_radolan_grid(wgs84=True)
+    from .radar import ZoneIndex, parse_zones
+
+    return ZoneIndex.build(parse_zones(geojson), position, shape)
+
+
+def _configured_zones(
+    coordinator: BaseProductUpdateCoordinator,
+    position: Callable[[float, float], tuple[float, float]],
+    shape: tuple[int, int],
+) -> ZoneIndex | None:
+    """Return the coordinator's zones on its grid, or None when none are set."""
+    geojson = coordinator.config_entry.options.get(CONF_ZONES, "")
+    if not geojson.strip():
+        return None
+
+    return _zone_index(geojson, position, tuple(shape))
+
+
+async def _async_extract_release(
+    coordinator: BaseProductUpdateCoordinator, ts: datetime
+) -> list[tuple[Any, Any] | None]:
+    """Return the coordinator's per-member (cell value, metadata) for release ``ts``.
+
+    The release is downloaded and decoded once for the cells of *every*
+    coordinator subscribed to the product (all configured locations), through
+    the shared release cache; each coordinator then picks its own cell out of
+    the gathered arrays. Coordinators with an ``area`` get its statistics from
+    the same pass, in ``coordinator.area_stats``, and those with ``zones`` the
+    zone means, in ``coordinator.zone_values``. The fetch stays on the event
+    loop; the decode runs in the executor.
+    """
+    url = coordinator._get_url(ts)
+    index = tuple(coordinator.index)
+    area = coordinator.area
+    zones = coordinator.zones
+
+    async def _fetch(
+        cells: list[tuple[int, int]],
+        areas: list[AreaQuery],
+        zone_sets: list[ZoneIndex],
+    ):
+        response = await async_get(
+            url,
+            coordinator.async_client,
+            validators=HTTP_VALIDATORS,
+            size_hint=coordinator.probed_length(ts),
+        )
+        async with _decode_semaphore():
+            (members, stats, zone_values), elapsed = (
+                await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    _timed_extract,
+                    coordinator,
+                    response.content,
+                    ts,
+                    cells,
+                    areas,
+                    zone_sets,
+                )
+            )
+        _LOGGER.debug(
+            "%s: decoded the %s release for %d cell(s) off the event loop in %.1f ms",
+            coordinator.PRODUCT_KEY,
+            ts.isoformat(),
+            len(cells),
+            elapsed * 1000,
+        )
+        return (
+            cells,
+            members,
+            dict(zip(areas, stats)),
+            dict(zip(zone_sets, zone_values)),
+            response.last_modified,
+            elapsed,
+        )
+
+    subscribers = RELEASE_CACHE.subscribers(coordinator.PRODUCT_KEY)
+    # Areas of every location, deduplicated (equal queries hash equal), and
+    # zone sets, shared by identity (one compiled index per GeoJSON and grid).
+    areas = list(
+        dict.fromkeys(
+            a for a in (*(sub.area for sub in subscribers), area) if a is not None
+        )
+    )
+    zone_sets = list(
+        dict.fromkeys(
+            z for z in (*(sub.zones for sub in subscribers), zones) if z is not None
+        )
+    )
+    cells = sorted(
+        {tuple(sub.index) for sub in subscribers}
+        | {index}
+        | {cell for z in zone_sets for cell in z.cells}
+    )
+    cells, members, area_stats, zone_values, published, elapsed = (
+        await RELEASE_CACHE.async_fetch(
+            coordinator.PRODUCT_KEY,
+            ts,
+            coordinator,
+            lambda: _fetch(cells, areas, zone_sets),
+        )
+    )
+    if (
+        index not in cells
+        or (area is not None and area not in area_stats)
+        or (zones is not None and zones not in zone_values)
+    ):
+        # Subscribed after this release was decoded for the other locations.
+        cells, members, area_stats, zone_values, published, elapsed = await _fetch(
+            sorted({index, *(() if zones is None else zones.cells)}),
+            [] if area is None else [area],
+            [] if zones is None else [zones],
+        )
+    coordinator.release_published = published
+    # The decode that produced this coordinator's values, shared or its own.
+    coordinator.last_decode_seconds = elapsed
+    coordinator.area_stats = None if area is None else area_stats[area]
+    coordinator.zone_values = None if zones is None else zone_values[zones]
+
+    pos = cells.index(index)
+
+    return [None if m is None else (m[0][pos], m[1]) for m in members]
+
+
+def _extract_odim_tar(
+    content: bytes, member_names: list[str], cells: list[tuple[int, int]]
+) -> list[MemberCells]:
+    """Point-read ``cells`` from each named ODIM_H5 tar member.
+
+    Only the requested cells are read and scaled (HDF5 point selection), so no
+    full-grid float array or masks are built per member. Members are read in
+    place from ``content`` through a tar index; nothing is copied out of it.
+    """
+    from .radar import RS_GRID_SHAPE, read_odim_cells
+
+    index = TarIndex(content)
+    members: list[MemberCells] = []
+
+    for member_name in member_names:
+        if member_name not in index:
+            _LOGGER.warning("Tar member not found: %s", member_name)
+            members.append(None)
+            continue
+
+        with index.open(member_name) as f:
+            _values, _what = read_odim_cells(f, cells, expected_shape=RS_GRID_SHAPE)
+        members.append((_values, _what))
+
+    return members
+
+
+def _read_cube(content: bytes, member_names: list[str]) -> ForecastCube:
+    """Decode every member of an RS-grid ODIM_H5 tar into a forecast cube."""
+    from .radar import read_odim_cube
+
+    return read_odim_cube(content, member_names)
 
 
 def _utc(dt: datetime | None) -> datetime | None:
@@ -92,58 +376,268 @@ class RadvorRS(BaseProductUpdateCoordinator):
     @cached_property
     def index(self) -> tuple[int, int]:
         """Return (row, col) in the RS composite grid."""
+        from .radar import get_rs_grid_index
+
         return get_rs_grid_index(*self.coords)
 
+    @cached_property
+    def area(self) -> AreaQuery | None:
+        """Return the area around the location, or None when it is disabled."""
+        from .radar import RS_GRID_SHAPE, AreaQuery
+        from .radar.odim import RS_WHERE
+
+        radius = self.config_entry.options.get(CONF_AREA_RADIUS, DEFAULT_AREA_RADIUS)
+        if not radius:
+            return None
+
+        return AreaQuery(
+            self.index,
+            float(radius),
+            RS_GRID_SHAPE,
+            xscale=RS_WHERE["xscale"],
+            yscale=RS_WHERE["yscale"],
+        )
+
+    @cached_property
+    def zones(self) -> ZoneIndex | None:
+        """Return the configured zones on the RS grid (reduced over lead 000)."""
+        from .radar import RS_GRID_SHAPE, rs_grid_position
+
+        return _configured_zones(self, rs_grid_position, RS_GRID_SHAPE)
+
+    def payload_settings(self) -> dict[str, Any]:
+        """Return the extraction settings, including the area radius (km)."""
+        settings = super().payload_settings()
+        if self.area is not None:
+            settings["area_radius"] = self.area.radius_km
+        return settings
+
+    def restore(self, release: datetime, data: CoordinatorData) -> bool:
+        """Adopt a persisted payload only if it matches the area setting.
+
+        A payload saved before the area radius was switched on (or off) lacks
+        (or carries) the area items, so it is refetched instead.
+        """
+        expected = 3 if self.area is None else 6
+        if isinstance(data.data, list) and len(data.data) != expected:
+            return False
+        return super().restore(release, data)
+
     def _get_url(self, ts: datetime) -> str:
         """Return the URL for the tar archive."""
         return (
             f"{DWD_COMPOSITE_URL}/rs/composite_rs_{ts.strftime('%Y%m%d_%H%M')}.tar"
         )
 
+    def _member_names(self, ts: datetime) -> list[str]:
+        """Return the tar member names of the three lead times."""
+        prefix = f"composite_rs_{ts.strftime('%Y%m%d_%H%M')}"
+        return [f"{prefix}_{suffix}-hd5" for suffix in ("000", "060", "120")]
+
+    def _extract_cells(
+        self, content: bytes, ts: datetime, cells: list[tuple[int, int]]
+    ) -> list[MemberCells]:
+        """Decode each lead-time member once and gather all requested cells."""
+        return _extract_odim_tar(content, self._member_names(ts), cells)
+
+    def _extract_areas(
+        self, content: bytes, ts: datetime, areas: list[AreaQuery]
+    ) -> list[AreaStats | None]:
+        """Reduce the past hour's total (lead 000) over each area.
+
+        The member is a single compressed chunk, so every read inflates it
+        whole: it is read once, as the bounding box of all areas, and each
+        area reduces its own window of that box.
+        """
+        from .radar import RS_GRID_SHAPE, AreaStats, read_odim_window
+
+        index = TarIndex(content)
+        member_name = self._member_names(ts)[0]
+        if member_name not in index:
+            return [None] * len(areas)
+
+        boxes = [area for area in areas if area.mask.size]
+        if boxes:
+            row0 = min(area.rows.start for area in boxes)
+            col0 = min(area.cols.start for area in boxes)
+            rows = slice(row0, max(area.rows.stop for area in boxes))
+            cols = slice(col0, max(area.cols.stop for area in boxes))
+            with index.open(member_name) as f:
+                window, _what = read_odim_window(
+                    f, rows, cols, expected_shape=RS_GRID_SHAPE
+                )
+
+        stats: list[AreaStats | None] = []
+        for area in areas:
+            if not area.mask.size:  # centred off the grid: nothing to reduce
+                stats.append(AreaStats(None, None, None, 0))
+                continue
+            stats.append(area.reduce(window[
+                area.rows.start - row0 : area.rows.stop - row0,
+                area.cols.start - col0 : area.cols.stop - col0,
+            ]))
+
+        return stats
+
     async def _fetch_and_parse(self, ts: datetime) -> tuple[list, list]:
-        """Fetch one tar archive and extract 3 lead-time ACRR values."""
-        response = await async_get(self._get_url(ts), self.async_client)
+        """Fetch one tar archive and extract 3 lead-time ACRR values.
+
+        With an area configured, the past hour's area maximum, mean (mm) and
+        coverage (%) follow as items 3-5, sharing lead 000's metadata.
+        """
+        members = await _async_extract_release(self, ts)
 
-        tar_bytes = BytesIO(response.content)
-        prefix = f"composite_rs_{ts.strftime('%Y%m%d_%H%M')}"
-        row, col = self.index
         data: list = []
         metadata: list = []
 
-        with tarfile.open(fileobj=tar_bytes, mode="r") as tf:
-            for suffix in ("000", "060", "120"):
-                member_name = f"{prefix}_{suffix}-hd5"
-                try:
-                    f = tf.extractfile(member_name)
-                except KeyError:
-                    f = None
-                if f is None:
-                    _LOGGER.warning("RS tar member not found: %s", member_name)
-                    data.append(None)
-                    metadata.append(None)
-                    continue
-
-                _data, _what = read_odim_composite(
-                    BytesIO(f.read()), expected_shape=RS_GRID_SHAPE
-                )
-                val = float(_data[row, col])
-                data.append(None if np.isnan(val) else val)
-
-                lead = int(suffix)
-                data_start = _parse_odim_ts(_what.get("startdate"), _what.get("starttime"))
-                data_end = _parse_odim_ts(_what.get("enddate"), _what.get("endtime"))
-                source_ts = data_end - timedelta(minutes=lead) if data_end else None
-                metadata.append(ProductMetadata(
-                    source_product=_what.get("prodname") or _what.get("product"),
-                    source_timestamp=source_ts,
-                    lead_time_minutes=lead,
-                    data_start=data_start,
-                    data_end=data_end,
-                ))
+        for suffix, member in zip(("000", "060", "120"), members):
+            if member is None:
+                data.append(None)
+                metadata.append(None)
+                continue
+
+            _value, _what = member
+            val = float(_value)
+            data.append(None if math.isnan(val) else val)
+
+            lead = int(suffix)
+            data_start = _parse_odim_ts(_what.get("startdate"), _what.get("starttime"))
+            data_end = _parse_odim_ts(_what.get("enddate"), _what.get("endtime"))
+            source_ts = data_end - timedelta(minutes=lead) if data_end else None
+            metadata.append(ProductMetadata(
+                source_product=_what.get("prodname") or _what.get("product"),
+                source_timestamp=source_ts,
+                lead_time_minutes=lead,
+                data_start=data_start,
+                data_end=data_end,
+            ))
+
+        if self.area is not None:
+            stats = self.area_stats
+            coverage = None if stats is None else stats.coverage
+            data += [
+                None if stats is None else stats.maximum,
+                None if stats is None else stats.mean,
+                None if coverage is None else round(coverage * 100, 1),
+            ]
+            metadata += [metadata[0]] * 3
 
         return data, metadata
 
 
+# Window-bound sentinel of RvSeries (member missing / time unparseable):
+# the int32 minimum.
+_NO_TIME = -(2**31)
+
+
+@dataclass(frozen=True, eq=False)
+class RvSeries:
+    """The 5-minute RV forecast series of one release at one location.
+
+    Array-backed and aligned to LEADS: ``values`` holds the 5-minute
+    accumulations (mm, float32; NaN = nodata or missing member), ``starts`` /
+    ``ends`` the window bounds as int32 seconds relative to ``release``
+    (``_NO_TIME`` = unknown). The derived RV values are recomputed from it for
+    any threshold or end algorithm without touching the network.
+    """
+
+    release: datetime
+    values: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def from_members(cls, release: datetime, members: list[MemberCells]) -> RvSeries:
+        """Build the series from the per-lead extraction results (cell 0)."""
+        import numpy as np
+
+        n = len(LEADS)
+        values = np.full(n, np.nan, dtype=np.float32)
+        starts = np.full(n, _NO_TIME, dtype=np.int32)
+        ends = np.full(n, _NO_TIME, dtype=np.int32)
+
+        def _offset(date: str | None, time_: str | None) -> int:
+            parsed = _parse_odim_ts(date, time_)
+            if parsed is None:
+                return _NO_TIME
+            return int((parsed - release).total_seconds())
+
+        for i, member in enumerate(members[:n]):
+            if member is None:
+                continue
+            value, what = member
+            values[i] = float(value)
+            starts[i] = _offset(what.get("startdate"), what.get("starttime"))
+            ends[i] = _offset(what.get("enddate"), what.get("endtime"))
+        return cls(release, values, starts, ends)
+
+    @classmethod
+    def from_samples(cls, release: datetime, samples: list[dict]) -> RvSeries:
+        """Rebuild the series from the persisted ``samples`` of a derived payload."""
+        import numpy as np
+
+        n = len(LEADS)
+        values = np.full(n, np.nan, dtype=np.float32)
+        starts = np.full(n, _NO_TIME, dtype=np.int32)
+        ends = np.full(n, _NO_TIME, dtype=np.int32)
+
+        def _offset(iso: str | None) -> int:
+            if not iso:
+                return _NO_TIME
+            return int((datetime.fromisoformat(iso) - release).total_seconds())
+
+        for sample in samples:
+            i = sample["lead"] // LEAD_STEP
+            if not 0 <= i < n:
+                continue
+            if sample.get("value") is not None:
+                values[i] = float(sample["value"])
+            starts[i] = _offset(sample.get("start"))
+            ends[i] = _offset(sample.get("end"))
+        return cls(release, values, starts, ends)
+
+    def _time(self, offsets: np.ndarray, i: int) -> datetime | None:
+        offset = int(offsets[i])
+        if offset == _NO_TIME:
+            return None
+        return self.release + timedelta(seconds=offset)
+
+    def start(self, i: int) -> datetime | None:
+        """Return the window start of lead index ``i`` (UTC), if known."""
+        return self._time(self.starts, i)
+
+    def end(self, i: int) -> datetime | None:
+        """Return the window end of lead index ``i`` (UTC), if known."""
+        return self._time(self.ends, i)
+
+    @property
+    def base_ts(self) -> datetime | None:
+        """Return the base run time T (end of the lead-0 analysis window)."""
+        return self.end(0)
+
+    def value_list(self) -> list[float | None]:
+        """Return the accumulations as the plain list the nowcast helpers take."""
+        return [None if math.isnan(v) else float(v) for v in self.values]
+
+    def max_intensity(self, leads: list[int]) -> float | None:
+        """Return the peak intensity (mm/h) over the given lead minutes."""
+        return bucket_max_intensity(self.value_list(), leads)
+
+    def start_end(
+        self,
+        threshold_mmh: float = DEFAULT_PRECIPITATION_THRESHOLD,
+        end_algorithm: str = DEFAULT_PRECIPITATION_END_ALGORITHM,
+    ) -> tuple[int | None, int | None]:
+        """Return ``(start_in, end_in)`` minutes for an intensity threshold (mm/h).
+
+        The detection works on 5-minute accumulations, so the threshold is
+        converted back to mm/5min.
+        """
+        return detect_start_end(
+            self.value_list(), threshold_mmh / STEPS_PER_HOUR, end_algorithm
+        )
+
+
 class RadvorRV(BaseProductUpdateCoordinator):
     """DWD RV precipitation nowcast (RADVOR, ODIM_H5 format).
 
@@ -172,9 +666,14 @@ class RadvorRV(BaseProductUpdateCoordinator):
 
     RELEASE_OFFSET = timedelta()
 
+    # 5-minute series of the current release; None until the first fetch.
+    series: RvSeries | None = None
+
     @cached_property
     def index(self) -> tuple[int, int]:
         """Return (row, col) in the RV composite grid (identical to RS)."""
+        from .radar import get_rs_grid_index
+
         return get_rs_grid_index(*self.coords)
 
     def _get_url(self, ts: datetime) -> str:
@@ -183,58 +682,98 @@ class RadvorRV(BaseProductUpdateCoordinator):
             f"{DWD_COMPOSITE_URL}/rv/composite_rv_{ts.strftime('%Y%m%d_%H%M')}.tar"
         )
 
+    def _member_names(self, ts: datetime) -> list[str]:
+        """Return the tar member names of all 25 lead times."""
+        prefix = f"composite_rv_{ts.strftime('%Y%m%d_%H%M')}"
+        return [f"{prefix}_{lead:03d}-hd5" for lead in LEADS]
+
+    def _extract_cells(
+        self, content: bytes, ts: datetime, cells: list[tuple[int, int]]
+    ) -> list[MemberCells]:
+        """Decode each of the 25 lead members once and gather all requested cells."""
+        return _extract_odim_tar(content, self._member_names(ts), cells)
+
     async def _fetch_and_parse(self, ts: datetime) -> tuple[dict, dict]:
         """Fetch one tar archive and derive the RV entity payloads."""
-        response = await async_get(self._get_url(ts), self.async_client)
-
-        tar_bytes = BytesIO(response.content)
-        prefix = f"composite_rv_{ts.strftime('%Y%m%d_%H%M')}"
-        row, col = self.index
-
-        # Per-lead 5-minute cell values (mm) and window bounds, aligned to LEADS.
-        values: list[float | None] = []
-        starts: list[datetime | None] = []
-        ends: list[datetime | None] = []
-        base_ts: datetime | None = None
-
-        with tarfile.open(fileobj=tar_bytes, mode="r") as tf:
-            for lead in LEADS:
-                member_name = f"{prefix}_{lead:03d}-hd5"
-                try:
-                    f = tf.extractfile(member_name)
-                except KeyError:
-                    f = None
-                if f is None:
-                    _LOGGER.warning("RV tar member not found: %s", member_name)
-                    values.append(None)
-                    starts.append(None)
-                    ends.append(None)
-                    continue
-
-                _data, _what = read_odim_composite(
-                    BytesIO(f.read()), expected_shape=RS_GRID_SHAPE
+        members = await _async_extract_release(self, ts)
+        # Kept so option changes can re-derive the payload without a download.
+        self.series = RvSeries.from_members(ts, members)
+        return self.derive()
+
+    async def async_get_cube(self, ts: datetime | None = None) -> ForecastCube:
+        """Return the full-grid forecast cube of release ``ts`` (default: current).
+
+        Opt-in for consumers that need the whole nowcast rather than this
+        location's cell. The archive is requested conditionally, so the body
+        cached by the cell fetch is normally reused; each release is decoded
+        once and the newest cube is shared by every caller (see ``RV_CUBES``).
+        """
+        if ts is None:
+            ts = self.curr_release
+        if ts is None:
+            raise RuntimeError("No RV release has been fetched yet")
+
+        async def _build() -> ForecastCube:
+            response = await async_get(
+                self._get_url(ts),
+                self.async_client,
+                validators=HTTP_VALIDATORS,
+                size_hint=self.probed_length(ts),
+            )
+            async with _decode_semaphore():
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, _read_cube, response.content, self._member_names(ts)
                 )
-                val = float(_data[row, col])
-                values.append(None if np.isnan(val) else val)
-
-                data_start = _parse_odim_ts(_what.get("startdate"), _what.get("starttime"))
-                data_end = _parse_odim_ts(_what.get("enddate"), _what.get("endtime"))
-                starts.append(data_start)
-                ends.append(data_end)
-                # Base run time T = end of the analysis window (lead 0).
-                if lead == 0 and data_end is not None:
-                    base_ts = data_end
-
-        # The user configures the threshold as an intensity (mm/h); the
-        # detection works on 5-minute accumulations, so convert back to mm/5min.
-        threshold_mmh = self.config_entry.options.get(
-            CONF_PRECIPITATION_THRESHOLD, DEFAULT_PRECIPITATION_THRESHOLD
-        )
-        threshold = threshold_mmh / STEPS_PER_HOUR
-        end_algorithm = self.config_entry.options.get(
-            CONF_PRECIPITATION_END_ALGORITHM, DEFAULT_PRECIPITATION_END_ALGORITHM
-        )
-        start_in, end_in = detect_start_end(values, threshold, end_algorithm)
+
+        return await RV_CUBES.async_get(ts, _build)
+
+    def restore(self, release: datetime, data: CoordinatorData) -> bool:
+        """Adopt a persisted payload and rebuild its series from the samples.
+
+        Option changes re-derive the payload from ``series``, so the 5-minute
+        series persisted on the rain flag is turned back into one.
+        """
+        if not super().restore(release, data):
+            return False
+        metadata = data.metadata if isinstance(data.metadata, dict) else {}
+        samples = getattr(metadata.get("rain_within_2h"), "samples", None)
+        self.series = RvSeries.from_samples(release, samples) if samples else None
+        return True
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Re-derive the current payload from the cached series, then re-render."""
+        if self.series is not None and self.data is not None:
+            self.data = CoordinatorData(*self.derive())
+        super().async_apply_options()
+
+    def derive(
+        self,
+        threshold: float | None = None,
+        end_algorithm: str | None = None,
+    ) -> tuple[dict, dict]:
+        """Derive the RV entity payloads from the cached series.
+
+        ``threshold`` (mm/h) and ``end_algorithm`` default to the entry
+        options; pass them to preview other settings. Requires a fetched
+        release (``series`` is set).
+        """
+        series = self.series
+        if series is None:
+            raise RuntimeError("No RV release has been fetched yet")
+
+        if threshold is None:
+            threshold = self.config_entry.options.get(
+                CONF_PRECIPITATION_THRESHOLD, DEFAULT_PRECIPITATION_THRESHOLD
+            )
+        if end_algorithm is None:
+            end_algorithm = self.config_entry.options.get(
+                CONF_PRECIPITATION_END_ALGORITHM, DEFAULT_PRECIPITATION_END_ALGORITHM
+            )
+        start_in, end_in = series.start_end(threshold, end_algorithm)
+
+        values = series.value_list()
+        base_ts = series.base_ts
 
         def _at(minutes: int | None) -> datetime | None:
             if minutes is None or base_ts is None:
@@ -246,10 +785,11 @@ class RadvorRV(BaseProductUpdateCoordinator):
             for lead in leads:
                 i = lead // LEAD_STEP
                 value = values[i]
+                start, end = series.start(i), series.end(i)
                 out.append({
                     "lead": lead,
-                    "start": starts[i].isoformat() if starts[i] else None,
-                    "end": ends[i].isoformat() if ends[i] else None,
+                    "start": start.isoformat() if start else None,
+                    "end": end.isoformat() if end else None,
                     "value": value,
                     # 5-minute accumulation extrapolated to an hourly rate.
                     "intensity": (
@@ -265,8 +805,8 @@ class RadvorRV(BaseProductUpdateCoordinator):
                 source_product="RV",
                 source_timestamp=base_ts,
                 lead_time_minutes=lead_minutes,
-                data_start=starts[leads[0] // LEAD_STEP],
-                data_end=ends[leads[-1] // LEAD_STEP],
+                data_start=series.start(leads[0] // LEAD_STEP),
+                data_end=series.end(leads[-1] // LEAD_STEP),
             )
 
         timing_meta = ProductMetadata(source_product="RV", source_timestamp=base_ts)
@@ -277,8 +817,8 @@ class RadvorRV(BaseProductUpdateCoordinator):
         rain_meta = ProductMetadata(
             source_product="RV",
             source_timestamp=base_ts,
-            data_start=starts[0],
-            data_end=ends[-1],
+            data_start=series.start(0),
+            data_end=series.end(len(LEADS) - 1),
             samples=_samples(LEADS),
         )
 
@@ -328,6 +868,8 @@ class HymecNG(BaseProductUpdateCoordinator):
     @cached_property
     def index(self) -> tuple[int, int]:
         """Return (row, col) in the HymecNG grid (identical to RS/RV)."""
+        from .radar import get_rs_grid_index
+
         return get_rs_grid_index(*self.coords)
 
     def _get_url(self, ts: datetime) -> str:
@@ -337,15 +879,22 @@ class HymecNG(BaseProductUpdateCoordinator):
             f"composite_HymecNG_{ts.strftime('%Y%m%d_%H%M')}_000-hd5"
         )
 
+    def _extract_cells(
+        self, content: bytes, ts: datetime, cells: list[tuple[int, int]]
+    ) -> list[MemberCells]:
+        """Decode the classification grid once and gather all requested cells."""
+        with _odim_decoder() as decoder:
+            raw, dataset_what, moment_what = decoder.read_raw(MemoryReader(content))
+            values = _gather(raw, cells)
+
+        return [(values, (dataset_what, moment_what))]
+
     async def _fetch_and_parse(self, ts: datetime) -> tuple[str | None, ProductMetadata]:
         """Fetch one ODIM_H5 file and return the cell's precipitation-type label."""
-        response = await async_get(self._get_url(ts), self.async_client)
-
-        raw, dataset_what, moment_what = read_odim_classification(
-            BytesIO(response.content), expected_shape=RS_GRID_SHAPE
+        [(raw_value, (dataset_what, moment_what))] = await _async_extract_release(
+            self, ts
         )
-        row, col = self.index
-        value = int(raw[row, col])
+        value = int(raw_value)
 
         nodata = int(round(float(moment_what.get("nodata", 255))))
         undetect = int(round(float(moment_what.get("undetect", 254))))
@@ -388,34 +937,47 @@ class RadolanProduct(BaseProductUpdateCoordinator, ABC):
 
     @cached_property
     def index(self) -> tuple[int, int]:
-        """Return the nearest-cell (row, col) in the RADOLAN 900×900 WGS84 grid."""
-        lat, lon = self.coords
-        grid = _radolan_wgs84_grid()
-        dist_sq = (grid[:, :, 1] - lat) ** 2 + (grid[:, :, 0] - lon) ** 2
+        """Return the nearest-cell (row, col) in the RADOLAN 900×900 grid."""
+        from .radar import get_radolan_grid_index
+
+        return get_radolan_grid_index(*self.coords, *self.EXPECTED_SHAPE)
+
+    @cached_property
+    def zones(self) -> ZoneIndex | None:
+        """Return the configured zones on the RADOLAN 900×900 grid."""
+        from .radar import get_radolan_grid_position
 
-        return np.unravel_index(np.argmin(dist_sq), dist_sq.shape)
+        return _configured_zones(self, get_radolan_grid_position, self.EXPECTED_SHAPE)
 
     @abstractmethod
     def _get_url(self, ts: datetime) -> str:
         """Return the bz2 file URL for the given release timestamp."""
 
+    def _extract_cells(
+        self, content: bytes, ts: datetime, cells: list[tuple[int, int]]
+    ) -> list[MemberCells]:
+        """Decode only the requested cells of the bz2 composite.
+
+        The payload is stored row by row, so decompression stops behind the
+        last requested row and just those cells are decoded.
+        """
+        from .radar import read_radolan_cells
+
+        values, raw = read_radolan_cells(
+            bz2.open(MemoryReader(content)), cells, expected_shape=self.EXPECTED_SHAPE
+        )
+
+        return [(values, raw)]
+
     async def _fetch_and_parse(self, ts: datetime) -> tuple[float, ProductMetadata]:
         """Fetch one bz2 RADOLAN file and return (scalar_value, ProductMetadata)."""
-        response = await async_get(self._get_url(ts), self.async_client)
-        f = bz2.open(BytesIO(response.content))
-        data, raw = read_radolan_composite(f)
-
-        if data.shape != self.EXPECTED_SHAPE:
-            raise ValueError(
-                f"Unexpected RADOLAN grid shape {data.shape}, "
-                f"expected {self.EXPECTED_SHAPE}"
-            )
+        [(value, raw)] = await _async_extract_release(self, ts)
 
         dt_end = _utc(raw.get("datetime"))
         interval = raw.get("intervalseconds")
         data_start = dt_end - timedelta(seconds=interval) if (dt_end and interval) else None
 
-        return float(data[self.index]), ProductMetadata(
+        return float(value), ProductMetadata(
             source_product=raw.get("producttype"),
             source_timestamp=dt_end,
             data_start=data_start,
@@ -1,11 +1,74 @@
-"""Wradlib components to parse dwd radar data."""
-
-from .radolan import read_radolan_composite
-from .georef import get_radolan_grid
-from .odim import (
-    read_odim_composite,
-    read_odim_classification,
-    get_rs_grid_index,
-    rs_grid_contains,
-    RS_GRID_SHAPE,
-)
\ No newline at end of file
+"""Wradlib components to parse dwd radar data.
+
+The parser modules pull in numpy and h5py, so they are imported lazily on
+first attribute access (PEP 562) rather than with the package. Importing
+``radar.nowcast`` or the integration therefore stays cheap; the first decode,
+which runs in the executor, pays for the parser import.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .area import AreaQuery, AreaStats, disk_offsets
+    from .cube import ForecastCube, read_odim_cube
+    from .georef import (
+        get_radolan_grid,
+        get_radolan_grid_index,
+        get_radolan_grid_position,
+    )
+    from .odim import (
+        RS_GRID_SHAPE,
+        OdimDecoder,
+        get_rs_grid_index,
+        read_odim_cells,
+        read_odim_classification,
+        read_odim_composite,
+        read_odim_window,
+        rs_grid_contains,
+        rs_grid_position,
+    )
+    from .radolan import read_radolan_cells, read_radolan_composite
+    from .zones import ZoneIndex, parse_zones
+
+# Public name -> submodule that defines it.
+_LAZY = {
+    "read_radolan_composite": "radolan",
+    "read_radolan_cells": "radolan",
+    "get_radolan_grid": "georef",
+    "get_radolan_grid_index": "georef",
+    "get_radolan_grid_position": "georef",
+    "read_odim_composite": "odim",
+    "read_odim_cells": "odim",
+    "read_odim_window": "odim",
+    "read_odim_classification": "odim",
+    "get_rs_grid_index": "odim",
+    "rs_grid_contains": "odim",
+    "rs_grid_position": "odim",
+    "RS_GRID_SHAPE": "odim",
+    "OdimDecoder": "odim",
+    "ForecastCube": "cube",
+    "read_odim_cube": "cube",
+    "AreaQuery": "area",
+    "AreaStats": "area",
+    "disk_offsets": "area",
+    "ZoneIndex": "zones",
+    "parse_zones": "zones",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining parser module on first access of a public name."""
+    if (module := _LAZY.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
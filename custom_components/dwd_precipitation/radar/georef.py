@@ -15,6 +15,7 @@ __all__ = [
     "get_radolan_coords",
     "get_radolan_coordinates",
     "get_radolan_grid",
+    "get_radolan_grid_index",
 ]
 __doc__ = __doc__.format("\n   ".join(__all__))
 __doctest_requires__ = {"get_radolan_grid": ["osgeo"]}
@@ -398,6 +399,39 @@ def get_radolan_grid(nrows=None, ncols=None, **kwargs):
 
 
 
+def get_radolan_grid_index(lat, lon, nrows=None, ncols=None):
+    """Return (row, col) of the RADOLAN grid point nearest to (lat, lon).
+
+    Closed-form forward projection with the trigonometric formulas of
+    :func:`get_radolan_coords`, so no lon/lat grid has to be built. Grid points
+    are the lower-left pixel corners (``mode='radolan'``) and row 0 is the
+    southernmost row, matching :func:`get_radolan_grid`. Points outside the
+    composite are clamped to its edge, as the nearest grid point is.
+    """
+    x_arr, y_arr = get_radolan_coordinates(nrows=nrows, ncols=ncols, crs="trig")
+    res = x_arr[1] - x_arr[0]
+    x, y = get_radolan_coords(lon, lat, crs="trig")
+
+    row = min(max(int(round((y - y_arr[0]) / res)), 0), len(y_arr) - 1)
+    col = min(max(int(round((x - x_arr[0]) / res)), 0), len(x_arr) - 1)
+    return row, col
+
+
+def get_radolan_grid_position(lat, lon, nrows=None, ncols=None):
+    """Return the fractional (row, col) of (lat, lon) in the RADOLAN grid.
+
+    Whole numbers are pixel centres, half a pixel above and right of the grid
+    points (lower-left corners), so :func:`get_radolan_grid_index` is this
+    position plus one half, rounded; used to place polygon vertices between
+    pixel centres.
+    """
+    x_arr, y_arr = get_radolan_coordinates(nrows=nrows, ncols=ncols, crs="trig")
+    res = x_arr[1] - x_arr[0]
+    x, y = get_radolan_coords(lon, lat, crs="trig")
+
+    return float((y - y_arr[0]) / res - 0.5), float((x - x_arr[0]) / res - 0.5)
+
+
 def grid_to_polyvert(grid, *, ravel=False):
     """Get polygonal vertices from rectangular grid coordinates.
 
@@ -1,6 +1,7 @@
 """ODIM_H5 reader for DWD RS Cartesian precipitation composites."""
 
 from datetime import datetime, timezone
+from functools import lru_cache
 import re
 import math
 
@@ -125,11 +126,121 @@ def _require_plain_dataset(dset, expected_shape=None):
     return dset
 
 
+def _open_payload(hf, dataset: str, moment: str, expected_shape=None):
+    """Return ``(dataset_what, moment_what, dset)`` for a safely resolved payload.
+
+    Every path is walked hard-link-only and the payload must be a plain in-file
+    dataset (see :func:`_resolve_hard` / :func:`_require_plain_dataset`).
+    """
+    dataset_what = {
+        k: _normalise_attr_value(v)
+        for k, v in _resolve_hard(hf, f"{dataset}/what").attrs.items()
+    }
+    moment_what = {
+        k: _normalise_attr_value(v)
+        for k, v in _resolve_hard(hf, f"{dataset}/{moment}/what").attrs.items()
+    }
+    dset = _require_plain_dataset(
+        _resolve_hard(hf, f"{dataset}/{moment}/data"), expected_shape
+    )
+    return dataset_what, moment_what, dset
+
+
+# Integer payloads of at most this many bits (DWD: uint8/uint16) are scaled
+# through a lookup table of every raw code instead of arithmetic + masks.
+_LUT_MAX_BITS = 16
+
+
+@lru_cache(maxsize=8)
+def _scale_lut(dtype: str, gain: float, offset: float, nodata: int, undetect: int):
+    """Return the (read-only) float32 value of every raw code of ``dtype``.
+
+    The same mapping as the arithmetic path of :func:`_scale` — gain/offset,
+    nodata → NaN, undetect → 0.0 — baked into a 256/65536-entry table.
+    """
+    dtype = np.dtype(dtype)
+    codes = np.arange(1 << (8 * dtype.itemsize), dtype=f"u{dtype.itemsize}")
+    codes = codes.view(dtype)
+
+    lut = codes.astype(np.float32) * gain + offset
+    lut[codes == nodata]   = np.nan
+    lut[codes == undetect] = 0.0
+    lut.flags.writeable = False
+
+    return lut
+
+
+def _scale(raw, what, out=None):
+    """Apply gain/offset to raw counts; nodata → NaN, undetect → 0.0 (float32).
+
+    Grids of 8/16-bit integers are decoded with one gather through a lookup
+    table (:func:`_scale_lut`); anything else, and arrays smaller than the
+    table (point reads), take the arithmetic path. ``out``, a float32 array of
+    ``raw``'s shape, receives the result and can be reused across members.
+    """
+    gain     = float(what["gain"])
+    offset   = float(what["offset"])
+    nodata   = int(what["nodata"])
+    undetect = int(round(float(what.get("undetect", 0))))
+
+    itemsize = raw.dtype.itemsize
+    if (
+        raw.dtype.kind in "ui"
+        and 8 * itemsize <= _LUT_MAX_BITS
+        and raw.size > 1 << (8 * itemsize)
+    ):
+        lut = _scale_lut(raw.dtype.str, gain, offset, nodata, undetect)
+        # Every code is a valid index, so "clip" never clips; unlike the
+        # default mode it lets take() write into ``out`` unbuffered.
+        return np.take(lut, raw.view(f"u{itemsize}"), out=out, mode="clip")
+
+    if out is None:
+        data = raw.astype(np.float32)
+    else:
+        data = out
+        np.copyto(data, raw, casting="unsafe")
+    data *= gain
+    data += offset
+    data[raw == nodata]   = np.nan
+    data[raw == undetect] = 0.0
+
+    return data
+
+
+def _read_points(dset, cells):
+    """Read only the (row, col) ``cells`` of a 2-D dataset in one HDF5 call.
+
+    Uses an element (point) selection on the file dataspace, so the library
+    touches just the chunks holding the requested cells and the result is a
+    1-D array of ``len(cells)`` raw values — no full-grid array is allocated.
+    """
+    points = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    rows, cols = dset.shape
+    if points.size and (
+        points.min() < 0
+        or points[:, 0].max() >= rows
+        or points[:, 1].max() >= cols
+    ):
+        raise ValueError(f"Cell index outside the {dset.shape} composite grid")
+
+    out = np.empty(len(points), dtype=dset.dtype)
+    if not len(points):
+        return out
+
+    fspace = dset.id.get_space()
+    fspace.select_elements(points.astype(np.uint64))
+    mspace = h5py.h5s.create_simple((len(points),))
+    dset.id.read(mspace, fspace, out)
+
+    return out
+
+
 def read_odim_composite(
     fileobj,
     dataset: str = "dataset1",
     moment: str = "data1",
     expected_shape=None,
+    out=None,
 ):
     """Read a Cartesian ODIM_H5 composite.
 
@@ -142,31 +253,62 @@ def read_odim_composite(
     and the payload dataset must be a plain in-file array (no virtual/external
     storage). Pass ``expected_shape`` (rows, cols) to also pin the grid size,
     which bounds the array allocation.
+
+    ``out`` (float32, grid-shaped) receives the scaled grid instead of a new
+    array, so a caller decoding many members can reuse one buffer.
     """
     with h5py.File(fileobj, "r") as hf:
-        dataset_what = {
-            k: _normalise_attr_value(v)
-            for k, v in _resolve_hard(hf, f"{dataset}/what").attrs.items()
-        }
-        what = {
-            k: _normalise_attr_value(v)
-            for k, v in _resolve_hard(hf, f"{dataset}/{moment}/what").attrs.items()
-        }
-        dset = _require_plain_dataset(
-            _resolve_hard(hf, f"{dataset}/{moment}/data"), expected_shape
-        )
+        dataset_what, what, dset = _open_payload(hf, dataset, moment, expected_shape)
         raw = dset[:]
 
-    gain     = float(what["gain"])
-    offset   = float(what["offset"])
-    nodata   = int(what["nodata"])
-    undetect = int(round(float(what.get("undetect", 0))))
+    return _scale(raw, what, out), dataset_what
 
-    data = raw.astype(np.float32) * gain + offset
-    data[raw == nodata]   = np.nan
-    data[raw == undetect] = 0.0
 
-    return data, dataset_what
+def read_odim_cells(
+    fileobj,
+    cells,
+    dataset: str = "dataset1",
+    moment: str = "data1",
+    expected_shape=None,
+):
+    """Read only the given (row, col) cells of a Cartesian ODIM_H5 composite.
+
+    The point-read counterpart of :func:`read_odim_composite` for callers that
+    need a handful of cells rather than the grid: only the requested elements
+    are read (HDF5 point selection) and scaled. Returns ``(values,
+    dataset_what)`` where ``values`` is a float32 array aligned to ``cells``,
+    with the same nodata → NaN / undetect → 0.0 handling and the same
+    untrusted-file checks. A cell outside the grid raises ``ValueError``.
+    """
+    with h5py.File(fileobj, "r") as hf:
+        dataset_what, what, dset = _open_payload(hf, dataset, moment, expected_shape)
+        raw = _read_points(dset, cells)
+
+    return _scale(raw, what), dataset_what
+
+
+def read_odim_window(
+    fileobj,
+    rows: slice,
+    cols: slice,
+    dataset: str = "dataset1",
+    moment: str = "data1",
+    expected_shape=None,
+    out=None,
+):
+    """Read a rectangular window of a Cartesian ODIM_H5 composite.
+
+    ``rows`` / ``cols`` are slices into the grid (clipped to it, as with NumPy);
+    only that hyperslab is scaled, but HDF5 inflates every chunk it touches —
+    for DWD's single-chunk composites the whole grid. Returns ``(data, dataset_what)``
+    like :func:`read_odim_composite`, with the same untrusted-file checks;
+    ``out`` (float32, window-shaped) receives the scaled window.
+    """
+    with h5py.File(fileobj, "r") as hf:
+        dataset_what, what, dset = _open_payload(hf, dataset, moment, expected_shape)
+        raw = dset[rows, cols]
+
+    return _scale(raw, what, out), dataset_what
 
 
 def read_odim_classification(
@@ -191,28 +333,88 @@ def read_odim_classification(
     plain-dataset, shape-pinned checks as :func:`read_odim_composite`.
     """
     with h5py.File(fileobj, "r") as hf:
-        dataset_what = {
-            k: _normalise_attr_value(v)
-            for k, v in _resolve_hard(hf, f"{dataset}/what").attrs.items()
-        }
-        moment_what = {
-            k: _normalise_attr_value(v)
-            for k, v in _resolve_hard(hf, f"{dataset}/{moment}/what").attrs.items()
-        }
-        dset = _require_plain_dataset(
-            _resolve_hard(hf, f"{dataset}/{moment}/data"), expected_shape
+        dataset_what, moment_what, dset = _open_payload(
+            hf, dataset, moment, expected_shape
         )
         raw = dset[:]
 
     return raw, dataset_what, moment_what
 
 
+class OdimDecoder:
+    """Decode full-grid ODIM_H5 members into buffers reused across members.
+
+    The module-level readers allocate a fresh raw array (and a float32 copy)
+    per call. A decoder owns one raw buffer per payload dtype and one float32
+    buffer, all of ``shape``, and reads each member straight into them with
+    ``Dataset.read_direct``, so decoding a whole release costs no allocation
+    after the first member. The shape is pinned: a member of any other shape
+    is rejected, like ``expected_shape`` on the readers.
+
+    The returned arrays *are* the buffers and are overwritten by the next read;
+    copy what must outlive it. A decoder is not thread-safe — use one per
+    concurrent decode.
+    """
+
+    def __init__(self, shape=RS_GRID_SHAPE):
+        """Create a decoder for grids of ``shape`` (rows, cols)."""
+        self.shape = tuple(shape)
+        self._raw: dict[np.dtype, np.ndarray] = {}
+        self._scaled: np.ndarray | None = None
+
+    def _raw_buffer(self, dtype) -> np.ndarray:
+        """Return the raw buffer for ``dtype``, allocating it on first use."""
+        if (buf := self._raw.get(dtype)) is None:
+            buf = self._raw[dtype] = np.empty(self.shape, dtype=dtype)
+        return buf
+
+    def read_raw(
+        self, fileobj, dataset: str = "dataset1", moment: str = "data1", out=None
+    ):
+        """Read a member's unscaled payload.
+
+        Returns ``(raw, dataset_what, moment_what)`` like
+        :func:`read_odim_classification`, with ``raw`` the decoder's buffer for
+        the payload dtype, or ``out`` (grid-shaped, C-contiguous) when given.
+        """
+        with h5py.File(fileobj, "r") as hf:
+            dataset_what, moment_what, dset = _open_payload(
+                hf, dataset, moment, self.shape
+            )
+            raw = self._raw_buffer(dset.dtype) if out is None else out
+            dset.read_direct(raw)
+
+        return raw, dataset_what, moment_what
+
+    def read_composite(self, fileobj, dataset: str = "dataset1", moment: str = "data1"):
+        """Read and scale a member, like :func:`read_odim_composite`.
+
+        Returns ``(data, dataset_what)`` with ``data`` the decoder's float32
+        buffer.
+        """
+        raw, dataset_what, what = self.read_raw(fileobj, dataset, moment)
+        if self._scaled is None:
+            self._scaled = np.empty(self.shape, dtype=np.float32)
+
+        return _scale(raw, what, self._scaled), dataset_what
+
+
 def get_rs_grid_index(lat: float, lon: float, where: dict | None = None):
     """Return (row, col) of the RS grid cell nearest to (lat, lon).
 
     Uses the fixed RS grid parameters by default; pass a custom where dict
     to override (e.g. for testing or future grid changes).
     """
+    row, col = rs_grid_position(lat, lon, where)
+    return int(round(row)), int(round(col))
+
+
+def rs_grid_position(lat: float, lon: float, where: dict | None = None):
+    """Return the fractional (row, col) of (lat, lon) in the RS grid.
+
+    Whole numbers are cell centres, so :func:`get_rs_grid_index` is this
+    position rounded; used to place polygon vertices between cell centres.
+    """
     if where is None:
         where = RS_WHERE
 
@@ -222,16 +424,11 @@ def get_rs_grid_index(lat: float, lon: float, where: dict | None = None):
 
     x_0 = _parse_proj_param(projdef, "x_0")
     y_0 = _parse_proj_param(projdef, "y_0")
-    xscale = float(where["xscale"])
-    yscale = float(where["yscale"])
-    ysize = int(where["ysize"])
-
     x_ll, y_ll = _lonlat_to_xy(float(where["LL_lon"]), float(where["LL_lat"]), x_0, y_0)
     x_pt, y_pt = _lonlat_to_xy(lon, lat, x_0, y_0)
 
-    col = int(round((x_pt - x_ll) / xscale))
-    # Row 0 is the top (highest y); y_ll is the southernmost (lowest y)
-    row = int(ysize - 1 - round((y_pt - y_ll) / yscale))
+    col = (x_pt - x_ll) / float(where["xscale"])
+    row = int(where["ysize"]) - 1 - (y_pt - y_ll) / float(where["yscale"])
     return row, col
 
 
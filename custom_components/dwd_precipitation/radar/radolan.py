@@ -25,6 +25,7 @@ datetime from the filename. Use on your own risk.
 __all__ = [
     "read_dx",
     "read_radolan_composite",
+    "read_radolan_cells",
     "get_radolan_filehandle",
     "read_radolan_header",
     "parse_dwd_composite_header",
@@ -33,8 +34,8 @@ __all__ = [
 ]
 __doc__ = __doc__.format("\n   ".join(__all__))
 
+import bisect
 import datetime as dt
-import io
 import re
 
 import numpy as np
@@ -145,58 +146,54 @@ def get_dx_timestamp(name):
     return _get_timestamp_from_filename(name).replace(tzinfo=util.UTC())
 
 
+# DX words: data in the first 12 bits, bit 13 flags a packed zero run whose
+# length is the data part
+_DX_DATA = 4095
+_DX_ZERO_FLAG = 4096
+_DX_NBINS = 128
+
+
+def _expand_dx_words(words):
+    """Expand the bit-13 zero runs of a 1-D array of DX words in one pass."""
+    flagged = (words & _DX_ZERO_FLAG) != 0
+    counts = np.where(flagged, words & _DX_DATA, 1)
+    values = np.where(flagged, 0, words).astype(words.dtype, copy=False)
+    return np.repeat(values, counts), counts
+
+
+def _dx_size_error(size):
+    return OSError(
+        f"DX decoding data size mismatch. Expected size of {_DX_NBINS}, but got {size}."
+    )
+
+
 def unpack_dx(raw):
     """function removes DWD-DX-product bit-13 zero packing"""
-    # data is encoded in the first 12 bits
-    data = 4095
-    # the zero compression flag is bit 13
-    flag = 4096
-
-    beam = []
-
-    # # naive version
-    # # 49193 function calls in 0.772 CPU seconds
-    # # 20234 function calls in 0.581 CPU seconds
-    # for item in raw:
-    #     if item & flag:
-    #         beam.extend([0]* (item & data))
-    #     else:
-    #         beam.append(item & data)
-
-    # performance version - hopefully
-    # 6204 function calls in 0.149 CPU seconds
-
-    # get all compression cases
-    flagged = np.where(raw & flag)[0]
-
-    # if there is no zero in the whole data, we can return raw as it is
-    if flagged.size == 0:
-        if raw.size != 128:
-            raise OSError(
-                f"DX decoding data size mismatch. Expected size of 128, but got {raw.size}."
-            )
-        return raw
-
-    # everything until the first flag is normal data
-    beam.extend(raw[0 : flagged[0]])
+    beam, _counts = _expand_dx_words(np.asarray(raw))
+    if beam.size != _DX_NBINS:
+        raise _dx_size_error(beam.size)
+    return beam
 
-    # iterate over all flags except the last one
-    for this, nxt in zip(flagged[:-1], flagged[1:]):
-        # create as many zeros as there are given within the flagged
-        # byte's data part
-        beam.extend([0] * (raw[this] & data))
-        # append the data until the next flag
-        beam.extend(raw[this + 1 : nxt])
 
-    # process the last flag
-    # add zeroes
-    beam.extend([0] * (raw[flagged[-1]] & data))
+def _unpack_dx_beams(raw, starts):
+    """Unpack all beams of a DX word stream at once.
 
-    # add remaining data
-    beam.extend(raw[flagged[-1] + 1 :])
+    ``starts`` are the indices of the beam marker words; every beam is the
+    marker, azimuth, elevation and then its packed range bins up to the next
+    marker. Returns the (nbeams, 128) array of unpacked words.
+    """
+    idx = np.arange(raw.size)
+    # beam each word belongs to (-1 before the first marker)
+    beam_id = np.searchsorted(starts, idx, side="right") - 1
+    payload = beam_id >= 0
+    payload[payload] = idx[payload] - starts[beam_id[payload]] >= 3
 
-    # return the data
-    return np.array(beam)
+    bins, counts = _expand_dx_words(raw[payload])
+    sizes = np.bincount(beam_id[payload], weights=counts, minlength=starts.size)
+    bad = np.flatnonzero(sizes != _DX_NBINS)
+    if bad.size:
+        raise _dx_size_error(int(sizes[bad[0]]))
+    return bins.reshape(starts.size, _DX_NBINS)
 
 
 def get_dx_header_token():
@@ -286,12 +283,8 @@ def read_dx(filename):
     for this and directly returns the data in the order found in the file.
     If you are in doubt, check the 'azim' attribute.
     Be aware that this function does no extensive checking on its output.
-    If e.g. beams contain different numbers of range bins, the resulting data
-    will not be a 2-D array but a 1-D array of objects, which will most
-    probably break calling code. It was decided to leave the handling of these
-    (hopefully) rare events to the user, who might still be able to retrieve
-    some reasonable data, instead of raising an exception, making it impossible
-    to get any data from a file containing errors.
+    All beams are unpacked in one pass into a (nbeams, 128) array; a beam that
+    does not unpack to exactly 128 range bins raises an OSError.
 
     Parameters
     ----------
@@ -371,34 +364,16 @@ def read_dx(filename):
         raw = np.frombuffer(buf, dtype="uint16")
 
     # a new ray/beam starts with bit 14 set
-    # careful! where always returns its results in a tuple, so in order to get
-    # the indices we have to retrieve element 0 of this tuple
-    newazimuths = np.where(raw == azimuthbitmask)[0]  # Thomas kontaktieren!
-
-    # for the following calculations it is necessary to have the end of the
-    # data as the last index
-    newazimuths = np.append(newazimuths, len(raw))
-
-    # initialize our list of rays/beams
-    beams = []
-    # initialize our list of elevations
-    elevs = []
-    # initialize our list of azimuths
-    azims = []
-
-    # iterate over all beams
-    for i in range(newazimuths.size - 1):
-        # unpack zeros
-        beam = unpack_dx(raw[newazimuths[i] + 3 : newazimuths[i + 1]])
-        beams.append(beam)
-        elevs.append((raw[newazimuths[i] + 2] & databitmask) / 10.0)
-        azims.append((raw[newazimuths[i] + 1] & databitmask) / 10.0)
-
-    beams = np.array(beams)
+    newazimuths = np.flatnonzero(raw == azimuthbitmask)  # Thomas kontaktieren!
+
+    # unpack zeros of all beams at once
+    beams = _unpack_dx_beams(raw, newazimuths)
+    elevs = (raw[newazimuths + 2] & databitmask) / 10.0
+    azims = (raw[newazimuths + 1] & databitmask) / 10.0
 
     # attrs =  {}
-    attrs["elev"] = np.array(elevs)
-    attrs["azim"] = np.array(azims)
+    attrs["elev"] = elevs
+    attrs["azim"] = azims
     attrs["clutter"] = (beams & clutterflag) != 0
 
     # converting the DWD rvp6-format into dBZ data and return as numpy array
@@ -478,25 +453,24 @@ def get_radolan_header_token_pos(header, *, mode="composite"):
             f"Unknown mode {mode}, use either `composite`, `stations or `dx` depending on data source"
         )
 
-    for token in head_dict.keys():
+    found = {}
+    for token in head_dict:
         d = header.rfind(token)
         if d > -1:
-            head_dict[token] = d
-    head = {}
+            found[token] = d
 
-    result_dict = {}
-    result_dict.update((k, v) for k, v in head_dict.items() if v is not None)
-    for k, v in head_dict.items():
-        if v is not None:
-            start = v + len(k)
-            filt = [x for x in result_dict.values() if x > v]
-            if filt:
-                stop = min(filt)
-            else:
-                stop = len(header)
-            head[k] = (start, stop)
-        else:
-            head[k] = v
+    # a token's value runs up to the next token found behind it; one sorted
+    # pass over the positions replaces the per-token search for that stop
+    positions = sorted(found.values())
+    head = {}
+    for k in head_dict:
+        v = found.get(k)
+        if v is None:
+            head[k] = None
+            continue
+        nxt = bisect.bisect_right(positions, v)
+        stop = positions[nxt] if nxt < len(positions) else len(header)
+        head[k] = (v + len(k), stop)
 
     return head
 
@@ -633,6 +607,28 @@ def parse_dwd_composite_header(header):
     return out
 
 
+def _decode_runlength_into(line, out, nodata):
+    """Decode one runlength coded line (line number byte first, LF optional)
+    into the preallocated row ``out``."""
+    out.fill(nodata)
+    # byte '0' is line number, we don't need it; drop the trailing lf as well
+    body = line[1:-1] if line[-1] == 10 else line[1:]
+    if not body.size:
+        return out
+
+    # offset bytes: a run of 255 continuation bytes plus one closing byte,
+    # each worth (byte - 16) "not measured" (nodata) pixels
+    n_cont = int(np.argmax(body != 255)) if (body != 255).any() else body.size
+    offset_bytes = body[: n_cont + 1].astype(np.int64)
+    offset = max(int((offset_bytes - 16).sum()), 0)
+
+    # data bytes: high nibble is the run width, low nibble the value
+    data = body[n_cont + 1 :]
+    vals = np.repeat(data & 0x0F, data >> 4)[: max(out.size - offset, 0)]
+    out[offset : offset + vals.size] = vals
+    return out
+
+
 def decode_radolan_runlength_line(line, attrs):
     """Decodes one line of runlength coded binary data of DWD
     composite file and returns decoded array
@@ -647,47 +643,12 @@ def decode_radolan_runlength_line(line, attrs):
     Returns
     -------
     arr : :py:class:`numpy:numpy.ndarray`
-        of decoded values
+        of decoded values, padded with (or truncated to) ``attrs["ncol"]``
     """
-    # byte '0' is line number, we don't need it
-    # so, we start with offset byte
-    lo = 1
-    byte = line[lo]
-    # line empty condition, lf directly behind line number
-    if byte == 10:
-        return np.ones(attrs["ncol"], dtype=np.uint8) * attrs["nodataflag"]
-    offset = byte - 16
-
-    # check if offset byte is 255 and take next byte(s)
-    # also for the offset
-    while byte == 255:
-        lo += 1
-        byte = line[lo]
-        offset += byte - 16
-
-    # just take the rest
-    dline = line[lo + 1 :]
-
-    # this could be optimized
-    # iterate over line string, until lf (10) is reached
-    for lo, byte in enumerate(dline):
-        if byte == 10:
-            break
-        width = (byte & 0xF0) >> 4
-        val = byte & 0x0F
-        # the "offset pixel" are "not measured" values
-        # so, we set them to 'nodata'
-        if lo == 0:
-            arr = np.ones(offset, dtype=np.uint8) * attrs["nodataflag"]
-        arr = np.append(arr, np.ones(width, dtype=np.uint8) * val)
-
-    trailing = attrs["ncol"] - len(arr)
-    if trailing > 0:
-        arr = np.append(arr, np.ones(trailing, dtype=np.uint8) * attrs["nodataflag"])
-    elif trailing < 0:
-        arr = dline[:trailing]
-
-    return arr
+    out = np.empty(attrs["ncol"], dtype=np.uint8)
+    return _decode_runlength_into(
+        np.asarray(line, dtype=np.uint8), out, attrs["nodataflag"]
+    )
 
 
 def read_radolan_runlength_line(fid):
@@ -732,19 +693,20 @@ def decode_radolan_runlength_array(binarr, attrs):
     arr : :py:class:`numpy:numpy.ndarray`
         Array of decoded values
     """
-    buf = io.BytesIO(binarr)
+    buf = np.frombuffer(binarr, dtype=np.uint8)
 
-    # read and decode first line
-    line = read_radolan_runlength_line(buf)
-    arr = decode_radolan_runlength_line(line, attrs)
+    # line boundaries: every line ends with lf (10); an eot (4) tail ends the
+    # section, anything else behind the last lf is a final unterminated line
+    ends = np.flatnonzero(buf == 10) + 1
+    starts = np.concatenate(([0], ends))
+    bounds = list(zip(starts[:-1], ends))
+    tail = buf[starts[-1] :]
+    if tail.size and tail.tobytes() != b"\x04":
+        bounds.append((starts[-1], buf.size))
 
-    # read following lines
-    line = read_radolan_runlength_line(buf)
-
-    while line is not None:
-        dline = decode_radolan_runlength_line(line, attrs)
-        arr = np.vstack((arr, dline))
-        line = read_radolan_runlength_line(buf)
+    arr = np.empty((len(bounds), attrs["ncol"]), dtype=np.uint8)
+    for row, (start, end) in zip(arr, bounds):
+        _decode_runlength_into(buf[start:end], row, attrs["nodataflag"])
 
     # reshape early for PZ station product
     if mh := attrs.get("maxheight", False):
@@ -806,6 +768,45 @@ def get_radolan_filehandle(fname):
     return fname
 
 
+# bytes fetched per block while looking for the header terminator; composite
+# headers are a few hundred bytes, so one block almost always suffices
+_HEADER_BLOCKSIZE = 1024
+
+
+def _read_header_bytes(fid, *, terminator=b"\x03", blocksize=_HEADER_BLOCKSIZE):
+    """Read up to and including ``terminator``, leaving ``fid`` right behind it.
+
+    Reads block-wise and locates the terminator with ``bytes.find``. Streams
+    with ``peek`` (buffered files, ``bz2``/``gzip`` readers) are only advanced by
+    what belongs to the header; other seekable streams are read ahead and
+    repositioned; anything else falls back to single-byte reads.
+    """
+    peek = getattr(fid, "peek", None)
+    seekable = peek is None and getattr(fid, "seekable", lambda: False)()
+    chunks = []
+    while True:
+        if peek is not None:
+            block = peek(blocksize)[:blocksize]
+            idx = block.find(terminator)
+            chunks.append(fid.read(idx + 1 if idx > -1 else len(block)))
+        elif seekable:
+            pos = fid.tell()
+            block = fid.read(blocksize)
+            idx = block.find(terminator)
+            if idx > -1:
+                fid.seek(pos + idx + 1)
+                block = block[: idx + 1]
+            chunks.append(block)
+        else:
+            block = fid.read(1)
+            idx = 0 if block == terminator else -1
+            chunks.append(block)
+        if not block:
+            raise EOFError("Unexpected EOF detected while reading RADOLAN header.")
+        if idx > -1:
+            return b"".join(chunks)
+
+
 def read_radolan_header(fid):
     """Reads radolan ASCII header and returns it as string
 
@@ -818,24 +819,27 @@ def read_radolan_header(fid):
     -------
     header : str
     """
+    # look at the first byte without consuming it where the stream allows
+    peek = getattr(fid, "peek", None)
+    first = peek(1)[:1] if peek is not None else fid.read(1)
+    if not first:
+        raise EOFError("Unexpected EOF detected while reading RADOLAN header.")
+    # if the first char is "n", then most likely this is ascii radolan data
+    if first == b"n":
+        fid.seek(0)
+        # read the header
+        header = [fid.readline().decode().split() for i in range(6)]
+        header = {h[0]: int(h[1]) for h in header}
+        header["producttype"] = "ascii"
+        return header
 
-    header = ""
-    while True:
-        mychar = fid.read(1)
-        if not mychar:
-            raise EOFError("Unexpected EOF detected while reading RADOLAN header.")
-        # if the first char is "n", then most likely this is ascii radolan data
-        if header == "" and mychar == b"n":
-            fid.seek(0)
-            # read the header
-            header = [fid.readline().decode().split() for i in range(6)]
-            header = {h[0]: int(h[1]) for h in header}
-            header["producttype"] = "ascii"
-            return header
-        if mychar == b"\x03":
-            break
-        header += str(mychar.decode())
-    return header
+    if peek is not None:
+        header = _read_header_bytes(fid)
+    elif first == b"\x03":
+        header = first
+    else:
+        header = first + _read_header_bytes(fid)
+    return header[:-1].decode()
 
 
 def _fix_radolan_truncated_buffer(data, size, dtype):
@@ -939,6 +943,100 @@ def read_radolan_composite(f, *, missing=-9999, loaddata=True, fillmissing=False
     return arr, attrs
 
 
+def _skip_radolan_bytes(fid, size):
+    """Advance ``fid`` by ``size`` bytes (decompressing, but not keeping, them)."""
+    if getattr(fid, "seekable", lambda: False)():
+        fid.seek(size, 1)
+        return
+    while size > 0:
+        chunk = fid.read(min(size, 1 << 16))
+        if not chunk:
+            raise OSError("File corruption: unexpected EOF before requested rows")
+        size -= len(chunk)
+
+
+def read_radolan_cells(f, cells, *, missing=-9999, expected_shape=None):
+    """Read only the given (row, col) cells of a binary RADOLAN composite
+
+    Point-read counterpart of :func:`read_radolan_composite`. The binary
+    payload is stored row by row with a fixed row size, so only the rows from
+    the first to the last requested one are read; for a compressed stream
+    (e.g. ``bz2.open``) everything behind the last requested row is never
+    decompressed. Only the requested cells are decoded, with the same flag
+    handling, precision factor and ``missing`` no-data value.
+
+    Run-length coded (PG, PC, PZ) and ASCII products have no fixed row size
+    and raise ``ValueError``, as does a cell outside the grid or, when
+    ``expected_shape`` is given, a grid of a different shape.
+
+    Parameters
+    ----------
+    f : str or file-like
+        path to the composite file or (decompressed) file-like object
+    cells : sequence of (row, col)
+        grid cells to read, row 0 being the southernmost row
+    missing : int
+        value assigned to no-data cells
+    expected_shape : tuple, optional
+        (nrow, ncol) the composite must have
+
+    Returns
+    -------
+    output : tuple
+        tuple of two items (values, attrs):
+            - values : :class:`numpy:numpy.ndarray` of float, aligned to `cells`
+            - attrs : dict of metadata information from the file header
+    """
+    fid = get_radolan_filehandle(f)
+    header = read_radolan_header(fid)
+    if isinstance(header, dict) or header[:2] in ("PG", "PC", "PZ"):
+        raise ValueError("Point reads need a binary product with fixed-size rows")
+    attrs = parse_dwd_composite_header(header)
+    attrs["nodataflag"] = missing
+    product = attrs["producttype"]
+
+    shape = (attrs["nrow"], attrs["ncol"])
+    if expected_shape is not None and shape != tuple(expected_shape):
+        raise ValueError(
+            f"Unexpected RADOLAN grid shape {shape}, expected {tuple(expected_shape)}"
+        )
+
+    points = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+    rows, cols = points[:, 0], points[:, 1]
+    if ((points < 0) | (points >= shape)).any():
+        raise ValueError(f"Cell index outside the {shape} RADOLAN grid")
+    if not points.size:
+        return np.empty(0), attrs
+
+    if product in ["RX", "EX", "WX"]:
+        dtype = np.dtype(np.uint8)
+    elif product in ["HG"]:
+        dtype = np.dtype(np.uint32)
+    else:
+        dtype = np.dtype(np.uint16)
+    rowsize = shape[1] * dtype.itemsize
+
+    first, last = int(rows.min()), int(rows.max())
+    _skip_radolan_bytes(fid, first * rowsize)
+    buf = read_radolan_binary_array(fid, (last - first + 1) * rowsize)
+    words = np.frombuffer(buf, dtype=dtype).reshape(-1, shape[1])[rows - first, cols]
+
+    # same flag semantics as _radolan_file._process_data
+    if product in ["RX", "EX", "WX"]:
+        nodata = words == 250
+        values = words.astype(float)
+    else:
+        nodata = (words & 0x2000) != 0
+        values = (words & 0xFFF).astype(float)
+        if product == "RD":
+            values[(words & 0x4000) != 0] *= -1
+
+    if "precision" in attrs:
+        values *= attrs["precision"]
+    values[nodata] = missing
+    return values, attrs
+
+
 def _get_radolan_product_attributes(attrs):
     """Create RADOLAN product attributes dictionary
 
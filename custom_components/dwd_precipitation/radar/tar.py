@@ -0,0 +1,113 @@
+"""Zero-copy member access for uncompressed tar archives held in memory.
+
+The RS/RV releases are tars of ODIM_H5 members. Instead of extracting every
+member into its own buffer, :class:`TarIndex` scans the tar headers once and
+hands out read-only file objects over slices of the original buffer, so the
+release is held in memory exactly once.
+"""
+
+from __future__ import annotations
+
+import io
+import tarfile
+
+
+class MemoryReader(io.RawIOBase):
+    """Read-only, seekable binary file object over a buffer, without copying it."""
+
+    def __init__(self, buffer) -> None:
+        """Wrap any object supporting the buffer protocol."""
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        """Return True."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return True."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to ``offset`` relative to ``whence``; return the new position."""
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, b) -> int:
+        """Copy up to ``len(b)`` bytes at the current position into ``b``."""
+        end = min(self._pos + len(b), len(self._view))
+        n = max(end - self._pos, 0)
+        if n:
+            memoryview(b).cast("B")[:n] = self._view[self._pos:end]
+            self._pos = end
+        return n
+
+    def close(self) -> None:
+        """Close the reader and release the view of the buffer."""
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class TarIndex:
+    """Offsets and sizes of the regular-file members of an in-memory tar.
+
+    Built with a single pass over the member headers (data blocks are seeked
+    over, not read). Members are then served as views of the original buffer.
+    """
+
+    def __init__(self, buffer) -> None:
+        """Index the uncompressed tar held in ``buffer``."""
+        self._buffer = buffer
+        with (
+            MemoryReader(buffer) as reader,
+            tarfile.open(fileobj=reader, mode="r:") as tf,
+        ):
+            self._members = {
+                member.name: (member.offset_data, member.size)
+                for member in tf
+                if member.isfile()
+            }
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether ``name`` is a regular-file member."""
+        return name in self._members
+
+    def __len__(self) -> int:
+        """Return the number of regular-file members."""
+        return len(self._members)
+
+    @property
+    def names(self) -> list[str]:
+        """Return the member names in archive order."""
+        return list(self._members)
+
+    def view(self, name: str) -> memoryview:
+        """Return the member's bytes as a view of the archive buffer.
+
+        Raises KeyError when the archive has no such member.
+        """
+        offset, size = self._members[name]
+        return memoryview(self._buffer)[offset:offset + size]
+
+    def open(self, name: str) -> MemoryReader:
+        """Return a file object over the member (no copy).
+
+        Raises KeyError when the archive has no such member.
+        """
+        return MemoryReader(self.view(name))
@@ -0,0 +1,201 @@
+"""Persistent cache of each coordinator's latest release payload.
+
+After a restart a coordinator whose persisted release is still the latest one
+is populated from disk, so its entities are available immediately and the
+release is not downloaded again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import fields
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .coordinator import (
+    BaseProductUpdateCoordinator,
+    CoordinatorData,
+    ProductMetadata,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.releases"
+STORAGE_VERSION = 1
+
+# Delay (s) before a changed record is written, so the coordinators refreshed
+# by one release pass are persisted in a single write.
+SAVE_DELAY = 10
+
+# Records are evicted when older than this (the daily SF release is the longest
+# lived) and, beyond this many, oldest first (entries that were removed).
+MAX_RECORD_AGE = timedelta(days=2)
+MAX_RECORDS = 64
+
+DATA_RELEASE_STORE: HassKey[ReleaseStore] = HassKey(f"{DOMAIN}_release_store")
+
+
+def _encode(value: Any) -> Any:
+    """Return a JSON-safe form of a coordinator payload (tagged where needed)."""
+    if isinstance(value, ProductMetadata):
+        return {
+            "__metadata__": {
+                f.name: _encode(getattr(value, f.name)) for f in fields(value)
+            }
+        }
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if hasattr(value, "item"):  # numpy scalar
+        return value.item()
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Invert _encode."""
+    if isinstance(value, dict):
+        if "__metadata__" in value:
+            return ProductMetadata(**_decode(value["__metadata__"]))
+        if "__datetime__" in value:
+            return dt_util.parse_datetime(value["__datetime__"])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _record_key(entry_id: str, coordinator: BaseProductUpdateCoordinator) -> str:
+    return f"{entry_id}_{coordinator.PRODUCT_KEY}"
+
+
+class ReleaseStore:
+    """The latest release payload per (config entry, product), on disk.
+
+    Backed by one Home Assistant Store (``.storage/dwd_precipitation.releases``)
+    shared by all entries; bounded by MAX_RECORD_AGE and MAX_RECORDS.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._records: dict[str, dict[str, Any]] = {}
+        self._load_task: asyncio.Task | None = None
+
+    async def async_load(self) -> None:
+        """Load the persisted records once; later calls wait for that load."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(
+                self._async_load(), "dwd_precipitation release store load"
+            )
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        stored = await self._store.async_load()
+        if stored:
+            self._records = dict(stored.get("records", {}))
+        self._evict()
+
+    def __len__(self) -> int:
+        """Return the number of persisted records."""
+        return len(self._records)
+
+    def restore(self, entry_id: str, coordinator: BaseProductUpdateCoordinator) -> bool:
+        """Populate a coordinator from its record; True if the record was current.
+
+        A record saved under other payload settings (see
+        ``payload_settings``) is ignored, so that release is refetched.
+        """
+        record = self._records.get(_record_key(entry_id, coordinator))
+        if record is None:
+            return False
+        try:
+            release = dt_util.parse_datetime(record["release"])
+            data = CoordinatorData(
+                _decode(record["data"]),
+                _decode(record["metadata"]),
+                _decode(record.get("zones")),
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring unreadable %s record: %s", coordinator.name, err)
+            return False
+        if release is None:
+            return False
+        if record.get("settings", {}) != coordinator.payload_settings():
+            return False
+        return coordinator.restore(release, data)
+
+    @callback
+    def async_track(
+        self, entry_id: str, coordinator: BaseProductUpdateCoordinator
+    ) -> CALLBACK_TYPE:
+        """Persist the coordinator's payload whenever it changes; return an unsub."""
+        key = _record_key(entry_id, coordinator)
+        saved: CoordinatorData | None = None
+
+        @callback
+        def _save() -> None:
+            # A new payload object means a new release or re-derived options;
+            # failed or no-op refreshes keep the same object.
+            nonlocal saved
+            release = coordinator.curr_release
+            data = coordinator.data
+            if release is None or data is None or data is saved:
+                return
+            saved = data
+            self._records[key] = {
+                "release": release.isoformat(),
+                "saved": dt_util.utcnow().isoformat(),
+                "data": _encode(data.data),
+                "metadata": _encode(data.metadata),
+                "zones": _encode(data.zones),
+                "settings": coordinator.payload_settings(),
+            }
+            self._evict()
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+        _save()
+        return coordinator.async_add_listener(_save)
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop every record of a removed config entry."""
+        prefix = f"{entry_id}_"
+        for key in [key for key in self._records if key.startswith(prefix)]:
+            del self._records[key]
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _evict(self) -> None:
+        """Drop records past MAX_RECORD_AGE, then the oldest beyond MAX_RECORDS."""
+        cutoff = dt_util.utcnow() - MAX_RECORD_AGE
+
+        def _saved(item: tuple[str, dict[str, Any]]) -> datetime:
+            saved = dt_util.parse_datetime(item[1].get("saved", ""))
+            return saved or datetime.min.replace(tzinfo=dt_util.UTC)
+
+        records = sorted(self._records.items(), key=_saved, reverse=True)
+        self._records = dict(
+            item for item in records[:MAX_RECORDS] if _saved(item) >= cutoff
+        )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"records": self._records}
+
+
+async def async_get_release_store(hass: HomeAssistant) -> ReleaseStore:
+    """Return the loaded release store of this Home Assistant instance."""
+    if (store := hass.data.get(DATA_RELEASE_STORE)) is None:
+        store = hass.data[DATA_RELEASE_STORE] = ReleaseStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,161 @@
+"""Domain-wide refresh scheduler shared by every product coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_utc_time_change,
+)
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .coordinator import BaseProductUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+type ScheduleKey = tuple[timedelta, timedelta, timedelta]
+
+DATA_SCHEDULER: HassKey[ReleaseScheduler] = HassKey(f"{DOMAIN}_scheduler")
+
+
+def schedule_key(coordinator: BaseProductUpdateCoordinator) -> ScheduleKey:
+    """Return the release schedule a coordinator is refreshed on."""
+    return (
+        coordinator.RELEASE_INTERVAL,
+        coordinator.RELEASE_DELAY,
+        coordinator.RELEASE_OFFSET,
+    )
+
+
+@dataclass
+class _ScheduleGroup:
+    """Coordinators sharing one release schedule, and its time trackers."""
+
+    members: list[BaseProductUpdateCoordinator] = field(default_factory=list)
+    unsubs: list[CALLBACK_TYPE] = field(default_factory=list)
+    # Pending one-shot refresh at the members' learned release delay.
+    learned_unsub: CALLBACK_TYPE | None = None
+
+
+class ReleaseScheduler:
+    """Refresh coordinators from one set of time trackers per release schedule.
+
+    Coordinators (of all config entries) with the same (RELEASE_INTERVAL,
+    RELEASE_DELAY, RELEASE_OFFSET) share the trackers; when they fire, every
+    member is refreshed concurrently, so coordinators of the same product
+    coalesce on one download through the release cache. Where the members have
+    learned a release delay other than RELEASE_DELAY, the group is refreshed
+    once more at the latest of their learned times.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._groups: dict[ScheduleKey, _ScheduleGroup] = {}
+
+    @property
+    def schedules(self) -> dict[ScheduleKey, list[BaseProductUpdateCoordinator]]:
+        """Return the registered coordinators by schedule."""
+        return {key: list(group.members) for key, group in self._groups.items()}
+
+    @callback
+    def async_add(self, coordinator: BaseProductUpdateCoordinator) -> CALLBACK_TYPE:
+        """Schedule a coordinator's refreshes; return a callable that removes it."""
+        key = schedule_key(coordinator)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _ScheduleGroup()
+            refresh = self._make_refresh_callback(key)
+            for arg in coordinator.track_time_change_args:
+                group.unsubs.append(
+                    async_track_utc_time_change(
+                        self._hass,
+                        refresh,
+                        hour=arg["hour"],
+                        minute=arg["minute"],
+                        second=arg["second"],
+                    )
+                )
+        group.members.append(coordinator)
+        self._schedule_learned_refresh(key)
+
+        @callback
+        def _remove() -> None:
+            group.members.remove(coordinator)
+            if not group.members:
+                for unsub in group.unsubs:
+                    unsub()
+                self._cancel_learned_refresh(group)
+                del self._groups[key]
+
+        return _remove
+
+    def _make_refresh_callback(self, key: ScheduleKey) -> Callable:
+        """Return a time-change callback that refreshes one schedule's group."""
+
+        async def _callback(_now: datetime) -> None:
+            await self.async_refresh_schedule(key)
+
+        return _callback
+
+    async def async_refresh_schedule(self, key: ScheduleKey) -> None:
+        """Refresh every coordinator on a schedule in one concurrent pass."""
+        group = self._groups.get(key)
+        if group is None:
+            return
+        members = list(group.members)
+        results = await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in members),
+            return_exceptions=True,
+        )
+        for coordinator, result in zip(members, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Scheduled refresh of %s failed: %s", coordinator.name, result
+                )
+        self._schedule_learned_refresh(key)
+
+    @callback
+    def _schedule_learned_refresh(self, key: ScheduleKey) -> None:
+        """(Re)schedule one refresh of a group at its members' learned delay."""
+        group = self._groups.get(key)
+        if group is None:
+            return
+        self._cancel_learned_refresh(group)
+        times = [
+            at
+            for coordinator in group.members
+            if (at := coordinator.learned_refresh_at()) is not None
+        ]
+        if not times or (at := max(times)) <= dt_util.utcnow():
+            return
+
+        async def _refresh(_now: datetime) -> None:
+            group.learned_unsub = None
+            _LOGGER.debug("Refreshing the %s schedule at its learned delay", key)
+            await self.async_refresh_schedule(key)
+
+        group.learned_unsub = async_track_point_in_utc_time(self._hass, _refresh, at)
+
+    @staticmethod
+    def _cancel_learned_refresh(group: _ScheduleGroup) -> None:
+        """Cancel a group's pending learned-delay refresh."""
+        if group.learned_unsub is not None:
+            group.learned_unsub()
+            group.learned_unsub = None
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> ReleaseScheduler:
+    """Return the scheduler of this Home Assistant instance, creating it once."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = ReleaseScheduler(hass)
+    return scheduler
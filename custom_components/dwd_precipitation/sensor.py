@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -16,6 +16,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    PERCENTAGE,
     UnitOfPrecipitationDepth,
     UnitOfTime,
     UnitOfVolumetricFlux,
@@ -25,7 +26,7 @@ from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, slugify
 
 from .const import (
     CONF_EXTRA_ATTRIBUTES,
@@ -128,6 +129,76 @@ RADVOR_SENSORS = (
 )
 
 
+# Past-hour statistics over the area around the location (RS items 3-5);
+# created only when an area radius is configured.
+RADVOR_AREA_SENSORS = (
+    PrecipitationSensorEntityDescription(
+        key="radvor_rs_000_area_max",
+        translation_key="precipitation_now_area_max",
+        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
+        device_class=SensorDeviceClass.PRECIPITATION,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        product_key="rs",
+        access_fn=lambda _list: _list[3],
+    ),
+    PrecipitationSensorEntityDescription(
+        key="radvor_rs_000_area_mean",
+        translation_key="precipitation_now_area_mean",
+        native_unit_of_measurement=UnitOfPrecipitationDepth.MILLIMETERS,
+        device_class=SensorDeviceClass.PRECIPITATION,
+        suggested_display_precision=1,
+        state_class=SensorStateClass.MEASUREMENT,
+        product_key="rs",
+        access_fn=lambda _list: _list[4],
+    ),
+    PrecipitationSensorEntityDescription(
+        key="radvor_rs_000_area_coverage",
+        translation_key="precipitation_now_area_coverage",
+        icon="mdi:weather-pouring",
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=0,
+        state_class=SensorStateClass.MEASUREMENT,
+        product_key="rs",
+        access_fn=lambda _list: _list[5],
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZoneSensorEntityDescription(PrecipitationSensorEntityDescription):
+    """Provide a description for a sensor of one zone's mean precipitation."""
+
+    zone: str
+
+
+# Sensors whose product is also reduced over the configured zones; each zone
+# gets a copy (the state is the zone's mean, the metadata the product's).
+ZONE_SENSORS = (RADVOR_SENSORS[0], *RADOLAN_SENSORS)
+
+
+def _zone_sensors(
+    coordinators: dict[str, BaseProductUpdateCoordinator],
+) -> Iterator[ZoneSensorEntityDescription]:
+    """Return the per-zone sensors of the products with zones configured."""
+    for base in ZONE_SENSORS:
+        if (zones := coordinators[base.product_key].zones) is None:
+            continue
+        for zone in zones.names:
+            yield ZoneSensorEntityDescription(
+                key=f"zone_{slugify(zone)}_{base.key}",
+                translation_key=f"zone_{base.translation_key}",
+                translation_placeholders={"zone": zone},
+                native_unit_of_measurement=base.native_unit_of_measurement,
+                device_class=base.device_class,
+                suggested_display_precision=base.suggested_display_precision,
+                state_class=base.state_class,
+                product_key=base.product_key,
+                access_fn=base.access_fn,
+                zone=zone,
+            )
+
+
 # RV sensors whose shape does not depend on the start/end display mode: the two
 # peak-intensity sensors.
 RADVOR_RV_SENSORS = (
@@ -249,6 +320,8 @@ async def async_setup_entry(
         + HYMECNG_SENSORS
         + RADOLAN_SENSORS
     )
+    if coordinators["rs"].area is not None:
+        entity_descriptions += RADVOR_AREA_SENSORS
 
     entities: list[SensorEntity] = [
         PrecipitationSensorEntity(
@@ -257,6 +330,13 @@ async def async_setup_entry(
         )
         for entity_description in entity_descriptions
     ]
+    entities += [
+        ZonePrecipitationSensorEntity(
+            coordinators[entity_description.product_key],
+            entity_description,
+        )
+        for entity_description in _zone_sensors(coordinators)
+    ]
     entities.append(TimespanWithoutPrecipitationSensor(coordinators["rs"]))
 
     async_add_entities(entities)
@@ -329,6 +409,20 @@ class PrecipitationSensorEntity(DwdCoordinatorEntity, SensorEntity):
         return attrs
 
 
+class ZonePrecipitationSensorEntity(PrecipitationSensorEntity):
+    """Mean precipitation of a product over one configured zone."""
+
+    entity_description: ZoneSensorEntityDescription
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the zone's mean of the current release."""
+        if self.coordinator.data is None or self.coordinator.data.zones is None:
+            return None
+
+        return self.coordinator.data.zones.get(self.entity_description.zone)
+
+
 class TimespanWithoutPrecipitationSensor(
     CoordinatorEntity[BaseProductUpdateCoordinator], RestoreEntity, SensorEntity
 ):
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import math
+import random
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any
 from urllib.parse import urlsplit
 
 import aiohttp
+from aiohttp import hdrs
 
 # Only DWD OpenData is a trusted origin. TLS server-certificate validation
 # (enabled by default on Home Assistant's shared aiohttp session) authenticates
@@ -23,12 +30,147 @@ DEFAULT_MAX_BYTES = 128 * 1024 * 1024
 
 _READ_CHUNK = 64 * 1024
 
+# Bounds of a ValidatorCache: it holds at most this many bodies, totalling at
+# most this many bytes. With one body per product directory (see
+# ValidatorCache) that is the latest release of every product.
+DEFAULT_VALIDATOR_ENTRIES = 8
+DEFAULT_VALIDATOR_BYTES = 64 * 1024 * 1024
+
+
+def _url_directory(url: str) -> str:
+    """Return the URL up to its last path segment (a DWD product's directory)."""
+    return url.rsplit("/", 1)[0]
+
 
 @dataclass
 class AsyncResponse:
     """Minimal HTTP response wrapper returned by async_get."""
 
-    content: bytes
+    content: bytes | bytearray
+    # Server-side modification time of the object (Last-Modified), if sent.
+    last_modified: datetime | None = None
+
+
+@dataclass
+class AsyncProbe:
+    """Result of an availability probe (async_head)."""
+
+    exists: bool
+    content_length: int | None = None
+    last_modified: datetime | None = None
+
+
+def _parse_http_date(value: str | None) -> datetime | None:
+    """Parse an HTTP date header (e.g. Last-Modified) to an aware datetime."""
+    if value is None:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _Validated:
+    """A cached body with the validators the server sent along with it."""
+
+    content: bytes | bytearray
+    etag: str | None
+    last_modified: str | None
+
+
+class ValidatorCache:
+    """Bounded, URL-keyed store of downloaded bodies and their HTTP validators.
+
+    Lets ``async_get`` revalidate a URL it has downloaded before with a
+    conditional GET (``If-None-Match`` / ``If-Modified-Since``) and serve the
+    cached body on ``304 Not Modified`` — e.g. on fast-poll retries or after an
+    options reload. Only bodies that came with an ``ETag`` or ``Last-Modified``
+    are kept; the least recently used are dropped beyond ``max_entries`` or
+    ``max_bytes``.
+
+    Release URLs carry their timestamp, so a body is only ever revalidated
+    within its own release. A stored body therefore replaces the cached one of
+    the same ``series`` (by default the URL's directory, i.e. the product):
+    past releases, which are never requested again, are not kept.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_VALIDATOR_ENTRIES,
+        max_bytes: int = DEFAULT_VALIDATOR_BYTES,
+        series: Callable[[str], str] = _url_directory,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._series = series
+        self._entries: OrderedDict[str, _Validated] = OrderedDict()
+        self._latest: dict[str, str] = {}
+        self._size = 0
+
+    def get(self, url: str) -> _Validated | None:
+        """Return the cached body for ``url`` (marking it recently used)."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def put(
+        self,
+        url: str,
+        content: bytes | bytearray,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Store ``content`` for ``url`` if it can be revalidated later.
+
+        Any cached body of another URL of the same series is dropped.
+        """
+        self.discard(url)
+        series = self._series(url)
+        if (previous := self._latest.get(series)) is not None:
+            self.discard(previous)
+        if (etag is None and last_modified is None) or len(content) > self.max_bytes:
+            return
+        self._entries[url] = _Validated(content, etag, last_modified)
+        self._latest[series] = url
+        self._size += len(content)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            self.discard(next(iter(self._entries)))
+
+    def discard(self, url: str) -> None:
+        """Forget ``url``."""
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= len(entry.content)
+            series = self._series(url)
+            if self._latest.get(series) == url:
+                del self._latest[series]
+
+    def __contains__(self, url: str) -> bool:
+        """Return True if a body for ``url`` is cached."""
+        return url in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached bodies."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached bodies in bytes."""
+        return self._size
+
+
+def _conditional_headers(entry: _Validated | None) -> dict[str, str]:
+    """Return the revalidation request headers for a cached body."""
+    headers: dict[str, str] = {}
+    if entry is not None:
+        if entry.etag is not None:
+            headers[hdrs.IF_NONE_MATCH] = entry.etag
+        if entry.last_modified is not None:
+            headers[hdrs.IF_MODIFIED_SINCE] = entry.last_modified
+    return headers
 
 
 def _validate_url(url: str) -> None:
@@ -42,11 +184,15 @@ def _validate_url(url: str) -> None:
         )
 
 
-async def _read_capped(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+async def _read_capped(
+    response: aiohttp.ClientResponse, max_bytes: int, size_hint: int | None = None
+) -> bytes | bytearray:
     """Read the body, refusing to buffer more than ``max_bytes``.
 
     Checks the declared Content-Length first (cheap early rejection), then caps
     the streamed read as well, since the header may be absent or untruthful.
+    When the size is known up front (Content-Length, else ``size_hint`` from an
+    earlier probe) the body is read into one preallocated buffer.
     """
     declared = response.content_length
     if declared is not None and declared > max_bytes:
@@ -55,6 +201,20 @@ async def _read_capped(response: aiohttp.ClientResponse, max_bytes: int) -> byte
             f"{max_bytes}-byte cap"
         )
 
+    expected = declared if declared is not None else size_hint
+    if expected is not None and 0 < expected <= max_bytes:
+        buf = bytearray(expected)
+        total = 0
+        async for chunk in response.content.iter_chunked(_READ_CHUNK):
+            end = total + len(chunk)
+            if end > max_bytes:
+                raise ValueError(f"DWD response exceeded {max_bytes}-byte cap")
+            buf[total:end] = chunk
+            total = end
+        if total < len(buf):
+            del buf[total:]
+        return buf
+
     chunks: list[bytes] = []
     total = 0
     async for chunk in response.content.iter_chunked(_READ_CHUNK):
@@ -66,6 +226,154 @@ async def _read_capped(response: aiohttp.ClientResponse, max_bytes: int) -> byte
     return b"".join(chunks)
 
 
+@dataclass
+class _ReleaseEntry:
+    """One cached release: the shared fetch and who has yet to consume it."""
+
+    task: asyncio.Future
+    pending: set[Hashable] = field(default_factory=set)
+
+
+class ReleaseCache:
+    """Process-wide, release-keyed cache of DWD fetches.
+
+    Every config entry owns its own product coordinators, yet they all fetch the
+    same national composite. The cache runs each ``(product, release)`` fetch
+    once and hands the result to every coordinator asking for it — including
+    those that ask while the download is still in flight (request coalescing).
+
+    Coordinators ``subscribe`` to a product. A release is evicted as soon as
+    every subscriber has consumed it, or when a newer release of the same
+    product is fetched, so at most one release per product is held. Failures
+    are never cached: the next attempt goes back to the network.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._subscribers: dict[str, set[Hashable]] = defaultdict(set)
+        self._entries: dict[tuple[str, datetime], _ReleaseEntry] = {}
+
+    def subscribe(self, product: str, subscriber: Hashable) -> Callable[[], None]:
+        """Register ``subscriber`` as a consumer of ``product``.
+
+        Returns a callable that removes the subscription again (suitable for
+        ``ConfigEntry.async_on_unload``).
+        """
+        self._subscribers[product].add(subscriber)
+
+        def _unsubscribe() -> None:
+            subscribers = self._subscribers.get(product)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[product]
+            # A leaving subscriber must not pin releases it will never consume.
+            for key, entry in list(self._entries.items()):
+                if key[0] == product:
+                    entry.pending.discard(subscriber)
+                    self._evict_if_consumed(key, entry)
+
+        return _unsubscribe
+
+    def subscribers(self, product: str) -> frozenset[Hashable]:
+        """Return the current subscribers of ``product``."""
+        return frozenset(self._subscribers.get(product, ()))
+
+    async def async_fetch(
+        self,
+        product: str,
+        release: datetime,
+        subscriber: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the result of ``fetch`` for ``(product, release)``, fetching once.
+
+        ``fetch`` is only called when no entry for the release exists yet; every
+        other caller awaits the same in-flight fetch.
+        """
+        key = (product, release)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._evict_superseded(product, release)
+            entry = _ReleaseEntry(
+                task=asyncio.ensure_future(fetch()),
+                pending=set(self._subscribers.get(product, ())),
+            )
+            self._entries[key] = entry
+        entry.pending.discard(subscriber)
+
+        try:
+            # Shielded so one cancelled waiter cannot abort the shared fetch.
+            result = await asyncio.shield(entry.task)
+        except Exception:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            raise
+
+        self._evict_if_consumed(key, entry)
+        return result
+
+    def __contains__(self, key: tuple[str, datetime]) -> bool:
+        """Return True if ``(product, release)`` is currently cached."""
+        return key in self._entries
+
+    def _evict_if_consumed(self, key: tuple[str, datetime], entry: _ReleaseEntry) -> None:
+        """Drop a finished entry once no subscriber is still waiting for it."""
+        if not entry.pending and entry.task.done() and self._entries.get(key) is entry:
+            del self._entries[key]
+
+    def _evict_superseded(self, product: str, release: datetime) -> None:
+        """Drop older releases of ``product`` — nobody will ask for them again."""
+        for key in [k for k in self._entries if k[0] == product and k[1] < release]:
+            del self._entries[key]
+
+
+class LatestReleaseCache:
+    """Holds one value built for the newest release it was asked about.
+
+    For large derived artefacts (e.g. a full forecast cube) that are built on
+    demand only. Concurrent requests for the same release share one build; a
+    request for a newer release replaces the held value, so at most one is
+    kept. A request for an older release is built for its caller but not kept.
+    Failures are never cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._release: datetime | None = None
+        self._task: asyncio.Future | None = None
+
+    async def async_get(
+        self, release: datetime, build: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the value for ``release``, calling ``build`` only if needed."""
+        if self._task is not None and release == self._release:
+            task = self._task
+        elif self._release is None or release > self._release:
+            task = self._task = asyncio.ensure_future(build())
+            self._release = release
+        else:
+            return await build()
+
+        try:
+            # Shielded so one cancelled waiter cannot abort the shared build.
+            return await asyncio.shield(task)
+        except Exception:
+            if self._task is task:
+                self.clear()
+            raise
+
+    @property
+    def release(self) -> datetime | None:
+        """Return the release whose value is held (or being built)."""
+        return self._release
+
+    def clear(self) -> None:
+        """Drop the held value."""
+        self._release = None
+        self._task = None
+
+
 class mydatetime(datetime):
     """Standard datetime class with added support for the % and // operators.
 
@@ -128,11 +436,107 @@ def get_previous_multiple(
     )
 
 
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Backoff schedule for retrying a release that is not available yet.
+
+    Retry ``n`` (0-based) waits ``initial × factor**n``, capped at
+    ``max_fraction`` of the product's release interval (and at ``max_delay``),
+    then spread by ±``jitter`` so coordinators do not retry in lock-step.
+    """
+
+    initial: timedelta = timedelta(seconds=20)
+    factor: float = 2.0
+    jitter: float = 0.2
+    max_fraction: float = 0.25
+    max_delay: timedelta = timedelta(minutes=15)
+
+    def cap(self, interval: timedelta) -> timedelta:
+        """Return the longest wait between retries for ``interval``."""
+        return min(interval * self.max_fraction, self.max_delay)
+
+    def delay(
+        self, attempt: int, interval: timedelta, rng: random.Random | None = None
+    ) -> timedelta:
+        """Return the wait before retry number ``attempt`` (0-based)."""
+        cap = self.cap(interval)
+        if self.factor > 1:
+            # Past the first attempt that reaches the cap the wait no longer
+            # grows; bounding the exponent there keeps the product finite.
+            ratio = max(cap / self.initial, 1.0)
+            attempt = min(attempt, math.ceil(math.log(ratio, self.factor)))
+        base = min(self.initial * self.factor**attempt, cap)
+        spread = (rng or random).uniform(1 - self.jitter, 1 + self.jitter)
+        return base * spread
+
+
+class ReleaseDelayEstimator:
+    """Rolling estimate of how long after its nominal time a release appears.
+
+    Keeps the last ``window`` observed publication delays and estimates the
+    delay as their ``quantile`` (nearest rank) plus a small safety ``margin``.
+    Until ``min_samples`` are collected the static delay is used; the learned
+    value is always clamped to ``[lower, upper] × static``. Observations outside
+    ``[0, interval + upper × static]`` (e.g. a catch-up fetch of an old release
+    at startup) carry no timing information and are ignored.
+    """
+
+    def __init__(
+        self,
+        static: timedelta,
+        interval: timedelta,
+        *,
+        window: int = 24,
+        quantile: float = 0.9,
+        min_samples: int = 3,
+        margin: timedelta = timedelta(seconds=10),
+        lower: float = 0.5,
+        upper: float = 2.0,
+    ) -> None:
+        """Initialize an estimator without observations."""
+        self.static = static
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.margin = margin
+        self.lower = static * lower
+        self.upper = static * upper
+        self._limit = interval + self.upper
+        self._samples: deque[timedelta] = deque(maxlen=window)
+
+    def observe(self, delay: timedelta) -> bool:
+        """Record one observed publication delay; return False if ignored."""
+        if not timedelta(0) <= delay <= self._limit:
+            return False
+        self._samples.append(delay)
+        return True
+
+    @property
+    def learned(self) -> timedelta | None:
+        """Return the clamped learned delay, or None while still learning."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ranked = sorted(self._samples)
+        rank = max(math.ceil(self.quantile * len(ranked)) - 1, 0)
+        return min(max(ranked[rank] + self.margin, self.lower), self.upper)
+
+    @property
+    def delay(self) -> timedelta:
+        """Return the delay to schedule with: learned if available, else static."""
+        learned = self.learned
+        return self.static if learned is None else learned
+
+    def __len__(self) -> int:
+        """Return the number of observations kept."""
+        return len(self._samples)
+
+
 async def async_get(
     url: str,
     session: aiohttp.ClientSession,
     attempts: int = 2,
     max_bytes: int = DEFAULT_MAX_BYTES,
+    validators: ValidatorCache | None = None,
+    size_hint: int | None = None,
 ) -> AsyncResponse:
     """Send a HTTP GET request using an aiohttp session.
 
@@ -140,18 +544,40 @@ async def async_get(
     no cross-host redirects (so provenance can't be redirected away), and a hard
     cap on the buffered body size. Retries on connection errors up to `attempts`
     times. Raises immediately on 4xx/5xx responses without retrying.
+
+    With a `validators` cache the request is conditional whenever a body for
+    `url` is cached, and a `304 Not Modified` returns that body. `size_hint`
+    (e.g. a probed Content-Length) preallocates the body buffer when the
+    response itself does not declare its length.
     """
     _validate_url(url)
+    cached = validators.get(url) if validators is not None else None
+    headers = _conditional_headers(cached)
     for attempt in range(attempts):
         try:
-            async with session.get(url, allow_redirects=False) as response:
+            async with session.get(
+                url, allow_redirects=False, headers=headers
+            ) as response:
                 response.raise_for_status()
+                if response.status == 304 and cached is not None:
+                    return AsyncResponse(
+                        content=cached.content,
+                        last_modified=_parse_http_date(cached.last_modified),
+                    )
                 if 300 <= response.status < 400:
                     raise ValueError(
                         f"DWD returned an unexpected redirect "
                         f"(HTTP {response.status}) for {url!r}"
                     )
-                return AsyncResponse(content=await _read_capped(response, max_bytes))
+                content = await _read_capped(response, max_bytes, size_hint)
+                last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+                if validators is not None:
+                    validators.put(
+                        url, content, response.headers.get(hdrs.ETAG), last_modified
+                    )
+                return AsyncResponse(
+                    content=content, last_modified=_parse_http_date(last_modified)
+                )
         except aiohttp.ClientResponseError:
             raise
         except aiohttp.ClientConnectionError as err:
@@ -159,3 +585,26 @@ async def async_get(
                 await asyncio.sleep((attempt + 1) * 0.1)
                 continue
             raise err
+
+
+async def async_head(url: str, session: aiohttp.ClientSession) -> AsyncProbe:
+    """Probe whether ``url`` exists without downloading it (HTTP HEAD).
+
+    Same URL and redirect rules as :func:`async_get`. A 404 is reported as
+    ``exists=False``; any other error status raises.
+    """
+    _validate_url(url)
+    async with session.head(url, allow_redirects=False) as response:
+        if response.status == 404:
+            return AsyncProbe(exists=False)
+        response.raise_for_status()
+        if 300 <= response.status < 400:
+            raise ValueError(
+                f"DWD returned an unexpected redirect "
+                f"(HTTP {response.status}) for {url!r}"
+            )
+        return AsyncProbe(
+            exists=True,
+            content_length=response.content_length,
+            last_modified=_parse_http_date(response.headers.get(hdrs.LAST_MODIFIED)),
+        )
@@ -15,11 +15,12 @@ _PROJDEF = RS_WHERE["projdef"]
 
 
 def make_odim_h5(shape=(5, 5), gain=0.001, offset=-0.001, nodata=4294967295,
-                 projdef_as_bytes=False, fill_raw=1001):
+                 projdef_as_bytes=False, fill_raw=1001, dtype=np.uint32):
     """Build a minimal ODIM_H5 file in memory matching the real DWD RS format.
 
     fill_raw=1001 → physical value 1001*0.001 + (-0.001) = 1.0 mm.
-    Cell [0, 0] is always set to nodata; cell [0, 1] to undetect (0).
+    Cell [0, 0] is always set to nodata; cell [0, 1] to undetect (0). Pass
+    ``dtype`` (and a fitting ``nodata``) for other payload types, e.g. uint16.
     Returns a rewound BytesIO ready for read_odim_composite().
     """
     buf = io.BytesIO()
@@ -56,7 +57,7 @@ def make_odim_h5(shape=(5, 5), gain=0.001, offset=-0.001, nodata=4294967295,
         dw.attrs["nodata"]   = np.float64(nodata)
         dw.attrs["undetect"] = np.float64(0.0)
 
-        raw = np.full(shape, fill_raw, dtype=np.uint32)
+        raw = np.full(shape, fill_raw, dtype=dtype)
         raw[0, 0] = nodata
         raw[0, 1] = 0  # undetect: radar scanned, no precipitation
         f.create_dataset("dataset1/data1/data", data=raw)
@@ -210,18 +211,20 @@ def make_rs_tar(ts: datetime) -> bytes:
     return buf.getvalue()
 
 
-def make_rv_tar(ts: datetime) -> bytes:
+def make_rv_tar(ts: datetime, payloads: dict[int, bytes] | None = None) -> bytes:
     """Build an in-memory RV tar with all 25 lead-time members (dummy payloads).
 
     Members are named like the real archive (``_000-hd5`` .. ``_120-hd5``);
     contents are placeholders because callers patch read_odim_composite to
-    inject the parsed values/metadata per lead.
+    inject the parsed values/metadata per lead. Pass ``payloads`` (lead minutes
+    → member bytes) to build an archive of just those real members instead.
     """
     prefix = f"composite_rv_{ts.strftime('%Y%m%d_%H%M')}"
+    if payloads is None:
+        payloads = {lead: f"{lead:03d}".encode() for lead in range(0, 121, 5)}
     buf = io.BytesIO()
     with tarfile.open(fileobj=buf, mode="w") as tf:
-        for lead in range(0, 121, 5):
-            payload = f"{lead:03d}".encode()
+        for lead, payload in payloads.items():
             info = tarfile.TarInfo(name=f"{prefix}_{lead:03d}-hd5")
             info.size = len(payload)
             tf.addfile(info, io.BytesIO(payload))
@@ -7,7 +7,9 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
-from custom_components.dwd_precipitation.const import CONF_COORDS, DOMAIN
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dwd_precipitation.const import CONF_COORDS, CONF_ZONES, DOMAIN
 
 
 # ---------------------------------------------------------------------------
@@ -155,3 +157,58 @@ async def test_flow_zero_coordinates_shows_error(hass: HomeAssistant) -> None:
 
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "coordinates_out_of_range"}
+
+
+# ===========================================================================
+# Options flow
+# ===========================================================================
+
+_ZONE = (
+    '{"type": "Feature", "properties": {"name": "%s"}, "geometry": {"type": '
+    '"Polygon", "coordinates": [[[%s, 51.0], [%s, 51.0], [%s, 51.1]]]}}'
+)
+
+
+@pytest.mark.parametrize(
+    ("zones", "valid"),
+    [
+        ("", True),
+        (_ZONE % ("Garden", 13.6, 13.9, 13.9), True),
+        ('{"type": "Point", "coordinates": [13.7, 51.0]}', False),
+        (_ZONE.replace('{"name": "%s"}', '"%s"') % ("Garden", 13.6, 13.9, 13.9), False),
+        (_ZONE % ("Atlantic", -20.0, -19.7, -19.7), False),  # off the grid
+        (  # on the RS grid, south of the RADOLAN one
+            _ZONE.replace("51.0", "46.0").replace("51.1", "46.1")
+            % ("Ticino", 9.0, 9.3, 9.3),
+            False,
+        ),
+        (
+            '{"type": "FeatureCollection", "features": [%s, %s]}'
+            % (
+                _ZONE % ("Zone A", 13.6, 13.9, 13.9),
+                _ZONE % ("zone-a", 13.6, 13.9, 13.9),
+            ),
+            False,  # same entity id
+        ),
+    ],
+)
+async def test_options_flow_validates_zones(
+    hass: HomeAssistant, zones: str, valid: bool
+) -> None:
+    """Zones must be GeoJSON polygons on the grid with distinct entity ids."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"name": "Home", "latitude": 51.05, "longitude": 13.73}
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_ZONES: zones}
+    )
+
+    if valid:
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        assert result["data"][CONF_ZONES] == zones
+    else:
+        assert result["type"] is FlowResultType.FORM
+        assert result["errors"] == {CONF_ZONES: "invalid_zones"}
@@ -6,9 +6,24 @@ standing up a full HomeAssistant / DataUpdateCoordinator.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
 
-from custom_components.dwd_precipitation.products import RadolanRW, RadvorRS
+import aiohttp
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.dwd_precipitation import coordinator as coordinator_module
+from custom_components.dwd_precipitation.products import (
+    RadolanRW,
+    RadolanSFLastYesterday,
+    RadvorRS,
+)
+from custom_components.dwd_precipitation.utils import (
+    AsyncProbe,
+    ReleaseDelayEstimator,
+)
 
 UTC = timezone.utc
 
@@ -52,3 +67,145 @@ def test_data_is_stale_transitions():
     coord.curr_release = datetime(2025, 6, 1, 11, 50, tzinfo=UTC)
     assert coord._data_is_stale(datetime(2025, 6, 1, 13, 0, tzinfo=UTC)) is False
     assert coord._data_is_stale(datetime(2025, 6, 1, 13, 20, tzinfo=UTC)) is True
+
+
+def _probing_rw(probe=None, error=None) -> RadolanRW:
+    coord = RadolanRW.__new__(RadolanRW)
+    coord.async_client = object()
+    coord.async_refresh = AsyncMock()
+    coord._probe_mock = AsyncMock(return_value=probe, side_effect=error)
+    coord.retries_by_release = {}
+    coord._schedule_retry = Mock()
+    return coord
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("probe", "error", "refreshed"),
+    [
+        (AsyncProbe(exists=False), None, False),
+        (AsyncProbe(exists=True, content_length=42), None, True),
+        (None, aiohttp.ClientConnectionError("down"), True),
+    ],
+)
+async def test_fast_poll_tick_downloads_only_once_published(probe, error, refreshed):
+    """A fast-poll tick probes first; the full refresh waits for publication."""
+    coord = _probing_rw(probe, error)
+    with patch.object(coordinator_module, "async_head", coord._probe_mock):
+        await coord._async_fast_poll_tick(datetime.now(UTC))
+
+    assert coord.async_refresh.await_count == int(refreshed)
+    # Not yet published: the tick itself schedules the next retry.
+    assert coord._schedule_retry.call_count == int(not refreshed)
+    assert sum(coord.retries_by_release.values()) == 1
+    assert coord._probe_mock.await_args.args[0].startswith(
+        "https://opendata.dwd.de/weather/radar/radolan/rw/"
+    )
+
+
+@pytest.mark.asyncio
+async def test_fast_poll_follows_the_local_release_grid() -> None:
+    """A local-time product probes and counts the release its update fetches."""
+    coord = RadolanSFLastYesterday.__new__(RadolanSFLastYesterday)
+    coord.async_client = object()
+    coord.async_refresh = AsyncMock()
+    coord.retries_by_release = {}
+    coord._schedule_retry = Mock()
+    coord._fast_poll_unsub = None
+    probe = AsyncMock(return_value=AsyncProbe(exists=False))
+
+    default_zone = dt_util.get_default_time_zone()
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Berlin"))
+    try:
+        release = coord._get_latest_release(dt_util.now())
+        with patch.object(coordinator_module, "async_head", probe):
+            await coord._async_fast_poll_tick(dt_util.utcnow())
+        coord.config_entry = Mock()
+        coord._start_fast_polling()
+    finally:
+        dt_util.set_default_time_zone(default_zone)
+
+    berlin = dt_util.get_time_zone("Europe/Berlin")
+    assert release.astimezone(berlin).strftime("%H:%M") == "23:50"
+    assert probe.await_args.args[0] == coord._get_url(release)
+    assert coord.retries_by_release == {release: 1}
+    assert [c.args[0] for c in coord._schedule_retry.call_args_list] == [release] * 2
+
+
+@pytest.mark.asyncio
+async def test_probe_length_and_publication_time_reused_for_release() -> None:
+    """The probed Content-Length hints the download; Last-Modified the latency."""
+    release = datetime(2025, 6, 1, 11, 50, tzinfo=UTC)
+    published = datetime(2025, 6, 1, 12, 17, tzinfo=UTC)
+    coord = _probing_rw(
+        AsyncProbe(exists=True, content_length=42, last_modified=published)
+    )
+    coord.release_published = None
+    with patch.object(coordinator_module, "async_head", coord._probe_mock):
+        assert await coord._async_release_published(release)
+
+    assert coord.probed_length(release) == 42
+    assert coord.probed_length(release + timedelta(hours=1)) is None
+
+    coord._record_publication_latency(release)
+    assert coord.publication_latency is not None
+    assert coord.publication_latency > timedelta(0)
+
+
+def test_learned_delay_moves_latest_release_forward():
+    """RW: once DWD is seen publishing ~10 min after :50, 12:05 already sees 11:50."""
+    coord = RadolanRW.__new__(RadolanRW)
+    now = datetime(2025, 6, 1, 12, 5, tzinfo=UTC)
+    assert coord._get_latest_release(now) == datetime(2025, 6, 1, 10, 50, tzinfo=UTC)
+
+    coord._delay_estimator = ReleaseDelayEstimator(
+        RadolanRW.RELEASE_DELAY, RadolanRW.RELEASE_INTERVAL
+    )
+    coord.release_published = None
+    for hour in (8, 9, 10):
+        release = datetime(2025, 6, 1, hour, 50, tzinfo=UTC)
+        coord.release_published = release + timedelta(minutes=10)
+        coord._observe_release_delay(release)
+
+    # p90 (10 min) + margin, clamped to half the static 28 min delay
+    assert coord.effective_release_delay == timedelta(minutes=14)
+    assert coord._get_latest_release(now) == datetime(2025, 6, 1, 11, 50, tzinfo=UTC)
+    # The scheduler refreshes the next (11:50) release 14 min after it is due.
+    coord.curr_release = datetime(2025, 6, 1, 10, 50, tzinfo=UTC)
+    assert coord.learned_refresh_at() == datetime(2025, 6, 1, 12, 4, tzinfo=UTC)
+
+
+def test_retries_back_off_per_release_with_jitter():
+    """Retry waits grow per release, are capped by the interval and jittered."""
+    coord = RadvorRS.__new__(RadvorRS)
+    coord.hass = object()
+    coord.retries_by_release = {}
+    coord._retry_rng = random.Random(1)
+    release = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+
+    waits = []
+    with patch.object(
+        coordinator_module,
+        "async_call_later",
+        side_effect=lambda _hass, delay, _cb: waits.append(delay),
+    ):
+        for _ in range(6):
+            coord._schedule_retry(release)
+            coord._count_retry(release)
+
+    policy = RadvorRS.RETRY_POLICY
+    cap = policy.cap(RadvorRS.RELEASE_INTERVAL)
+    assert cap == timedelta(seconds=75)  # a quarter of the 5-minute cadence
+    assert waits[0] < waits[1] < waits[2]
+    assert all(w <= cap * (1 + policy.jitter) for w in waits)
+    assert coord.retries_by_release == {release: 6}
+
+
+def test_retry_counters_keep_recent_releases_only():
+    coord = RadvorRS.__new__(RadvorRS)
+    coord.retries_by_release = {}
+    start = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+    for n in range(RadvorRS.RETRY_HISTORY + 3):
+        coord._count_retry(start + n * RadvorRS.RELEASE_INTERVAL)
+    assert len(coord.retries_by_release) == RadvorRS.RETRY_HISTORY
+    assert min(coord.retries_by_release) == start + 3 * RadvorRS.RELEASE_INTERVAL
@@ -0,0 +1,53 @@
+"""Config-entry diagnostics — release timing per product coordinator."""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dwd_precipitation.const import DOMAIN
+from custom_components.dwd_precipitation.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.dwd_precipitation.products import (
+    HymecNG,
+    RadolanRW,
+    RadolanSF,
+    RadolanSFLastYesterday,
+    RadvorRS,
+    RadvorRV,
+)
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_report_release_timing(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with ExitStack() as stack:
+        for product in (
+            RadvorRS, RadvorRV, HymecNG, RadolanRW, RadolanSF, RadolanSFLastYesterday
+        ):
+            stack.enter_context(
+                patch.object(
+                    product, "_fetch_and_parse", new=AsyncMock(return_value=(0.0, {}))
+                )
+            )
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    rw = diagnostics["coordinators"]["rw"]
+    assert rw["release_delay_static_s"] == RadolanRW.RELEASE_DELAY.total_seconds()
+    assert rw["release_delay_learned_s"] is None  # still learning
+    assert rw["current_release"] is not None
+    assert set(diagnostics["coordinators"]) == {"rs", "rv", "hymecng", "rw", "sf", "sf_2350"}
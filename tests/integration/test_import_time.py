@@ -0,0 +1,61 @@
+"""Import-time budget — loading the integration must not import the parsers."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Seconds the integration's own modules may take to import once Home Assistant
+# itself is loaded. Well above the lazy import (~30 ms), well below an eager
+# numpy + h5py import (~160 ms).
+IMPORT_BUDGET = 0.1
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_PROBE = """
+import json, sys, time
+import homeassistant.components.binary_sensor
+import homeassistant.components.sensor
+import homeassistant.config_entries
+import homeassistant.helpers.aiohttp_client
+import homeassistant.helpers.event
+import homeassistant.helpers.restore_state
+import homeassistant.helpers.selector
+import homeassistant.helpers.storage
+import homeassistant.helpers.update_coordinator
+
+start = time.perf_counter()
+import custom_components.dwd_precipitation
+import custom_components.dwd_precipitation.binary_sensor
+import custom_components.dwd_precipitation.config_flow
+import custom_components.dwd_precipitation.diagnostics
+import custom_components.dwd_precipitation.sensor
+elapsed = time.perf_counter() - start
+
+print(json.dumps({
+    "elapsed": elapsed,
+    "heavy": [m for m in ("numpy", "h5py") if m in sys.modules],
+}))
+"""
+
+
+def _probe() -> dict:
+    """Import the integration in a fresh interpreter and report on it."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=_REPO_ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_integration_import_is_lazy_and_within_budget() -> None:
+    """numpy/h5py stay unloaded, and the import fits the budget (best of 3)."""
+    probes = [_probe() for _ in range(3)]
+
+    assert all(probe["heavy"] == [] for probe in probes)
+    assert min(probe["elapsed"] for probe in probes) < IMPORT_BUDGET
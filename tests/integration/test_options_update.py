@@ -0,0 +1,148 @@
+"""Options changes — derived options apply in place, topology changes reload."""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dwd_precipitation import products
+from custom_components.dwd_precipitation.const import DOMAIN
+from custom_components.dwd_precipitation.products import (
+    HymecNG,
+    RadolanRW,
+    RadolanSF,
+    RadolanSFLastYesterday,
+    RadvorRS,
+)
+
+TS = datetime(2026, 7, 16, 20, 30, tzinfo=timezone.utc)
+
+
+def _rv_members() -> list:
+    """RV members: dry now, 0.2 mm/5min (2.4 mm/h) from lead 30 on."""
+    members = []
+    for lead in range(0, 121, 5):
+        end = TS + timedelta(minutes=lead)
+        start = end - timedelta(minutes=5)
+        what = {
+            "startdate": start.strftime("%Y%m%d"), "starttime": start.strftime("%H%M%S"),
+            "enddate": end.strftime("%Y%m%d"), "endtime": end.strftime("%H%M%S"),
+        }
+        members.append((np.float32(0.2 if lead >= 30 else 0.0), what))
+    return members
+
+
+async def _setup(hass: HomeAssistant, stack: ExitStack) -> tuple[MockConfigEntry, AsyncMock]:
+    """Set up one entry; RV goes through its real derivation."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    extract = AsyncMock(side_effect=lambda *_: _rv_members())
+    stack.enter_context(patch.object(products, "_async_extract_release", new=extract))
+    rs_meta = [None] * 3
+    stack.enter_context(
+        patch.object(
+            RadvorRS, "_fetch_and_parse", new=AsyncMock(return_value=([0.0] * 3, rs_meta))
+        )
+    )
+    stack.enter_context(
+        patch.object(HymecNG, "_fetch_and_parse", new=AsyncMock(return_value=("rain", None)))
+    )
+    for product in (RadolanRW, RadolanSF, RadolanSFLastYesterday):
+        stack.enter_context(
+            patch.object(product, "_fetch_and_parse", new=AsyncMock(return_value=(0.0, None)))
+        )
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry, extract
+
+
+def _rain_state(hass: HomeAssistant) -> str:
+    ent_reg = er.async_get(hass)
+    rain = next(
+        e
+        for e in ent_reg.entities.values()
+        if e.unique_id.endswith("radvor_rv_precipitation_expected_120")
+    )
+    return hass.states.get(rain.entity_id).state
+
+
+@pytest.mark.asyncio
+async def test_threshold_change_rederives_rv_without_download(hass: HomeAssistant) -> None:
+    """A new threshold re-derives RV from the cached series; nothing is fetched."""
+    with ExitStack() as stack:
+        entry, extract = await _setup(hass, stack)
+        coordinators = entry.runtime_data.coordinators
+        assert coordinators["rv"].data.data["start_in"] == 25
+        assert _rain_state(hass) == "on"
+
+        with patch.object(hass.config_entries, "async_reload") as reload:
+            # 2.4 mm/h < 3.0 mm/h → the light rain no longer counts.
+            hass.config_entries.async_update_entry(
+                entry, options={"precipitation_threshold": 3.0}
+            )
+            await hass.async_block_till_done()
+
+        reload.assert_not_called()
+        assert extract.await_count == 1
+        assert coordinators["rv"].data.data["start_in"] is None
+        assert coordinators["rv"].data.data["rain_within_2h"] is False
+        assert _rain_state(hass) == "off"
+        assert entry.runtime_data.options == {"precipitation_threshold": 3.0}
+
+
+@pytest.mark.asyncio
+async def test_start_end_mode_change_reloads_entry(hass: HomeAssistant) -> None:
+    """The start/end mode selects entity classes, so it still reloads."""
+    with ExitStack() as stack:
+        entry, _extract = await _setup(hass, stack)
+
+        with patch.object(hass.config_entries, "async_reload") as reload:
+            hass.config_entries.async_update_entry(
+                entry,
+                options={"precipitation_threshold": 3.0, "start_end_mode": "duration"},
+            )
+            await hass.async_block_till_done()
+
+        reload.assert_awaited_once_with(entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_first_options_save_only_counts_changed_fields(
+    hass: HomeAssistant,
+) -> None:
+    """Saving the whole form once compares unset options as their defaults."""
+    with ExitStack() as stack:
+        entry, extract = await _setup(hass, stack)
+
+        with patch.object(hass.config_entries, "async_reload") as reload:
+            hass.config_entries.async_update_entry(
+                entry,
+                options={
+                    "extra_state_attributes": False,
+                    "unavailable_when_stale": True,
+                    "precipitation_threshold": 3.0,
+                    "start_end_mode": "timestamp",
+                    "precipitation_end_algorithm": "episode",
+                    "precipitation_reset_threshold": 1.0,
+                    "area_radius": 0.0,
+                    "zones": "",
+                },
+            )
+            await hass.async_block_till_done()
+
+        reload.assert_not_called()
+        assert extract.await_count == 1
+        assert entry.runtime_data.coordinators["rv"].data.data["start_in"] is None
@@ -5,7 +5,10 @@ Needs the ha-test dependency group installed (products.py imports HA transitivel
 
 from __future__ import annotations
 
+import asyncio
 import bz2
+import json
+import threading
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
@@ -14,17 +17,38 @@ import pytest
 
 from types import SimpleNamespace
 
-from custom_components.dwd_precipitation import products
+from custom_components.dwd_precipitation import products, radar
+from custom_components.dwd_precipitation.coordinator import CoordinatorData
 from custom_components.dwd_precipitation.products import (
     HymecNG,
     RadolanRW,
     RadvorRS,
     RadvorRV,
+    RvSeries,
 )
 from custom_components.dwd_precipitation.radar import RS_GRID_SHAPE
 from custom_components.dwd_precipitation.utils import AsyncResponse
 
-from tests.factories.odim import make_hymecng_h5, make_rs_tar, make_rv_tar
+from tests.factories.odim import (
+    make_hymecng_h5,
+    make_odim_h5,
+    make_rs_tar,
+    make_rv_tar,
+)
+
+
+def _cell_reader(reads):
+    """Adapt an iterator of full-grid (grid, what) reads to read_odim_cells.
+
+    Each call consumes the next member's grid and returns it gathered at the
+    requested cells, as the real point reader would.
+    """
+    def _read(_f, cells, **_kw):
+        grid, what = next(reads)
+        rows, cols = np.asarray(cells).reshape(-1, 2).T
+        return grid[rows, cols], what
+
+    return _read
 
 
 @pytest.mark.asyncio
@@ -48,6 +72,7 @@ async def test_rs_fetch_derives_base_source_timestamp_and_window() -> None:
     reads = iter([(grid, w) for w in whats])
 
     coord = RadvorRS.__new__(RadvorRS)
+    coord.config_entry = SimpleNamespace(options={})
     coord.async_client = object()
     coord.coords = (51.05, 13.73)
 
@@ -57,7 +82,7 @@ async def test_rs_fetch_derives_base_source_timestamp_and_window() -> None:
             "async_get",
             new=AsyncMock(return_value=AsyncResponse(content=make_rs_tar(ts))),
         ),
-        patch.object(products, "read_odim_composite", side_effect=lambda _f, **_kw: next(reads)),
+        patch.object(radar, "read_odim_cells", side_effect=_cell_reader(reads)),
     ):
         _data, meta = await coord._fetch_and_parse(ts)
 
@@ -104,7 +129,7 @@ async def test_rv_fetch_derives_buckets_and_timing() -> None:
             "async_get",
             new=AsyncMock(return_value=AsyncResponse(content=make_rv_tar(ts))),
         ),
-        patch.object(products, "read_odim_composite", side_effect=lambda _f, **_kw: next(reads)),
+        patch.object(radar, "read_odim_cells", side_effect=_cell_reader(reads)),
     ):
         data, meta = await coord._fetch_and_parse(ts)
 
@@ -164,7 +189,7 @@ async def test_rv_threshold_from_options_suppresses_light_rain() -> None:
             "async_get",
             new=AsyncMock(return_value=AsyncResponse(content=make_rv_tar(ts))),
         ),
-        patch.object(products, "read_odim_composite", side_effect=lambda _f, **_kw: next(reads)),
+        patch.object(radar, "read_odim_cells", side_effect=_cell_reader(reads)),
     ):
         data, _meta = await coord._fetch_and_parse(ts)
 
@@ -201,7 +226,7 @@ async def test_rv_threshold_is_interpreted_as_mm_per_hour() -> None:
             "async_get",
             new=AsyncMock(return_value=AsyncResponse(content=make_rv_tar(ts))),
         ),
-        patch.object(products, "read_odim_composite", side_effect=lambda _f, **_kw: next(reads)),
+        patch.object(radar, "read_odim_cells", side_effect=_cell_reader(reads)),
     ):
         data, _meta = await coord._fetch_and_parse(ts)
 
@@ -237,7 +262,7 @@ async def test_rv_end_algorithm_option_selects_clearing() -> None:
             "async_get",
             new=AsyncMock(return_value=AsyncResponse(content=make_rv_tar(ts))),
         ),
-        patch.object(products, "read_odim_composite", side_effect=lambda _f, **_kw: next(episode_reads)),
+        patch.object(radar, "read_odim_cells", side_effect=_cell_reader(episode_reads)),
     ):
         episode, _ = await coord._fetch_and_parse(ts)
     assert episode["start_in"] == 5
@@ -252,7 +277,7 @@ async def test_rv_end_algorithm_option_selects_clearing() -> None:
             "async_get",
             new=AsyncMock(return_value=AsyncResponse(content=make_rv_tar(ts))),
         ),
-        patch.object(products, "read_odim_composite", side_effect=lambda _f, **_kw: next(clearing_reads)),
+        patch.object(radar, "read_odim_cells", side_effect=_cell_reader(clearing_reads)),
     ):
         clearing, _ = await coord._fetch_and_parse(ts)
     assert clearing["start_in"] == 5
@@ -260,8 +285,58 @@ async def test_rv_end_algorithm_option_selects_clearing() -> None:
     assert clearing["end_at"] == datetime(2026, 7, 16, 21, 30, tzinfo=timezone.utc)
 
 
+@pytest.mark.asyncio
+async def test_rv_series_is_kept_compact_and_rederives_without_io() -> None:
+    """RV: the cached series recomputes start/end for other settings, no fetch."""
+    ts = datetime(2026, 7, 16, 20, 30, tzinfo=timezone.utc)
+    leads = list(range(0, 121, 5))
+    # Dry now; 0.2 mm/5min (2.4 mm/h) at lead 10, a lull, 1.0 mm/5min at lead 60.
+    values = {lead: 0.0 for lead in leads}
+    values[10] = 0.2
+    values[60] = 1.0
+    reads = iter([
+        (np.full((1200, 1100), values[lead], dtype=np.float32), _rv_what(ts, lead))
+        for lead in leads
+    ])
+
+    coord = RadvorRV.__new__(RadvorRV)
+    coord.async_client = object()
+    coord.coords = (51.05, 13.73)
+    coord.config_entry = SimpleNamespace(options={})
+
+    fetch = AsyncMock(return_value=AsyncResponse(content=make_rv_tar(ts)))
+    with (
+        patch.object(products, "async_get", new=fetch),
+        patch.object(radar, "read_odim_cells", side_effect=_cell_reader(reads)),
+    ):
+        data, _meta = await coord._fetch_and_parse(ts)
+    assert data["start_in"] == 5
+
+    series = coord.series
+    assert series.values.dtype == np.float32
+    assert series.starts.dtype == series.ends.dtype == np.int32
+    assert series.base_ts == ts
+    assert series.start(1) == ts and series.end(1) == ts + timedelta(minutes=5)
+    assert series.max_intensity([60]) == pytest.approx(12.0)
+
+    # 3 mm/h skips the light lead-10 step; clearing then ends after lead 60.
+    assert series.start_end(3.0) == (55, 60)
+    data, meta = coord.derive(threshold=3.0, end_algorithm="clearing")
+    assert data["start_in"] == 55
+    assert data["end_at"] == ts + timedelta(minutes=60)
+    assert len(meta["rain_within_2h"].samples) == 25
+    assert fetch.await_count == 1
+
+    # A missing member leaves a gap (nodata, unknown window).
+    members = [(np.float32(0.0), _rv_what(ts, lead)) for lead in leads]
+    members[3] = None
+    gappy = RvSeries.from_members(ts, members)
+    assert gappy.value_list()[3] is None
+    assert gappy.start(3) is None and gappy.end(3) is None
+
+
 def _hymecng_reader(class_value: int, nodata: int = 255, undetect: int = 254):
-    """Return a fake read_odim_classification yielding a uniform class grid."""
+    """Return a fake OdimDecoder.read_raw yielding a uniform class grid."""
     raw = np.full(RS_GRID_SHAPE, class_value, dtype=np.uint8)
     dataset_what = {
         "prodname": "HymecNG_top_view",
@@ -325,7 +400,7 @@ async def test_hymecng_class_and_sentinel_mapping(class_value, expected) -> None
             new=AsyncMock(return_value=AsyncResponse(content=b"x")),
         ),
         patch.object(
-            products, "read_odim_classification", side_effect=_hymecng_reader(class_value)
+            radar.OdimDecoder, "read_raw", side_effect=_hymecng_reader(class_value)
         ),
     ):
         data, _meta = await coord._fetch_and_parse(ts)
@@ -342,9 +417,8 @@ async def test_radolan_fetch_derives_window_from_interval() -> None:
         "datetime": datetime(2025, 6, 1, 12, 50, tzinfo=timezone.utc),
         "intervalseconds": 3600,
     }
-    grid = np.zeros((900, 900), dtype=np.float32)
-
     coord = RadolanRW.__new__(RadolanRW)
+    coord.config_entry = SimpleNamespace(options={})
     coord.async_client = object()
     coord.coords = (51.05, 13.73)
 
@@ -354,10 +428,385 @@ async def test_radolan_fetch_derives_window_from_interval() -> None:
             "async_get",
             new=AsyncMock(return_value=AsyncResponse(content=bz2.compress(b"x"))),
         ),
-        patch.object(products, "read_radolan_composite", return_value=(grid, raw)),
+        patch.object(
+            radar, "read_radolan_cells", return_value=(np.zeros(1), raw)
+        ) as reader,
     ):
         _value, meta = await coord._fetch_and_parse(ts)
 
+    assert reader.call_args.args[1] == [coord.index]
+    assert reader.call_args.kwargs["expected_shape"] == (900, 900)
+
     assert meta.source_timestamp == datetime(2025, 6, 1, 12, 50, tzinfo=timezone.utc)
     assert meta.data_end == datetime(2025, 6, 1, 12, 50, tzinfo=timezone.utc)
     assert meta.data_start == datetime(2025, 6, 1, 11, 50, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_rs_release_is_decoded_once_for_every_subscribed_location() -> None:
+    """RS: two locations share one download and one decode pass per member."""
+    ts = datetime(2026, 5, 18, 16, 0, tzinfo=timezone.utc)
+    what = {"prodname": "RS", "enddate": "20260518", "endtime": "160000"}
+    grid = np.zeros(RS_GRID_SHAPE, dtype=np.float32)
+
+    home = RadvorRS.__new__(RadvorRS)
+    home.config_entry = SimpleNamespace(options={})
+    home.async_client = object()
+    home.coords = (51.05, 13.73)
+    away = RadvorRS.__new__(RadvorRS)
+    away.config_entry = SimpleNamespace(options={})
+    away.async_client = object()
+    away.coords = (53.55, 9.99)
+    grid[home.index] = 1.5
+    grid[away.index] = 4.0
+
+    read_mock = patch.object(
+        radar,
+        "read_odim_cells",
+        side_effect=_cell_reader(iter([(grid, what)] * 3)),
+    )
+    get_mock = AsyncMock(return_value=AsyncResponse(content=make_rs_tar(ts)))
+    unsubscribes = [
+        products.RELEASE_CACHE.subscribe(RadvorRS.PRODUCT_KEY, coord)
+        for coord in (home, away)
+    ]
+    try:
+        with patch.object(products, "async_get", new=get_mock), read_mock as reader:
+            home_data, _ = await home._fetch_and_parse(ts)
+            away_data, _ = await away._fetch_and_parse(ts)
+    finally:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    assert home_data == [1.5, 1.5, 1.5]
+    assert away_data == [4.0, 4.0, 4.0]
+    # One download, and each of the three members decoded exactly once.
+    assert get_mock.await_count == 1
+    assert reader.call_count == 3
+    # Both report the time of the decode they share.
+    assert away.last_decode_seconds == home.last_decode_seconds >= 0
+
+
+@pytest.mark.asyncio
+async def test_decode_runs_off_the_event_loop() -> None:
+    """The blocking decode runs in an executor thread, and its time is recorded."""
+    ts = datetime(2026, 5, 18, 16, 5, tzinfo=timezone.utc)
+    what = {"prodname": "RS", "enddate": "20260518", "endtime": "160500"}
+    grid = np.zeros(RS_GRID_SHAPE, dtype=np.float32)
+    reader = _cell_reader(iter([(grid, what)] * 3))
+    threads: list[threading.Thread] = []
+
+    def _recording_reader(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return reader(*args, **kwargs)
+
+    coord = RadvorRS.__new__(RadvorRS)
+    coord.config_entry = SimpleNamespace(options={})
+    coord.async_client = object()
+    coord.coords = (51.05, 13.73)
+
+    with (
+        patch.object(
+            products,
+            "async_get",
+            new=AsyncMock(return_value=AsyncResponse(content=make_rs_tar(ts))),
+        ),
+        patch.object(radar, "read_odim_cells", side_effect=_recording_reader),
+    ):
+        await coord._fetch_and_parse(ts)
+
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+    assert coord.last_decode_seconds is not None
+    assert coord.last_decode_seconds >= 0
+
+
+@pytest.mark.asyncio
+async def test_rv_cube_is_built_once_per_release_and_shared() -> None:
+    """RV cube: opt-in, decoded once per release, one release held at a time."""
+    ts = datetime(2026, 7, 16, 20, 30, tzinfo=timezone.utc)
+    members = {
+        lead: make_odim_h5(
+            shape=RS_GRID_SHAPE, gain=0.01, offset=0.0, nodata=65535,
+            fill_raw=100 * (lead // 5 + 1), dtype=np.uint16,
+        ).getvalue()
+        for lead in (0, 5)
+    }
+    get_mock = AsyncMock(
+        return_value=AsyncResponse(content=make_rv_tar(ts, members))
+    )
+
+    home = RadvorRV.__new__(RadvorRV)
+    home.async_client = object()
+    home.coords = (51.05, 13.73)
+    home.curr_release = ts
+    away = RadvorRV.__new__(RadvorRV)
+    away.async_client = object()
+    away.coords = (53.55, 9.99)
+
+    try:
+        with patch.object(products, "async_get", new=get_mock):
+            cube, shared = await asyncio.gather(
+                home.async_get_cube(), away.async_get_cube(ts)
+            )
+            assert cube is shared
+            assert get_mock.await_count == 1
+
+            assert cube.raw.shape == (25, *RS_GRID_SHAPE)
+            assert cube.raw.dtype == np.uint16
+            values = cube.cells([home.index, away.index])
+            np.testing.assert_allclose(values[:2], [[1.0, 1.0], [2.0, 2.0]])
+            assert np.isnan(values[2:]).all()   # members missing from the tar
+
+            newer = ts + timedelta(minutes=5)
+            get_mock.return_value = AsyncResponse(content=make_rv_tar(newer, members))
+            replaced = await home.async_get_cube(newer)
+            assert replaced is not cube
+            assert products.RV_CUBES.release == newer
+    finally:
+        products.RV_CUBES.clear()
+
+
+@pytest.mark.asyncio
+async def test_rs_area_statistics_share_the_release_decode() -> None:
+    """RS: an area reads just its bounding box, in the same decode as the cells."""
+    ts = datetime(2026, 5, 18, 16, 10, tzinfo=timezone.utc)
+    what = {"prodname": "RS", "enddate": "20260518", "endtime": "161000"}
+    grid = np.zeros(RS_GRID_SHAPE, dtype=np.float32)
+
+    home = RadvorRS.__new__(RadvorRS)
+    home.config_entry = SimpleNamespace(options={"area_radius": 5})
+    home.async_client = object()
+    home.coords = (51.05, 13.73)
+    away = RadvorRS.__new__(RadvorRS)
+    away.config_entry = SimpleNamespace(options={})
+    away.async_client = object()
+    away.coords = (53.55, 9.99)
+
+    row, col = home.index
+    grid[row, col] = 2.0
+    grid[row + 3, col + 4] = 6.0        # 5 km away: inside the disk
+    grid[row + 5, col + 5] = 50.0       # ~7 km away: in the box, outside the disk
+    windows: list[tuple[slice, slice]] = []
+
+    def _window_reader(_f, rows, cols, **_kw):
+        windows.append((rows, cols))
+        return grid[rows, cols], what
+
+    get_mock = AsyncMock(return_value=AsyncResponse(content=make_rs_tar(ts)))
+    unsubscribes = [
+        products.RELEASE_CACHE.subscribe(RadvorRS.PRODUCT_KEY, coord)
+        for coord in (home, away)
+    ]
+    try:
+        with (
+            patch.object(products, "async_get", new=get_mock),
+            patch.object(
+                radar,
+                "read_odim_cells",
+                side_effect=_cell_reader(iter([(grid, what)] * 3)),
+            ),
+            patch.object(radar, "read_odim_window", side_effect=_window_reader),
+        ):
+            home_data, home_meta = await home._fetch_and_parse(ts)
+            away_data, _ = await away._fetch_and_parse(ts)
+    finally:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    assert get_mock.await_count == 1
+    assert windows == [(slice(row - 5, row + 6), slice(col - 5, col + 6))]
+    cells = len(home.area.cells)
+    assert home_data[:3] == [2.0, 2.0, 2.0]
+    assert home_data[3] == pytest.approx(6.0)
+    assert home_data[4] == pytest.approx(8.0 / cells)
+    assert home_data[5] == round(200 / cells, 1)
+    assert home_meta[3:] == [home_meta[0]] * 3
+    # Without an area the payload keeps its three lead times.
+    assert away.area is None and away.area_stats is None
+    assert away_data == [0.0, 0.0, 0.0]
+
+
+
+def test_rs_areas_are_reduced_from_one_window_read() -> None:
+    """RS: the member is inflated once, as the union of all areas' boxes."""
+    ts = datetime(2026, 5, 18, 16, 10, tzinfo=timezone.utc)
+    what = {"prodname": "RS", "enddate": "20260518", "endtime": "161000"}
+    grid = np.random.default_rng(4).random(RS_GRID_SHAPE, dtype=np.float32)
+    coord = RadvorRS.__new__(RadvorRS)
+    areas = [
+        radar.AreaQuery((400, 500), 5.0, RS_GRID_SHAPE),
+        radar.AreaQuery((420, 470), 3.0, RS_GRID_SHAPE),
+        radar.AreaQuery((-100, -100), 5.0, RS_GRID_SHAPE),  # off the grid
+    ]
+    windows: list[tuple[slice, slice]] = []
+
+    def _window_reader(_f, rows, cols, **_kw):
+        windows.append((rows, cols))
+        return grid[rows, cols], what
+
+    with patch.object(radar, "read_odim_window", side_effect=_window_reader):
+        stats = coord._extract_areas(make_rs_tar(ts), ts, areas)
+
+    assert windows == [(slice(395, 424), slice(467, 506))]
+    assert stats[:2] == [area.reduce(grid[area.rows, area.cols]) for area in areas[:2]]
+    assert stats[2] == radar.AreaStats(None, None, None, 0)
+
+def test_rs_restore_rejects_payloads_of_the_other_area_setting() -> None:
+    """A persisted payload without area items is refetched once areas are on."""
+    coord = RadvorRS.__new__(RadvorRS)
+    coord.config_entry = SimpleNamespace(options={"area_radius": 5})
+    coord.coords = (51.05, 13.73)
+    release = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+    assert not coord.restore(release, CoordinatorData([1.0, 1.0, 1.0], [None] * 3))
+    assert coord.restore(release, CoordinatorData([1.0] * 6, [None] * 6))
+
+
+_ZONES = json.dumps(
+    {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"name": "Dresden"},
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [[13.6, 51.0], [13.9, 51.0], [13.9, 51.1], [13.6, 51.1]]
+                    ],
+                },
+            }
+        ],
+    }
+)
+
+
+@pytest.mark.asyncio
+async def test_radolan_zones_share_the_release_decode_and_index() -> None:
+    """RADOLAN: zone cells join the batch read; locations share one zone index."""
+    ts = datetime(2025, 6, 1, 12, 50, tzinfo=timezone.utc)
+    raw = {"producttype": "RW", "datetime": ts, "intervalseconds": 3600}
+    grid = np.random.default_rng(3).random((900, 900), dtype=np.float32)
+
+    home = RadolanRW.__new__(RadolanRW)
+    home.config_entry = SimpleNamespace(options={"zones": _ZONES})
+    home.async_client = object()
+    home.coords = (51.05, 13.73)
+    away = RadolanRW.__new__(RadolanRW)
+    away.config_entry = SimpleNamespace(options={"zones": _ZONES})
+    away.async_client = object()
+    away.coords = (53.55, 9.99)
+    assert home.zones is away.zones
+
+    def _read(_f, cells, **_kw):
+        rows, cols = np.asarray(cells).reshape(-1, 2).T
+        return grid[rows, cols], raw
+
+    get_mock = AsyncMock(return_value=AsyncResponse(content=bz2.compress(b"x")))
+    unsubscribes = [
+        products.RELEASE_CACHE.subscribe(RadolanRW.PRODUCT_KEY, coord)
+        for coord in (home, away)
+    ]
+    try:
+        with (
+            patch.object(products, "async_get", new=get_mock),
+            patch.object(radar, "read_radolan_cells", side_effect=_read) as reader,
+        ):
+            home_value, _ = await home._fetch_and_parse(ts)
+            away_value, _ = await away._fetch_and_parse(ts)
+    finally:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    assert get_mock.await_count == 1
+    assert reader.call_count == 1
+    assert set(home.zones.cells) <= set(reader.call_args.args[1])
+    assert home_value == pytest.approx(grid[home.index])
+    assert away_value == pytest.approx(grid[away.index])
+    expected = home.zones.reduce(grid)
+    assert home.zone_values == away.zone_values == pytest.approx(expected)
+
+
+
+@pytest.mark.asyncio
+async def test_radolan_zones_leave_out_nodata_cells() -> None:
+    """RADOLAN: cells flagged as nodata do not count into the zone means."""
+    ts = datetime(2025, 6, 1, 13, 50, tzinfo=timezone.utc)
+    raw = {
+        "producttype": "RW",
+        "datetime": ts,
+        "intervalseconds": 3600,
+        "nodataflag": -9999,
+    }
+    grid = np.full((900, 900), 2.0, dtype=np.float32)
+
+    coord = RadolanRW.__new__(RadolanRW)
+    coord.config_entry = SimpleNamespace(options={"zones": _ZONES})
+    coord.async_client = object()
+    coord.coords = (51.05, 13.73)
+    rows, cols = np.divmod(coord.zones.flat, 900)
+    grid[rows[: len(rows) // 2], cols[: len(cols) // 2]] = -9999
+
+    def _read(_f, cells, **_kw):
+        rows, cols = np.asarray(cells).reshape(-1, 2).T
+        return grid[rows, cols], raw
+
+    unsubscribe = products.RELEASE_CACHE.subscribe(RadolanRW.PRODUCT_KEY, coord)
+    try:
+        with (
+            patch.object(
+                products,
+                "async_get",
+                new=AsyncMock(return_value=AsyncResponse(content=bz2.compress(b"x"))),
+            ),
+            patch.object(radar, "read_radolan_cells", side_effect=_read),
+        ):
+            await coord._fetch_and_parse(ts)
+    finally:
+        unsubscribe()
+
+    assert coord.zone_values == {"Dresden": pytest.approx(2.0)}
+
+def test_restore_rejects_payloads_of_other_zones() -> None:
+    """A persisted payload is refetched when the configured zones changed."""
+    coord = RadolanRW.__new__(RadolanRW)
+    coord.config_entry = SimpleNamespace(options={"zones": _ZONES})
+    coord.coords = (51.05, 13.73)
+    release = datetime.now(timezone.utc) + timedelta(hours=2)
+
+    assert not coord.restore(release, CoordinatorData(1.0, None))
+    assert not coord.restore(release, CoordinatorData(1.0, None, {"Other": 1.0}))
+    assert coord.restore(release, CoordinatorData(1.0, None, {"Dresden": 1.0}))
+
+
+def test_rv_restore_rebuilds_the_series_for_option_changes() -> None:
+    """A warm-restored RV payload re-derives on an option change, like a fetch."""
+    release = datetime.now(timezone.utc) + timedelta(minutes=5)
+    leads = list(range(0, 121, 5))
+    values = {lead: 0.0 for lead in leads}
+    values[10] = 0.2
+    values[60] = 1.0
+    members = [(np.float32(values[lead]), _rv_what(release, lead)) for lead in leads]
+    members[3] = None
+
+    fetched = RadvorRV.__new__(RadvorRV)
+    fetched.config_entry = SimpleNamespace(options={})
+    fetched.series = RvSeries.from_members(release, members)
+    data, meta = fetched.derive()
+
+    coord = RadvorRV.__new__(RadvorRV)
+    coord.config_entry = SimpleNamespace(options={})
+    coord.async_update_listeners = lambda: None
+    assert coord.restore(release, CoordinatorData(data, meta))
+    np.testing.assert_array_equal(coord.series.values, fetched.series.values)
+    np.testing.assert_array_equal(coord.series.starts, fetched.series.starts)
+    np.testing.assert_array_equal(coord.series.ends, fetched.series.ends)
+
+    coord.config_entry.options = {
+        "precipitation_threshold": 3.0,
+        "precipitation_end_algorithm": "clearing",
+    }
+    coord.async_apply_options()
+    assert coord.data.data["start_in"] == 55
+    assert coord.data.data["end_at"] == release + timedelta(minutes=60)
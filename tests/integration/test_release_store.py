@@ -0,0 +1,255 @@
+"""Persistent release store — warm restarts populate coordinators from disk."""
+
+from __future__ import annotations
+
+import hashlib
+from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.dwd_precipitation.const import DOMAIN
+from custom_components.dwd_precipitation.coordinator import ProductMetadata
+from custom_components.dwd_precipitation.products import (
+    HymecNG,
+    RadolanRW,
+    RadolanSF,
+    RadolanSFLastYesterday,
+    RadvorRS,
+    RadvorRV,
+)
+from custom_components.dwd_precipitation.release_store import (
+    MAX_RECORD_AGE,
+    SAVE_DELAY,
+    STORAGE_KEY,
+    _decode,
+    _encode,
+)
+
+NOW = datetime(2026, 7, 16, 20, 37, 30, tzinfo=timezone.utc)
+
+_ALL_PRODUCTS = (RadvorRS, RadvorRV, HymecNG, RadolanRW, RadolanSF, RadolanSFLastYesterday)
+
+
+def _entry(hass: HomeAssistant, options: dict[str, Any] | None = None) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id="home",
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options=options or {},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _patch_fetches(stack: ExitStack) -> dict[type, AsyncMock]:
+    fetches = {}
+    for product in _ALL_PRODUCTS:
+        fetches[product] = AsyncMock(return_value=(1.5, ProductMetadata("X", NOW)))
+        stack.enter_context(
+            patch.object(product, "_fetch_and_parse", new=fetches[product])
+        )
+    # Entities are not under test; keep the payloads free-form.
+    stack.enter_context(patch("custom_components.dwd_precipitation.PLATFORMS", []))
+    return fetches
+
+
+def _latest(product) -> datetime:
+    coord = product.__new__(product)
+    now = dt_util.now() if product.USE_LOCAL_TIME else dt_util.utcnow()
+    return coord._get_latest_release(now)
+
+
+def test_payload_roundtrip() -> None:
+    """RV-style dicts, RS-style lists and metadata survive the JSON encoding."""
+    ts = datetime(2026, 7, 16, 20, 30, tzinfo=timezone.utc)
+    meta = ProductMetadata(
+        "RV", ts, lead_time_minutes=60, data_start=ts, samples=[{"lead": 0, "value": 0.5}]
+    )
+    payload = {"start_at": ts, "start_in": 25, "rain_within_2h": True, "max_060": None}
+
+    assert _decode(_encode(payload)) == payload
+    assert _decode(_encode({"max_060": meta})) == {"max_060": meta}
+    assert _decode(_encode([meta, None])) == [meta, None]
+
+
+@pytest.mark.asyncio
+async def test_current_release_is_restored_without_download(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """A restart with current records skips those downloads; stale ones refetch."""
+    freezer.move_to(NOW)
+    stored_meta = ProductMetadata("RW", NOW - timedelta(minutes=47))
+    records = {}
+    for product in _ALL_PRODUCTS:
+        release = _latest(product)
+        if product is RadvorRS:
+            release -= product.RELEASE_INTERVAL  # an older release: refetched
+        records[f"home_{product.PRODUCT_KEY}"] = {
+            "release": release.isoformat(),
+            "saved": NOW.isoformat(),
+            "data": _encode(4.2),
+            "metadata": _encode(stored_meta),
+        }
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {"records": records},
+    }
+    entry = _entry(hass)
+
+    with ExitStack() as stack:
+        fetches = _patch_fetches(stack)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinators = entry.runtime_data.coordinators
+    fetches[RadvorRS].assert_awaited_once()
+    for product in _ALL_PRODUCTS[1:]:
+        fetches[product].assert_not_awaited()
+    assert coordinators["rw"].data.data == 4.2
+    assert coordinators["rw"].data.metadata == stored_meta
+    assert coordinators["rw"].curr_release == _latest(RadolanRW)
+
+    # The refetched RS release replaces its record on the next delayed save.
+    freezer.tick(timedelta(seconds=SAVE_DELAY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    saved = hass_storage[STORAGE_KEY]["data"]["records"]
+    assert saved["home_rs"]["release"] == _latest(RadvorRS).isoformat()
+    assert saved["home_rs"]["data"] == 1.5
+
+
+@pytest.mark.parametrize(("saved_radius", "refetched"), [(20.0, False), (5.0, True)])
+@pytest.mark.asyncio
+async def test_rs_record_of_another_area_radius_is_refetched(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    saved_radius: float,
+    refetched: bool,
+) -> None:
+    """Area statistics saved for another radius are not restored."""
+    freezer.move_to(NOW)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "records": {
+                "home_rs": {
+                    "release": _latest(RadvorRS).isoformat(),
+                    "saved": NOW.isoformat(),
+                    "data": [1.0] * 6,
+                    "metadata": [None] * 6,
+                    "settings": {"area_radius": saved_radius},
+                }
+            }
+        },
+    }
+    entry = _entry(hass, {"area_radius": 20})
+
+    with ExitStack() as stack:
+        fetches = _patch_fetches(stack)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert fetches[RadvorRS].await_count == int(refetched)
+    assert entry.runtime_data.coordinators["rs"].payload_settings() == {
+        "area_radius": 20.0
+    }
+
+
+def _garden(lon0: float) -> str:
+    return (
+        '{"type": "Feature", "properties": {"name": "Garden"}, "geometry": '
+        '{"type": "Polygon", "coordinates": [[[%s, 51.0], [%s, 51.0], [%s, 51.1]]]}}'
+        % (lon0, lon0 + 0.3, lon0 + 0.3)
+    )
+
+
+@pytest.mark.parametrize(("saved_zones", "refetched"), [(13.6, False), (12.0, True)])
+@pytest.mark.asyncio
+async def test_record_of_a_redrawn_zone_is_refetched(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    saved_zones: float,
+    refetched: bool,
+) -> None:
+    """Zone means saved for another polygon of the same name are not restored."""
+    freezer.move_to(NOW)
+    saved = _garden(saved_zones)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "records": {
+                "home_sf_2350": {
+                    "release": _latest(RadolanSFLastYesterday).isoformat(),
+                    "saved": NOW.isoformat(),
+                    "data": 4.2,
+                    "metadata": None,
+                    "zones": {"Garden": 7.7},
+                    "settings": {"zones": hashlib.sha256(saved.encode()).hexdigest()},
+                }
+            }
+        },
+    }
+    entry = _entry(hass, {"zones": _garden(13.6)})
+
+    with ExitStack() as stack:
+        fetches = _patch_fetches(stack)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert fetches[RadolanSFLastYesterday].await_count == int(refetched)
+
+
+@pytest.mark.asyncio
+async def test_records_are_evicted_by_age_and_on_entry_removal(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Old records are dropped on load; removing the entry drops its records."""
+    freezer.move_to(NOW)
+    old = (NOW - MAX_RECORD_AGE - timedelta(minutes=1)).isoformat()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "records": {
+                "gone_rw": {"release": old, "saved": old, "data": 0.0, "metadata": None}
+            }
+        },
+    }
+    entry = _entry(hass)
+
+    with ExitStack() as stack:
+        _patch_fetches(stack)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(seconds=SAVE_DELAY + 1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    saved = hass_storage[STORAGE_KEY]["data"]["records"]
+    assert "gone_rw" not in saved
+    assert len(saved) == len(_ALL_PRODUCTS)
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    freezer.tick(timedelta(seconds=SAVE_DELAY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"]["records"] == {}
@@ -0,0 +1,190 @@
+"""Shared release scheduler — one set of time trackers per schedule, all entries."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import ExitStack
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dwd_precipitation.const import DOMAIN
+from custom_components.dwd_precipitation.products import (
+    HymecNG,
+    RadolanRW,
+    RadolanSF,
+    RadolanSFLastYesterday,
+    RadvorRS,
+    RadvorRV,
+)
+from custom_components.dwd_precipitation.scheduler import (
+    ReleaseScheduler,
+    async_get_scheduler,
+    schedule_key,
+)
+
+_ALL_PRODUCTS = (RadvorRS, RadvorRV, HymecNG, RadolanRW, RadolanSF, RadolanSFLastYesterday)
+
+
+def _entry(hass: HomeAssistant, name: str, lat: float, lon: float) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": name, "latitude": lat, "longitude": lon},
+        options={},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _coordinator(product):
+    coord = product.__new__(product)
+    coord.async_refresh = AsyncMock()
+    coord.name = product.__name__
+    return coord
+
+
+@pytest.mark.asyncio
+async def test_entries_share_one_tracker_set_per_schedule(hass: HomeAssistant) -> None:
+    """Two entries register exactly the trackers one entry would need."""
+    first = _entry(hass, "Home", 51.05, 13.73)
+    second = _entry(hass, "Work", 52.52, 13.40)
+
+    with (
+        patch(
+            "custom_components.dwd_precipitation.scheduler.async_track_utc_time_change",
+            return_value=MagicMock(),
+        ) as track,
+        patch("custom_components.dwd_precipitation.PLATFORMS", []),
+        ExitStack() as stack,
+    ):
+        for product in _ALL_PRODUCTS:
+            stack.enter_context(
+                patch.object(
+                    product, "_fetch_and_parse", new=AsyncMock(return_value=(0.0, {}))
+                )
+            )
+        # Setting up the integration loads both entries.
+        assert await hass.config_entries.async_setup(first.entry_id)
+        await hass.async_block_till_done()
+    assert second.runtime_data.coordinators
+
+    # RS+RV, HymecNG, RW+SF and SF 23:50 → four distinct schedules.
+    schedules = async_get_scheduler(hass).schedules
+    assert len(schedules) == 4
+    one_per_schedule = (RadvorRS, HymecNG, RadolanRW, RadolanSFLastYesterday)
+    trackers = sum(len(p.__new__(p).track_time_change_args) for p in one_per_schedule)
+    assert track.call_count == trackers
+    assert all(len(members) % 2 == 0 for members in schedules.values())
+    assert len(schedules[schedule_key(RadvorRS.__new__(RadvorRS))]) == 4
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    assert len(async_get_scheduler(hass).schedules) == 4
+    track.return_value.assert_not_called()
+
+    assert await hass.config_entries.async_unload(second.entry_id)
+    assert async_get_scheduler(hass).schedules == {}
+    assert track.return_value.call_count == trackers
+
+
+@pytest.mark.asyncio
+async def test_schedule_fires_refresh_all_members_concurrently(
+    hass: HomeAssistant,
+) -> None:
+    """One firing refreshes every coordinator on the schedule in one pass."""
+    scheduler = ReleaseScheduler(hass)
+    in_flight = 0
+    peak = 0
+
+    async def _refresh() -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    rs, rv, hymec = (_coordinator(p) for p in (RadvorRS, RadvorRV, HymecNG))
+    rs.async_refresh.side_effect = _refresh
+    rv.async_refresh.side_effect = _refresh
+
+    with patch(
+        "custom_components.dwd_precipitation.scheduler.async_track_utc_time_change",
+        return_value=MagicMock(),
+    ) as track:
+        for coord in (rs, rv, hymec):
+            scheduler.async_add(coord)
+
+    # RS and RV share a schedule; HymecNG has its own.
+    assert track.call_count == 2
+    assert schedule_key(rs) == schedule_key(rv) != schedule_key(hymec)
+
+    refresh = track.call_args_list[0].args[1]
+    await refresh(None)
+
+    assert rs.async_refresh.await_count == 1
+    assert rv.async_refresh.await_count == 1
+    hymec.async_refresh.assert_not_awaited()
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_refresh_does_not_block_schedule(hass: HomeAssistant) -> None:
+    """A raising coordinator is logged; the others on its schedule still refresh."""
+    scheduler = ReleaseScheduler(hass)
+    rw, sf = _coordinator(RadolanRW), _coordinator(RadolanSF)
+    rw.async_refresh.side_effect = RuntimeError("boom")
+
+    with patch(
+        "custom_components.dwd_precipitation.scheduler.async_track_utc_time_change",
+        return_value=MagicMock(),
+    ):
+        remove_rw = scheduler.async_add(rw)
+        scheduler.async_add(sf)
+
+    key = (timedelta(hours=1), timedelta(minutes=28), timedelta(minutes=50))
+    await scheduler.async_refresh_schedule(key)
+    sf.async_refresh.assert_awaited_once()
+
+    remove_rw()
+    assert scheduler.schedules == {key: [sf]}
+
+
+@pytest.mark.asyncio
+async def test_learned_delay_refreshes_each_schedule_once(hass: HomeAssistant) -> None:
+    """Learned-delay refreshes are one timer per schedule, not per coordinator."""
+    scheduler = ReleaseScheduler(hass)
+    due = dt_util.utcnow() + timedelta(minutes=3)
+    rs, rv, hymec = (_coordinator(p) for p in (RadvorRS, RadvorRV, HymecNG))
+    rs.learned_refresh_at = MagicMock(return_value=due)
+    rv.learned_refresh_at = MagicMock(return_value=due + timedelta(seconds=20))
+    hymec.learned_refresh_at = MagicMock(return_value=None)
+
+    with (
+        patch(
+            "custom_components.dwd_precipitation.scheduler.async_track_utc_time_change",
+            return_value=MagicMock(),
+        ),
+        patch(
+            "custom_components.dwd_precipitation.scheduler.async_track_point_in_utc_time",
+            return_value=MagicMock(),
+        ) as track_point,
+    ):
+        removes = [scheduler.async_add(coord) for coord in (rs, rv, hymec)]
+        # Re-armed as RV joins: the latest learned time of the group wins.
+        assert track_point.call_count == 2
+        assert track_point.call_args.args[2] == due + timedelta(seconds=20)
+        track_point.return_value.assert_called_once()
+
+        await track_point.call_args.args[1](None)
+
+    assert rs.async_refresh.await_count == rv.async_refresh.await_count == 1
+    hymec.async_refresh.assert_not_awaited()
+    # The pass re-armed the group's single timer.
+    assert track_point.call_count == 3
+
+    for remove in removes:
+        remove()
+    assert track_point.return_value.call_count == 2
@@ -10,10 +10,15 @@ Run with:
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from functools import cached_property
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from pytest import approx
@@ -22,6 +27,8 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.dwd_precipitation.const import DOMAIN
 from custom_components.dwd_precipitation.coordinator import ProductMetadata
 from custom_components.dwd_precipitation.products import (
+    RELEASE_CACHE,
+    RV_CUBES,
     HymecNG,
     RadolanRW,
     RadolanSF,
@@ -156,3 +163,252 @@ async def test_entry_setup_creates_sensors_with_correct_values(
     state = hass.states.get(hymec_entry.entity_id)
     assert state is not None
     assert state.state == "snow"
+
+
+_ALL_PRODUCTS = (RadvorRS, RadvorRV, HymecNG, RadolanRW, RadolanSF, RadolanSFLastYesterday)
+
+
+@pytest.mark.asyncio
+async def test_first_refreshes_run_concurrently_within_limit(hass: HomeAssistant) -> None:
+    """All six first refreshes overlap, but never more than the configured limit."""
+    in_flight = 0
+    peak = 0
+
+    async def _fetch(*_args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 0.0, {}
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.dwd_precipitation.MAX_CONCURRENT_FIRST_REFRESHES", 4
+        ),
+        ExitStack() as stack,
+    ):
+        for product in _ALL_PRODUCTS:
+            stack.enter_context(
+                patch.object(product, "_fetch_and_parse", new=AsyncMock(side_effect=_fetch))
+            )
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert peak == 4
+    assert len(entry.runtime_data.coordinators) == len(_ALL_PRODUCTS)
+
+
+@pytest.mark.asyncio
+async def test_coordinators_subscribe_with_resolved_grid_cells(
+    hass: HomeAssistant,
+) -> None:
+    """A shared fetch never has to resolve a subscriber's cells on the loop."""
+    subscribe = RELEASE_CACHE.subscribe
+    resolved = []
+
+    def _subscribe(key, coordinator):
+        lazy = [
+            name
+            for name in ("index", "area", "zones")
+            if isinstance(getattr(type(coordinator), name, None), cached_property)
+        ]
+        resolved.append(all(name in vars(coordinator) for name in lazy))
+        return subscribe(key, coordinator)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with ExitStack() as stack:
+        for product in _ALL_PRODUCTS:
+            stack.enter_context(
+                patch.object(
+                    product, "_fetch_and_parse", new=AsyncMock(return_value=(0.0, {}))
+                )
+            )
+        stack.enter_context(patch("custom_components.dwd_precipitation.PLATFORMS", []))
+        stack.enter_context(
+            patch.object(RELEASE_CACHE, "subscribe", side_effect=_subscribe)
+        )
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert resolved == [True] * len(_ALL_PRODUCTS)
+
+
+@pytest.mark.asyncio
+async def test_failed_first_refresh_retries_setup(hass: HomeAssistant) -> None:
+    """One failing first refresh still fails the whole setup (retry later)."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with ExitStack() as stack:
+        for product in _ALL_PRODUCTS:
+            fetch = AsyncMock(return_value=(0.0, {}))
+            if product is RadolanRW:
+                fetch = AsyncMock(side_effect=OSError("boom"))
+            stack.enter_context(patch.object(product, "_fetch_and_parse", new=fetch))
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+
+@pytest.mark.asyncio
+async def test_unloading_the_last_entry_drops_the_rv_cube(hass: HomeAssistant) -> None:
+    """A forecast cube built on request does not outlive the entries using RV."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={},
+    )
+    entry.add_to_hass(hass)
+
+    with ExitStack() as stack:
+        for product in _ALL_PRODUCTS:
+            stack.enter_context(
+                patch.object(
+                    product, "_fetch_and_parse", new=AsyncMock(return_value=(0.0, {}))
+                )
+            )
+        stack.enter_context(patch("custom_components.dwd_precipitation.PLATFORMS", []))
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        release = datetime(2026, 7, 16, 20, 30, tzinfo=timezone.utc)
+        cube = object()
+        assert await RV_CUBES.async_get(release, AsyncMock(return_value=cube)) is cube
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert RV_CUBES.release is None
+
+
+@pytest.mark.asyncio
+async def test_area_radius_option_adds_area_sensors(hass: HomeAssistant) -> None:
+    """The area sensors exist only with a radius and read RS items 3-5."""
+    ts = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+    meta = ProductMetadata(source_product="RS", source_timestamp=ts)
+    rs_data = [1.5, 2.0, 0.0, 6.5, 0.8, 42.0]
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={"area_radius": 10},
+    )
+    entry.add_to_hass(hass)
+
+    with ExitStack() as stack:
+        for product in _ALL_PRODUCTS[1:]:
+            stack.enter_context(
+                patch.object(
+                    product, "_fetch_and_parse", new=AsyncMock(return_value=(0.0, {}))
+                )
+            )
+        stack.enter_context(
+            patch.object(
+                RadvorRS,
+                "_fetch_and_parse",
+                new=AsyncMock(return_value=(rs_data, [meta] * 6)),
+            )
+        )
+        stack.enter_context(
+            patch(
+                "custom_components.dwd_precipitation.PLATFORMS", [Platform.SENSOR]
+            )
+        )
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.runtime_data.coordinators["rs"].area.radius_km == 10.0
+    ent_reg = er.async_get(hass)
+    states = {
+        e.unique_id.rsplit("_", 2)[-1]: hass.states.get(e.entity_id).state
+        for e in ent_reg.entities.values()
+        if "_area_" in e.unique_id
+    }
+    assert states == {"max": "6.5", "mean": "0.8", "coverage": "42.0"}
+
+
+@pytest.mark.asyncio
+async def test_zones_option_adds_a_sensor_per_zone_and_product(
+    hass: HomeAssistant,
+) -> None:
+    """Each zone gets a mean sensor per product, named after the zone."""
+    ts = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+    meta = ProductMetadata(source_product="RW", source_timestamp=ts)
+    zones = (
+        '{"type": "Feature", "properties": {"name": "Elbe Valley"}, "geometry": '
+        '{"type": "Polygon", "coordinates": '
+        '[[[13.6, 51.0], [13.9, 51.0], [13.9, 51.1], [13.6, 51.1]]]}}'
+    )
+
+    async def _rw_fetch(self, _ts):
+        self.zone_values = {"Elbe Valley": 3.25}
+        return 1.0, meta
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Home", "latitude": 51.05, "longitude": 13.73},
+        options={"zones": zones},
+    )
+    entry.add_to_hass(hass)
+
+    with ExitStack() as stack:
+        for product in (RadvorRV, HymecNG, RadolanSF, RadolanSFLastYesterday):
+            stack.enter_context(
+                patch.object(
+                    product, "_fetch_and_parse", new=AsyncMock(return_value=(0.0, {}))
+                )
+            )
+        stack.enter_context(
+            patch.object(
+                RadvorRS,
+                "_fetch_and_parse",
+                new=AsyncMock(return_value=([0.0] * 3, [meta] * 3)),
+            )
+        )
+        stack.enter_context(patch.object(RadolanRW, "_fetch_and_parse", new=_rw_fetch))
+        stack.enter_context(
+            patch(
+                "custom_components.dwd_precipitation.PLATFORMS", [Platform.SENSOR]
+            )
+        )
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    coordinators = entry.runtime_data.coordinators
+    assert coordinators["rw"].zones is coordinators["sf"].zones
+    assert coordinators["rv"].zones is None
+
+    ent_reg = er.async_get(hass)
+    zone_entities = {
+        e.unique_id.split("_", 1)[1]: e.entity_id
+        for e in ent_reg.entities.values()
+        if "_zone_" in e.unique_id
+    }
+    assert sorted(zone_entities) == [
+        "zone_elbe_valley_radolan_rw",
+        "zone_elbe_valley_radolan_sf",
+        "zone_elbe_valley_radolan_sf_yesterday",
+        "zone_elbe_valley_radvor_rs_000",
+    ]
+    state = hass.states.get(zone_entities["zone_elbe_valley_radolan_rw"])
+    assert state.state == "3.25"
+    assert state.name.endswith(" Elbe Valley precipitation last 1h")
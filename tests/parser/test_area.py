@@ -0,0 +1,77 @@
+"""Parser unit tests for radar/area.py — disk masks and area reductions."""
+
+import numpy as np
+import pytest
+
+from radar.area import AreaQuery, AreaStats, disk_offsets
+
+
+def test_disk_offsets_cover_the_cells_within_the_radius():
+    drow, dcol = disk_offsets(0.0)
+    assert drow.tolist() == dcol.tolist() == [0]
+
+    drow, dcol = disk_offsets(1.0)
+    assert sorted(zip(drow.tolist(), dcol.tolist())) == [
+        (-1, 0), (0, -1), (0, 0), (0, 1), (1, 0)
+    ]
+    drow, dcol = disk_offsets(10.0)
+    assert len(drow) == 317  # cells of a 1 km grid with centres within 10 km
+    assert np.all(drow ** 2 + dcol ** 2 <= 100)
+    assert not drow.flags.writeable
+
+
+def test_disk_offsets_follow_the_grid_spacing():
+    drow, dcol = disk_offsets(2.0, xscale=1000.0, yscale=2000.0)
+    assert drow.min() == -1 and drow.max() == 1
+    assert dcol.min() == -2 and dcol.max() == 2
+
+
+def test_query_window_is_the_disk_bounding_box():
+    area = AreaQuery((50, 60), 3.0, (100, 100))
+
+    assert (area.rows, area.cols) == (slice(47, 54), slice(57, 64))
+    assert area.mask.shape == (7, 7)
+    assert area.mask.sum() == len(area.cells) == len(disk_offsets(3.0)[0])
+    assert area.mask[3, 3] and not area.mask[0, 0]
+    assert (50, 60) in area.cells
+
+
+def test_query_is_clipped_to_the_grid():
+    area = AreaQuery((0, 1), 2.0, (10, 10))
+
+    assert (area.rows, area.cols) == (slice(0, 3), slice(0, 4))
+    assert all(0 <= r < 10 and 0 <= c < 10 for r, c in area.cells)
+    assert area.mask.sum() == len(area.cells)
+
+
+def test_reduce_matches_a_brute_force_over_the_disk():
+    grid = np.random.default_rng(1).random((40, 40), dtype=np.float32)
+    grid[grid < 0.3] = 0.0
+    grid[5:8, 5:8] = np.nan  # nodata in part of the disk
+    area = AreaQuery((8, 10), 6.0, grid.shape)
+
+    stats = area.reduce(grid[area.rows, area.cols])
+
+    values = np.array([grid[r, c] for r, c in area.cells])
+    values = values[~np.isnan(values)]
+    assert stats.cells == len(values)
+    assert stats.maximum == pytest.approx(values.max())
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.coverage == pytest.approx(np.mean(values > 0))
+
+
+def test_reduce_without_valid_cells_and_shape_mismatch():
+    area = AreaQuery((5, 5), 1.0, (10, 10))
+    window = np.full(area.mask.shape, np.nan, dtype=np.float32)
+
+    assert area.reduce(window) == AreaStats(None, None, None, 0)
+    with pytest.raises(ValueError, match="bounding box"):
+        area.reduce(np.zeros((2, 2), dtype=np.float32))
+
+
+def test_equal_queries_hash_equal():
+    first = AreaQuery((5, 5), 2.0, (10, 10))
+    first.mask  # noqa: B018 - derived arrays do not take part in equality
+    assert first == AreaQuery((5, 5), 2.0, (10, 10))
+    other = AreaQuery((5, 6), 2.0, (10, 10))
+    assert len({first, AreaQuery((5, 5), 2.0, (10, 10)), other}) == 2
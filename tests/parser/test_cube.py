@@ -0,0 +1,81 @@
+"""Parser unit tests for radar/cube.py — the full-grid forecast cube."""
+
+import io
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from radar.cube import read_odim_cube
+from radar.odim import read_odim_composite
+
+from tests.factories.odim import make_odim_h5, make_rv_tar
+
+TS = datetime(2026, 7, 16, 20, 30, tzinfo=timezone.utc)
+SHAPE = (6, 5)
+PREFIX = "composite_rv_20260716_2030"
+
+
+def _member(fill_raw: int, gain: float = 0.01) -> bytes:
+    return make_odim_h5(
+        shape=SHAPE, gain=gain, offset=0.0, nodata=65535, fill_raw=fill_raw,
+        dtype=np.uint16,
+    ).getvalue()
+
+
+def _names(leads) -> list[str]:
+    return [f"{PREFIX}_{lead:03d}-hd5" for lead in leads]
+
+
+def test_cube_keeps_raw_counts_and_scales_each_lead_lazily():
+    """Each lead decodes exactly like a single-grid read, with its own gain."""
+    members = {0: _member(100), 5: _member(300, gain=0.1), 10: _member(50)}
+    cube = read_odim_cube(make_rv_tar(TS, members), _names(members), shape=SHAPE)
+
+    assert len(cube) == 3
+    assert cube.shape == SHAPE
+    assert cube.raw.dtype == np.uint16
+    assert not cube.raw.flags.writeable
+    assert cube.nbytes < 3 * SHAPE[0] * SHAPE[1] * 4  # below a float32 stack
+    for lead, payload in enumerate(members.values()):
+        expected, expected_what = read_odim_composite(io.BytesIO(payload))
+        np.testing.assert_array_equal(cube.lead(lead), expected)
+        assert cube.dataset_what[lead] == expected_what
+    assert cube.lead(1)[5, 4] == pytest.approx(30.0)
+
+
+def test_cube_window_and_cell_access():
+    members = {0: _member(100), 5: _member(200)}
+    cube = read_odim_cube(make_rv_tar(TS, members), _names(members), shape=SHAPE)
+
+    window = cube.window(1, slice(0, 2), slice(0, 3))
+    np.testing.assert_array_equal(window, cube.lead(1)[0:2, 0:3])
+
+    values = cube.cells([(5, 4), (0, 0), (0, 1)])
+    assert values.shape == (2, 3)
+    np.testing.assert_allclose(values[:, 0], [1.0, 2.0])
+    assert np.isnan(values[:, 1]).all()   # nodata
+    assert (values[:, 2] == 0.0).all()    # undetect
+
+    out = np.empty(SHAPE, dtype=np.float32)
+    assert cube.lead(0, out=out) is out
+
+
+def test_missing_member_reads_as_nan():
+    members = {0: _member(100), 10: _member(100)}
+    cube = read_odim_cube(make_rv_tar(TS, members), _names((0, 5, 10)), shape=SHAPE)
+
+    assert cube.present.tolist() == [True, False, True]
+    assert cube.dataset_what[1] is None
+    assert np.isnan(cube.lead(1)).all()
+    assert np.isnan(cube.cells([(3, 3)])[1]).all()
+
+
+def test_archive_without_members_is_rejected():
+    with pytest.raises(ValueError, match="None of the forecast members"):
+        read_odim_cube(make_rv_tar(TS, {0: _member(1)}), _names((5,)), shape=SHAPE)
+
+
+def test_members_keep_shape_pinning():
+    with pytest.raises(ValueError, match="Unexpected composite shape"):
+        read_odim_cube(make_rv_tar(TS, {0: _member(1)}), _names((0,)))
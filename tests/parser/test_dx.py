@@ -0,0 +1,90 @@
+"""Unit tests for the DX reader (radar/radolan.py) — no HA, no fixture.
+
+Synthetic DX products: an ASCII header terminated by 0x03, then uint16 words
+where each beam is a marker (bit 14), azimuth and elevation words, followed by
+range bins with zero runs packed into bit-13 flagged words.
+"""
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from radar.radolan import read_dx, unpack_dx
+
+MARKER = 2**13
+ZERO_RUN = 4096
+CLUTTER = 2**15
+
+
+def _pack_beam(bins):
+    """Pack a 128-bin beam, replacing every zero run by one flagged word."""
+    words, zeros = [], 0
+    for value in bins:
+        if value == 0:
+            zeros += 1
+            continue
+        if zeros:
+            words.append(ZERO_RUN | zeros)
+            zeros = 0
+        words.append(int(value))
+    if zeros:
+        words.append(ZERO_RUN | zeros)
+    return words
+
+
+def _dx_file(beams, azims, elevs):
+    words = []
+    for bins, azim, elev in zip(beams, azims, elevs):
+        words += [MARKER, int(azim * 10), int(elev * 10), *_pack_beam(bins)]
+    payload = np.array(words, dtype=np.uint16).tobytes()
+    body = "VS 2CO0CD0CS0EP" + "0.5" * 8 + "\x03"
+    prefix = "DX181605109080526BY"
+    header = f"{prefix}{len(prefix) + 7 + len(body) + len(payload):07d}{body}"
+    return BytesIO(header.encode() + payload)
+
+
+def test_unpack_dx_without_zero_runs_is_identity():
+    raw = np.arange(1, 129, dtype=np.uint16)
+    np.testing.assert_array_equal(unpack_dx(raw), raw)
+
+
+def test_unpack_dx_expands_zero_runs():
+    bins = np.zeros(128, dtype=np.uint16)
+    bins[5:9] = [7, 8, 9, 10]
+    bins[100] = 11 | CLUTTER
+    raw = np.array(_pack_beam(bins), dtype=np.uint16)
+    out = unpack_dx(raw)
+    assert out.dtype == np.uint16
+    np.testing.assert_array_equal(out, bins)
+
+
+@pytest.mark.parametrize("raw", [np.arange(1, 100), np.array([ZERO_RUN | 127])])
+def test_unpack_dx_rejects_wrong_bin_count(raw):
+    with pytest.raises(OSError, match="Expected size of 128"):
+        unpack_dx(raw.astype(np.uint16))
+
+
+def test_read_dx_decodes_all_beams():
+    rng = np.random.default_rng(7)
+    beams = rng.integers(1, 4095, (360, 128)).astype(np.uint16)
+    beams[rng.random((360, 128)) < 0.6] = 0
+    beams[rng.random((360, 128)) < 0.05] |= CLUTTER
+    azims = np.arange(360) + 0.5
+    elevs = np.full(360, 0.8)
+
+    data, attrs = read_dx(_dx_file(beams, azims, elevs))
+
+    assert data.shape == (360, 128)
+    np.testing.assert_allclose(data, (beams & (2**13 - 1)) * 0.5 - 32.5)
+    np.testing.assert_array_equal(attrs["clutter"], (beams & CLUTTER) != 0)
+    np.testing.assert_allclose(attrs["azim"], azims)
+    np.testing.assert_allclose(attrs["elev"], elevs)
+    assert attrs["producttype"] == "DX"
+    assert attrs["radarid"] == "10908"
+
+
+def test_read_dx_rejects_short_beam():
+    beams = [np.ones(128, dtype=np.uint16), np.ones(127, dtype=np.uint16)]
+    with pytest.raises(OSError, match="but got 127"):
+        read_dx(_dx_file(beams, [0.5, 1.5], [0.5, 0.5]))
@@ -4,9 +4,10 @@ Exercises the vendored trigonometric projection, which is the path production
 uses (get_radolan_grid falls back to crs="trig" when GDAL/osr is unavailable).
 """
 
+import numpy as np
 import pytest
 
-from radar import get_radolan_grid
+from radar import get_radolan_grid, get_radolan_grid_index
 
 
 def test_grid_shape():
@@ -27,3 +28,40 @@ def test_wgs84_corner_within_germany():
     lon, lat = float(grid[0, 0, 0]), float(grid[0, 0, 1])
     assert 3.0 <= lon <= 7.0
     assert 45.0 <= lat <= 48.0
+
+
+def test_grid_index_round_trips_grid_points():
+    """Every sampled WGS84 grid point maps back to its own (row, col)."""
+    grid = get_radolan_grid(wgs84=True, crs="trig")
+    for row in range(0, 900, 97):
+        for col in range(0, 900, 89):
+            lon, lat = grid[row, col]
+            assert get_radolan_grid_index(lat, lon) == (row, col)
+
+
+@pytest.mark.parametrize(
+    ("lat", "lon"),
+    [(51.05, 13.73), (52.52, 13.40), (48.14, 11.58), (53.55, 9.99), (50.94, 6.96)],
+)
+def test_grid_index_matches_nearest_grid_point(lat, lon):
+    """Closed form agrees with the brute-force nearest-point search."""
+    grid = get_radolan_grid(wgs84=True, crs="trig")
+    dist_sq = (grid[:, :, 1] - lat) ** 2 + (grid[:, :, 0] - lon) ** 2
+    expected = np.unravel_index(np.argmin(dist_sq), dist_sq.shape)
+    assert get_radolan_grid_index(lat, lon) == tuple(int(i) for i in expected)
+
+
+def test_grid_index_other_layouts():
+    """Non-default layouts use their own reference point and resolution."""
+    grid = get_radolan_grid(1200, 1100, wgs84=True, crs="trig")
+    lon, lat = grid[600, 550]
+    assert get_radolan_grid_index(lat, lon, 1200, 1100) == (600, 550)
+
+
+@pytest.mark.parametrize(
+    ("lat", "lon", "expected"),
+    [(54.9, 8.4, (899, 418)), (46.2, 6.1, (0, 198))],  # Sylt, Geneva
+)
+def test_grid_index_is_clamped_to_the_grid(lat, lon, expected):
+    """Locations inside the RS grid but beyond the RADOLAN edge get an edge cell."""
+    assert get_radolan_grid_index(lat, lon) == expected
@@ -6,11 +6,15 @@ import pytest
 from radar.odim import (
     RS_GRID_SHAPE,
     RS_WHERE,
+    OdimDecoder,
     _lonlat_to_xy,
     _parse_proj_param,
+    _scale,
     get_rs_grid_index,
+    read_odim_cells,
     read_odim_composite,
     read_odim_classification,
+    read_odim_window,
 )
 
 from tests.factories.odim import (
@@ -186,7 +190,55 @@ def test_rs_grid_shape_constant():
 
 
 # ===========================================================================
-# Group 6 — read_odim_classification (HymecNG)
+# Group 6 — point / window reads
+# ===========================================================================
+
+def test_cells_match_full_read():
+    """Point reads return exactly the full-grid values, nodata/undetect included."""
+    full, _ = read_odim_composite(make_odim_h5(shape=(4, 6)))
+    cells = [(0, 0), (0, 1), (3, 5), (2, 3)]
+    values, dataset_what = read_odim_cells(make_odim_h5(shape=(4, 6)), cells)
+
+    assert values.dtype == np.float32
+    assert values.shape == (4,)
+    assert np.isnan(values[0])        # nodata
+    assert values[1] == 0.0           # undetect
+    np.testing.assert_array_equal(values, [full[r, c] for r, c in cells])
+    assert dataset_what["prodname"] == "RS_top_view"
+
+
+def test_cells_preserve_request_order():
+    buf = make_odim_h5(shape=(5, 5))
+    values, _ = read_odim_cells(buf, [(4, 4), (0, 0), (4, 4)])
+    assert values[0] == pytest.approx(1.0)
+    assert np.isnan(values[1])
+    assert values[2] == pytest.approx(1.0)
+
+
+def test_cells_out_of_grid_rejected():
+    with pytest.raises(ValueError, match="outside"):
+        read_odim_cells(make_odim_h5(shape=(5, 5)), [(5, 0)])
+
+
+def test_window_matches_full_read():
+    full, _ = read_odim_composite(make_odim_h5(shape=(6, 6)))
+    window, _ = read_odim_window(make_odim_h5(shape=(6, 6)), slice(0, 3), slice(1, 4))
+    assert window.shape == (3, 3)
+    np.testing.assert_array_equal(window, full[0:3, 1:4])
+
+
+def test_point_reads_keep_untrusted_file_checks():
+    """The point/window readers refuse the same crafted files as the full read."""
+    with pytest.raises(ValueError, match="non-hard link"):
+        read_odim_cells(make_odim_external_link(), [(0, 0)])
+    with pytest.raises(ValueError, match="virtual dataset"):
+        read_odim_window(make_odim_virtual_dataset(), slice(0, 1), slice(0, 1))
+    with pytest.raises(ValueError, match="Unexpected composite shape"):
+        read_odim_cells(make_odim_h5(shape=(5, 5)), [(0, 0)], expected_shape=RS_GRID_SHAPE)
+
+
+# ===========================================================================
+# Group 7 — read_odim_classification (HymecNG)
 # ===========================================================================
 
 def test_classification_returns_unscaled_class_indices():
@@ -216,3 +268,117 @@ def test_classification_returns_validity_window():
 def test_classification_shape_pinning_rejects_wrong_size():
     with pytest.raises(ValueError, match="Unexpected composite shape"):
         read_odim_classification(make_hymecng_h5(shape=(5, 5)), expected_shape=RS_GRID_SHAPE)
+
+
+# ===========================================================================
+# Group 8 — _scale lookup table
+# ===========================================================================
+
+def _arithmetic_scale(raw, what):
+    """Reference decode: gain/offset, nodata -> NaN, undetect -> 0."""
+    data = raw.astype(np.float32) * float(what["gain"]) + float(what["offset"])
+    data[raw == what["nodata"]] = np.nan
+    data[raw == what["undetect"]] = 0.0
+    return data
+
+
+@pytest.mark.parametrize(
+    ("dtype", "nodata", "undetect"),
+    [("uint16", 65535, 0), ("int16", -32768, 0), ("uint8", 255, 0)],
+)
+def test_lut_decode_matches_arithmetic(dtype, nodata, undetect):
+    """The table path gives bit-identical values, sentinels included."""
+    info = np.iinfo(dtype)
+    raw = np.random.default_rng(0).integers(
+        info.min, info.max, size=(300, 300), endpoint=True, dtype=dtype
+    )
+    raw[0, 0], raw[0, 1] = nodata, undetect
+    what = {"gain": 0.01, "offset": -0.5, "nodata": nodata, "undetect": undetect}
+
+    data = _scale(raw, what)
+
+    assert data.dtype == np.float32
+    assert np.isnan(data[0, 0]) and data[0, 1] == 0.0
+    np.testing.assert_array_equal(data, _arithmetic_scale(raw, what))
+
+
+def test_scale_small_and_wide_arrays_use_arithmetic():
+    """Point reads and 32-bit payloads decode the same without a table."""
+    what = {"gain": 0.001, "offset": -0.001, "nodata": 65535, "undetect": 0}
+    raw = np.array([0, 1001, 65535], dtype=np.uint16)
+    np.testing.assert_array_equal(_scale(raw, what), [0.0, 1.0, np.nan])
+
+    wide = raw.astype(np.uint32)
+    np.testing.assert_array_equal(_scale(wide, what), _scale(raw, what))
+
+
+def test_scale_writes_into_reused_buffer():
+    what = {"gain": 0.5, "offset": 0.0, "nodata": 65535, "undetect": 0}
+    out = np.empty((300, 300), dtype=np.float32)
+    for fill in (2, 4):
+        raw = np.full((300, 300), fill, dtype=np.uint16)
+        assert _scale(raw, what, out) is out
+        assert np.all(out == fill / 2)
+    small = np.empty(3, dtype=np.float32)
+    assert _scale(np.array([2, 0, 65535], dtype=np.uint16), what, small) is small
+    np.testing.assert_array_equal(small, [1.0, 0.0, np.nan])
+
+
+def test_composite_decodes_into_out():
+    out = np.full((5, 5), -1.0, dtype=np.float32)
+    data, _ = read_odim_composite(make_odim_h5(), out=out)
+    assert data is out
+    np.testing.assert_array_equal(out, read_odim_composite(make_odim_h5())[0])
+
+
+# ===========================================================================
+# Group 9 — OdimDecoder (reusable buffers)
+# ===========================================================================
+
+def test_decoder_matches_module_readers():
+    decoder = OdimDecoder(shape=(5, 5))
+
+    data, dataset_what = decoder.read_composite(make_odim_h5(fill_raw=2001))
+    expected, expected_what = read_odim_composite(make_odim_h5(fill_raw=2001))
+    np.testing.assert_array_equal(data, expected)
+    assert dataset_what == expected_what
+
+    raw, _dataset_what, moment_what = decoder.read_raw(make_hymecng_h5(shape=(5, 5), fill=7))
+    expected_raw, _, expected_moment = read_odim_classification(
+        make_hymecng_h5(shape=(5, 5), fill=7)
+    )
+    np.testing.assert_array_equal(raw, expected_raw)
+    assert raw.dtype == expected_raw.dtype
+    assert moment_what == expected_moment
+
+
+def test_decoder_reuses_its_buffers_across_members():
+    """Every member of a release is decoded into the same arrays."""
+    decoder = OdimDecoder(shape=(5, 5))
+
+    first, _ = decoder.read_composite(make_odim_h5(fill_raw=1001))
+    first_raw, _, _ = decoder.read_raw(make_odim_h5(fill_raw=1001))
+    second, _ = decoder.read_composite(make_odim_h5(fill_raw=3001))
+    second_raw, _, _ = decoder.read_raw(make_odim_h5(fill_raw=3001))
+
+    assert second is first
+    assert second_raw is first_raw
+    assert second[4, 4] == pytest.approx(3.0)
+
+
+def test_decoder_reads_into_caller_buffer():
+    decoder = OdimDecoder(shape=(5, 5))
+    out = np.zeros((5, 5), dtype=np.uint32)
+
+    raw, _, _ = decoder.read_raw(make_odim_h5(fill_raw=1001), out=out)
+
+    assert raw is out
+    assert out[4, 4] == 1001
+
+
+def test_decoder_pins_shape_and_keeps_untrusted_file_checks():
+    decoder = OdimDecoder()
+    with pytest.raises(ValueError, match="Unexpected composite shape"):
+        decoder.read_composite(make_odim_h5(shape=(5, 5)))
+    with pytest.raises(ValueError, match="non-hard link"):
+        OdimDecoder(shape=(5, 5)).read_raw(make_odim_soft_link())
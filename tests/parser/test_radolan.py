@@ -9,20 +9,27 @@ absent so a fresh checkout without the binary still collects cleanly.
 """
 
 import bz2
+import io
 import json
 from pathlib import Path
 
 import numpy as np
 import pytest
 
-from radar import get_radolan_grid, read_radolan_composite
+from radar import (
+    get_radolan_grid,
+    get_radolan_grid_index,
+    read_radolan_cells,
+    read_radolan_composite,
+)
 
 FIXTURES = Path(__file__).parent.parent / "fixtures"
 RW_BZ2 = FIXTURES / "radolan_rw_sample.bin.bz2"
+SF_BZ2 = FIXTURES / "radolan_sf_sample.bin.bz2"
 META = FIXTURES / "radolan_metadata.json"
 
 pytestmark = pytest.mark.skipif(
-    not (RW_BZ2.exists() and META.exists()),
+    not (RW_BZ2.exists() and SF_BZ2.exists() and META.exists()),
     reason="RADOLAN fixture not found — run scripts/create_fixture.py",
 )
 
@@ -53,14 +60,69 @@ def test_expected_value_at_cell(rw):
 
 
 def test_grid_index_matches_recorded_cell(rw):
-    """Our WGS84 grid's nearest cell to the recorded lat/lon == recorded (row, col).
+    """The nearest cell to the recorded lat/lon == recorded (row, col).
 
-    Mirrors the production nearest-cell logic (RadolanProduct.index) and checks
-    it against the fixture's pyproj/wradlib-derived coordinates.
+    Checks both the production closed-form index (RadolanProduct.index) and the
+    brute-force WGS84 grid search against the fixture's pyproj/wradlib-derived
+    coordinates.
     """
     meta, _data, _attrs = rw
-    grid = get_radolan_grid(*meta["grid_shape"], wgs84=True)
     lat, lon = meta["lat"], meta["lon"]
+    expected = (meta["grid_row"], meta["grid_col"])
+    assert get_radolan_grid_index(lat, lon, *meta["grid_shape"]) == expected
+
+    grid = get_radolan_grid(*meta["grid_shape"], wgs84=True)
     dist_sq = (grid[:, :, 1] - lat) ** 2 + (grid[:, :, 0] - lon) ** 2
     row, col = np.unravel_index(np.argmin(dist_sq), dist_sq.shape)
-    assert (int(row), int(col)) == (meta["grid_row"], meta["grid_col"])
+    assert (int(row), int(col)) == expected
+
+
+# --- point reads ----------------------------------------------------------------
+
+
+class _CountingReader(io.BytesIO):
+    """Compressed stream that records how many bytes the decompressor pulled."""
+
+    consumed = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+def test_cells_match_full_read(rw):
+    _meta, data, attrs = rw
+    rng = np.random.default_rng(3)
+    cells = [tuple(c) for c in rng.integers(0, 900, (300, 2))]
+    cells += list(zip(*np.nonzero(data == -9999)))[:20]  # include nodata cells
+    with bz2.open(RW_BZ2) as f:
+        values, cell_attrs = read_radolan_cells(f, cells, expected_shape=(900, 900))
+    np.testing.assert_array_equal(values, [data[c] for c in cells])
+    assert cell_attrs["datetime"] == attrs["datetime"]
+    assert cell_attrs["intervalseconds"] == attrs["intervalseconds"]
+
+
+def test_cells_stop_decompressing_behind_last_row(rw):
+    """Only the compressed bytes up to the last requested row are consumed."""
+    meta, _data, _attrs = rw
+    compressed = SF_BZ2.read_bytes()  # large enough to span several bz2 blocks
+    src = _CountingReader(compressed)
+    with bz2.open(src) as f:
+        read_radolan_cells(f, [(0, 0)])
+    assert src.consumed < len(compressed) / 2
+
+    with bz2.open(RW_BZ2) as f:
+        values, _ = read_radolan_cells(f, [(meta["grid_row"], meta["grid_col"])])
+    assert values[0] == pytest.approx(meta["expected_mm"], abs=1e-3)
+
+
+@pytest.mark.parametrize("cell", [(900, 0), (0, -1)])
+def test_cells_outside_grid_rejected(cell):
+    with bz2.open(RW_BZ2) as f, pytest.raises(ValueError, match="outside"):
+        read_radolan_cells(f, [cell])
+
+
+def test_cells_unexpected_shape_rejected():
+    with bz2.open(RW_BZ2) as f, pytest.raises(ValueError, match="grid shape"):
+        read_radolan_cells(f, [(0, 0)], expected_shape=(1100, 900))
@@ -0,0 +1,83 @@
+"""Unit tests for RADOLAN header reading/tokenizing — no HA, no fixture.
+
+The header reader must stop exactly behind the 0x03 terminator on every kind
+of stream read_radolan_composite is handed (bz2, plain/buffered files, BytesIO,
+bare unseekable streams), since the binary payload is read from there on.
+"""
+
+import bz2
+import io
+
+import pytest
+
+from radar.radolan import get_radolan_header_token_pos, read_radolan_header
+
+HEADER = (
+    "RW030650100000726BY1620153VS 3SW   2.29.1PR E-01INT  60GP 900x 900"
+    "MF 00000001MS 10<asb,boo,>"
+)
+PAYLOAD = bytes(range(256)) * 4
+
+
+class _Unseekable(io.RawIOBase):
+    """Minimal stream without peek/seek."""
+
+    def __init__(self, data):
+        self._buf = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self._buf.read(len(b))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def _streams(data):
+    return {
+        "bytesio": io.BytesIO(data),
+        "buffered": io.BufferedReader(io.BytesIO(data), buffer_size=64),
+        "bz2": bz2.BZ2File(io.BytesIO(bz2.compress(data))),
+        "unseekable": _Unseekable(data),
+    }
+
+
+@pytest.mark.parametrize("kind", ["bytesio", "buffered", "bz2", "unseekable"])
+def test_header_read_stops_behind_terminator(kind):
+    fid = _streams(HEADER.encode() + b"\x03" + PAYLOAD)[kind]
+    assert read_radolan_header(fid) == HEADER
+    assert fid.read(len(PAYLOAD)) == PAYLOAD
+
+
+@pytest.mark.parametrize("kind", ["bytesio", "buffered", "bz2", "unseekable"])
+def test_header_longer_than_one_block(kind):
+    header = HEADER + "x" * 5000
+    fid = _streams(header.encode() + b"\x03" + PAYLOAD)[kind]
+    assert read_radolan_header(fid) == header
+    assert fid.read(4) == PAYLOAD[:4]
+
+
+@pytest.mark.parametrize("kind", ["bytesio", "buffered", "bz2", "unseekable"])
+def test_header_without_terminator_raises(kind):
+    with pytest.raises(EOFError):
+        read_radolan_header(_streams(HEADER.encode())[kind])
+
+
+def test_ascii_header_detected():
+    lines = "ncols 3\nnrows 2\nxllcorner 0\nyllcorner 0\ncellsize 1\nNODATA_value -1\n"
+    header = read_radolan_header(io.BytesIO(lines.encode() + b"1 2 3\n4 5 6\n"))
+    assert header["producttype"] == "ascii"
+    assert header["ncols"] == 3
+    assert header["NODATA_value"] == -1
+
+
+def test_token_positions_span_to_next_token():
+    head = get_radolan_header_token_pos(HEADER)
+    assert HEADER[slice(*head["BY"])] == "1620153"
+    assert HEADER[slice(*head["GP"])] == " 900x 900"
+    assert HEADER[slice(*head["INT"])] == "  60"
+    # the last token found runs to the end of the header
+    assert HEADER[slice(*head["MS"])] == " 10<asb,boo,>"
+    assert head["VV"] is None
+    assert list(head) == list(get_radolan_header_token_pos("", mode="composite"))
@@ -0,0 +1,121 @@
+"""Unit tests for the RADOLAN runlength decoder (PG/PC/PZ) — no HA, no fixture.
+
+Synthetic buffers built per the composite format description: each line is a
+line-number byte, offset byte(s) (value - 16, chained by 255), then data bytes
+with the run width in the high nibble and the value in the low nibble, and an
+lf terminator; the section ends with eot.
+"""
+
+import numpy as np
+
+from radar.radolan import (
+    decode_radolan_runlength_array,
+    decode_radolan_runlength_line,
+)
+
+NODATA = 255
+
+
+def _attrs(ncol, nrow=None, maxheight=False):
+    return {"ncol": ncol, "nrow": nrow, "maxheight": maxheight, "nodataflag": NODATA}
+
+
+def _line(lineno, offset_bytes, runs):
+    """Encode one line; runs are (width, value) pairs."""
+    data = bytes((width << 4) | value for width, value in runs)
+    return bytes([lineno, *offset_bytes]) + data + b"\n"
+
+
+def _reference_line(line, ncol):
+    """Straightforward per-byte decode, used as the oracle."""
+    body = list(line[1:].rstrip(b"\n"))
+    if not body:
+        return [NODATA] * ncol
+    offset = 0
+    while True:
+        byte = body.pop(0)
+        offset += byte - 16
+        if byte != 255:
+            break
+    out = [NODATA] * offset
+    for byte in body:
+        out += [byte & 0x0F] * (byte >> 4)
+    return (out + [NODATA] * ncol)[:ncol]
+
+
+def test_line_offset_runs_and_padding():
+    line = np.frombuffer(_line(1, [16 + 2], [(3, 5), (1, 7)]), dtype=np.uint8)
+    out = decode_radolan_runlength_line(line, _attrs(8))
+    assert out.dtype == np.uint8
+    assert out.tolist() == [NODATA, NODATA, 5, 5, 5, 7, NODATA, NODATA]
+
+
+def test_line_chained_offset():
+    """255 offset bytes chain: offset = sum(byte - 16)."""
+    line = np.frombuffer(_line(1, [255, 255, 16 + 3], [(2, 1)]), dtype=np.uint8)
+    out = decode_radolan_runlength_line(line, _attrs(500))
+    offset = 2 * (255 - 16) + 3
+    assert (out[:offset] == NODATA).all()
+    assert out[offset : offset + 2].tolist() == [1, 1]
+    assert (out[offset + 2 :] == NODATA).all()
+
+
+def test_line_empty_is_all_nodata():
+    line = np.frombuffer(b"\x01\n", dtype=np.uint8)
+    assert (decode_radolan_runlength_line(line, _attrs(6)) == NODATA).all()
+
+
+def test_line_overlong_is_truncated_to_ncol():
+    line = np.frombuffer(_line(1, [16], [(15, 3), (15, 4)]), dtype=np.uint8)
+    out = decode_radolan_runlength_line(line, _attrs(20))
+    assert out.tolist() == [3] * 15 + [4] * 5
+
+
+def test_array_shape_order_and_eot():
+    """Lines decode top-down and are returned flipped (row 0 = southernmost)."""
+    buf = (
+        _line(1, [16], [(4, 1)])
+        + _line(2, [16 + 1], [(2, 2)])
+        + b"\x03\n"
+        + b"\x04"
+    )
+    arr = decode_radolan_runlength_array(buf, _attrs(4, nrow=3))
+    assert arr.shape == (3, 4)
+    assert arr.tolist() == [
+        [NODATA] * 4,
+        [NODATA, 2, 2, NODATA],
+        [1, 1, 1, 1],
+    ]
+
+
+def test_array_pz_reshape():
+    lines = b"".join(_line(i + 1, [16], [(2, i % 16)]) for i in range(6))
+    arr = decode_radolan_runlength_array(lines + b"\x04", _attrs(2, 3, maxheight=2))
+    assert arr.shape == (2, 3, 2)
+    # flipped per height level along the row axis
+    assert arr[0, :, 0].tolist() == [2, 1, 0]
+    assert arr[1, :, 0].tolist() == [5, 4, 3]
+
+
+def test_array_matches_reference_decoder():
+    rng = np.random.default_rng(20260518)
+    ncol, nrow = 460, 120
+    lines = []
+    for i in range(nrow):
+        offset = int(rng.integers(0, 600))
+        offset_bytes = [255] * (offset // 239) + [16 + offset % 239]
+        runs = [
+            (int(w), int(v))
+            for w, v in zip(rng.integers(1, 16, 40), rng.integers(0, 16, 40))
+        ]
+        lines.append(_line(1 + i % 9, offset_bytes, runs))
+    arr = decode_radolan_runlength_array(b"".join(lines) + b"\x04", _attrs(ncol, nrow))
+    expected = np.array([_reference_line(line, ncol) for line in lines], dtype=np.uint8)
+    np.testing.assert_array_equal(arr, expected[::-1])
+
+
+def test_array_unterminated_last_line():
+    """A final line without lf (and no eot) is still decoded."""
+    buf = _line(1, [16], [(2, 9)]) + _line(2, [16], [(2, 8)])[:-1]
+    arr = decode_radolan_runlength_array(buf, _attrs(2, 2))
+    assert arr.tolist() == [[8, 8], [9, 9]]
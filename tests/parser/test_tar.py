@@ -0,0 +1,74 @@
+"""Parser unit tests for radar/tar.py — zero-copy tar member access."""
+
+import io
+import tarfile
+
+import numpy as np
+import pytest
+
+from radar.odim import read_odim_cells, read_odim_composite
+from radar.tar import MemoryReader, TarIndex
+
+from tests.factories.odim import make_odim_h5
+
+
+def _tar(members: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tf:
+        for name, payload in members.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(payload)
+            tf.addfile(info, io.BytesIO(payload))
+    return buf.getvalue()
+
+
+def test_index_matches_tarfile_and_views_the_original_buffer():
+    """Offsets/sizes agree with tarfile; members are views, not copies."""
+    payloads = {"a-hd5": b"x" * 700, "b-hd5": b"", "c-hd5": bytes(range(256)) * 3}
+    content = bytearray(_tar(payloads))
+
+    index = TarIndex(content)
+
+    assert index.names == list(payloads)
+    assert len(index) == 3
+    assert "missing" not in index
+    for name, payload in payloads.items():
+        view = index.view(name)
+        assert view.obj is content
+        assert view.tobytes() == payload
+    with pytest.raises(KeyError):
+        index.view("missing")
+
+
+def test_memory_reader_is_a_seekable_file():
+    reader = MemoryReader(b"0123456789")
+
+    assert reader.read(3) == b"012"
+    assert reader.seek(-2, io.SEEK_END) == 8
+    assert reader.read() == b"89"
+    assert reader.read(4) == b""
+    reader.seek(2)
+    reader.seek(3, io.SEEK_CUR)
+    buf = bytearray(3)
+    assert reader.readinto(buf) == 3 and bytes(buf) == b"567"
+    with pytest.raises(ValueError):
+        reader.seek(-1)
+
+
+def test_h5py_reads_members_in_place():
+    """ODIM members are decoded straight from the archive buffer."""
+    content = _tar({
+        "lead_000-hd5": make_odim_h5(fill_raw=1001).getvalue(),
+        "lead_005-hd5": make_odim_h5(fill_raw=2001).getvalue(),
+    })
+    index = TarIndex(content)
+
+    with index.open("lead_005-hd5") as f:
+        values, what = read_odim_cells(f, [(2, 2), (0, 0)])
+    assert values[0] == pytest.approx(2.0)
+    assert np.isnan(values[1])
+    assert what["prodname"] == "RS_top_view"
+
+    with index.open("lead_000-hd5") as f:
+        grid, _ = read_odim_composite(f)
+    assert grid[3, 3] == pytest.approx(1.0)
@@ -1,14 +1,23 @@
 """Unit tests for utils.py timing math and fetch hardening — no HA, no network."""
 
 import asyncio
+import random
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from multidict import CIMultiDict
 
 from utils import (
+    AsyncProbe,
     AsyncResponse,
     DEFAULT_MAX_BYTES,
+    LatestReleaseCache,
+    ReleaseCache,
+    ReleaseDelayEstimator,
+    RetryPolicy,
+    ValidatorCache,
     async_get,
+    async_head,
     get_previous_multiple,
     mydatetime,
 )
@@ -87,10 +96,13 @@ class _FakeContent:
 
 
 class _FakeResponse:
-    def __init__(self, *, status=200, content_length=None, chunks=(b"payload",)):
+    def __init__(
+        self, *, status=200, content_length=None, chunks=(b"payload",), headers=None
+    ):
         self.status = status
         self.content_length = content_length
         self.content = _FakeContent(chunks)
+        self.headers = CIMultiDict(headers or {})
 
     def raise_for_status(self):
         # aiohttp only raises for >= 400; our tests exercise the < 400 paths.
@@ -116,6 +128,9 @@ class _FakeSession:
             raise AssertionError("session.get must not be called for a rejected URL")
         return self._response
 
+    def head(self, url, **kwargs):
+        return self.get(url, **kwargs)
+
 
 def test_rejects_non_https():
     session = _FakeSession()  # must not be touched
@@ -162,3 +177,397 @@ def test_returns_joined_body_within_cap():
     session = _FakeSession(_FakeResponse(chunks=(b"ab", b"cd", b"ef")))
     result = asyncio.run(async_get(_VALID_URL, session, max_bytes=1000))
     assert result.content == b"abcdef"
+
+
+# ===========================================================================
+# async_get — conditional revalidation (ValidatorCache)
+# ===========================================================================
+
+def test_conditional_get_serves_cached_body_on_304():
+    validators = ValidatorCache()
+    first = _FakeSession(
+        _FakeResponse(chunks=(b"tar",), headers={"ETag": '"v1"', "Last-Modified": "lm"})
+    )
+    assert asyncio.run(async_get(_VALID_URL, first, validators=validators)).content == b"tar"
+    assert first.calls[0][1]["headers"] == {}
+
+    second = _FakeSession(_FakeResponse(status=304, chunks=()))
+    result = asyncio.run(async_get(_VALID_URL, second, validators=validators))
+    assert result.content == b"tar"
+    assert second.calls[0][1]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "lm",
+    }
+    # Revalidation keeps the redirect opt-out.
+    assert second.calls[0][1]["allow_redirects"] is False
+
+
+def test_changed_body_replaces_cached_one():
+    validators = ValidatorCache()
+    for body, etag in ((b"old", '"v1"'), (b"new", '"v2"')):
+        session = _FakeSession(_FakeResponse(chunks=(body,), headers={"ETag": etag}))
+        asyncio.run(async_get(_VALID_URL, session, validators=validators))
+    assert validators.get(_VALID_URL).content == b"new"
+    assert validators.size == 3
+
+
+def test_unsolicited_304_is_rejected():
+    session = _FakeSession(_FakeResponse(status=304))
+    with pytest.raises(ValueError, match="redirect"):
+        asyncio.run(async_get(_VALID_URL, session, validators=ValidatorCache()))
+
+
+def test_body_without_validators_is_not_cached():
+    validators = ValidatorCache()
+    session = _FakeSession(_FakeResponse(chunks=(b"x",)))
+    asyncio.run(async_get(_VALID_URL, session, validators=validators))
+    assert _VALID_URL not in validators
+
+
+def test_validator_cache_bounds():
+    validators = ValidatorCache(max_entries=2, max_bytes=10)
+    validators.put("a", b"1234", '"a"', None)
+    validators.put("b", b"1234", '"b"', None)
+    validators.get("a")  # "b" is now least recently used
+    validators.put("c", b"12", '"c"', None)
+    assert "b" not in validators and len(validators) == 2
+    validators.put("d", b"123456789", '"d"', None)  # byte bound evicts the rest
+    assert list(validators._entries) == ["d"]
+    validators.put("e", b"x" * 11, '"e"', None)  # larger than the whole cache
+    assert "e" not in validators and validators.size == 9
+
+
+def test_validator_cache_keeps_the_latest_release_per_product():
+    validators = ValidatorCache()
+    base = "https://opendata.dwd.de/weather/radar/composite"
+    validators.put(f"{base}/rv/composite_rv_20260716_2030.tar", b"old", '"1"', None)
+    validators.put(f"{base}/rs/composite_rs_20260716_2030.tar", b"rs", '"2"', None)
+    validators.put(f"{base}/rv/composite_rv_20260716_2035.tar", b"new", '"3"', None)
+
+    assert f"{base}/rv/composite_rv_20260716_2030.tar" not in validators
+    assert validators.get(f"{base}/rv/composite_rv_20260716_2035.tar").content == b"new"
+    assert len(validators) == 2 and validators.size == 5
+
+    # A newer release without validators still retires the older body.
+    validators.put(f"{base}/rs/composite_rs_20260716_2035.tar", b"rs", None, None)
+    assert len(validators) == 1
+
+
+def test_rejected_url_never_consults_cache():
+    validators = ValidatorCache()
+    validators.put("http://opendata.dwd.de/x.tar", b"x", '"v"', None)
+    with pytest.raises(ValueError, match="non-HTTPS"):
+        asyncio.run(
+            async_get("http://opendata.dwd.de/x.tar", _FakeSession(), validators=validators)
+        )
+
+
+# ===========================================================================
+# async_head probes and preallocated reads
+# ===========================================================================
+
+_LAST_MODIFIED = "Mon, 18 May 2026 16:07:12 GMT"
+
+
+def test_head_reports_missing_release():
+    session = _FakeSession(_FakeResponse(status=404))
+    probe = asyncio.run(async_head(_VALID_URL, session))
+    assert probe == AsyncProbe(exists=False)
+    assert session.calls[0][1]["allow_redirects"] is False
+
+
+def test_head_reports_length_and_publication_time():
+    session = _FakeSession(
+        _FakeResponse(content_length=1234, headers={"Last-Modified": _LAST_MODIFIED})
+    )
+    probe = asyncio.run(async_head(_VALID_URL, session))
+    assert probe.exists
+    assert probe.content_length == 1234
+    assert probe.last_modified == datetime(2026, 5, 18, 16, 7, 12, tzinfo=UTC)
+
+
+def test_head_keeps_url_and_redirect_rules():
+    with pytest.raises(ValueError, match="untrusted host"):
+        asyncio.run(async_head("https://evil.example/x.tar", _FakeSession()))
+    with pytest.raises(ValueError, match="redirect"):
+        asyncio.run(async_head(_VALID_URL, _FakeSession(_FakeResponse(status=301))))
+
+
+@pytest.mark.parametrize(
+    ("content_length", "size_hint"), [(6, None), (None, 6), (None, 100), (10, None)]
+)
+def test_preallocated_read_returns_exact_body(content_length, size_hint):
+    session = _FakeSession(
+        _FakeResponse(content_length=content_length, chunks=(b"ab", b"cd", b"ef"))
+    )
+    result = asyncio.run(async_get(_VALID_URL, session, size_hint=size_hint))
+    assert result.content == b"abcdef"
+
+
+def test_preallocated_read_keeps_byte_cap():
+    session = _FakeSession(_FakeResponse(chunks=(b"a" * 40, b"b" * 40)))
+    with pytest.raises(ValueError, match="exceeded"):
+        asyncio.run(async_get(_VALID_URL, session, max_bytes=50, size_hint=40))
+
+
+def test_get_reports_last_modified():
+    session = _FakeSession(_FakeResponse(headers={"Last-Modified": _LAST_MODIFIED}))
+    result = asyncio.run(async_get(_VALID_URL, session))
+    assert result.last_modified == datetime(2026, 5, 18, 16, 7, 12, tzinfo=UTC)
+
+
+# ===========================================================================
+# ReleaseCache — shared, release-keyed fetches
+# ===========================================================================
+
+_RELEASE = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+
+
+class _CountingFetch:
+    """A fetch factory that counts calls and can be held open by an event."""
+
+    def __init__(self, payload=b"tar", gate=None, error=None):
+        self.calls = 0
+        self._payload = payload
+        self._gate = gate
+        self._error = error
+
+    async def __call__(self):
+        self.calls += 1
+        if self._gate is not None:
+            await self._gate.wait()
+        if self._error is not None:
+            raise self._error
+        return self._payload
+
+
+def test_release_cache_coalesces_concurrent_fetches():
+    """Three coordinators asking for the same release while in flight → one fetch."""
+    cache = ReleaseCache()
+    subscribers = ("a", "b", "c")
+    for sub in subscribers:
+        cache.subscribe("rv", sub)
+
+    async def run():
+        gate = asyncio.Event()
+        fetch = _CountingFetch(gate=gate)
+        waiters = [
+            asyncio.ensure_future(cache.async_fetch("rv", _RELEASE, sub, fetch))
+            for sub in subscribers
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters)
+        return fetch.calls, results
+
+    calls, results = asyncio.run(run())
+    assert calls == 1
+    assert results == [b"tar", b"tar", b"tar"]
+    # Every subscriber consumed the release → evicted.
+    assert ("rv", _RELEASE) not in cache
+
+
+def test_release_cache_holds_release_until_every_subscriber_consumed():
+    cache = ReleaseCache()
+    cache.subscribe("rs", "a")
+    cache.subscribe("rs", "b")
+    fetch = _CountingFetch()
+
+    async def run():
+        first = await cache.async_fetch("rs", _RELEASE, "a", fetch)
+        held = ("rs", _RELEASE) in cache
+        second = await cache.async_fetch("rs", _RELEASE, "b", fetch)
+        return first, held, second
+
+    first, held, second = asyncio.run(run())
+    assert first == second == b"tar"
+    assert held is True
+    assert fetch.calls == 1
+    assert ("rs", _RELEASE) not in cache
+
+
+def test_release_cache_newer_release_supersedes_older():
+    cache = ReleaseCache()
+    cache.subscribe("rs", "a")
+    cache.subscribe("rs", "b")
+    newer = _RELEASE + timedelta(minutes=5)
+
+    async def run():
+        await cache.async_fetch("rs", _RELEASE, "a", _CountingFetch())
+        await cache.async_fetch("rs", newer, "a", _CountingFetch())
+
+    asyncio.run(run())
+    # "b" never consumed the old release, but nobody will ask for it again.
+    assert ("rs", _RELEASE) not in cache
+    assert ("rs", newer) in cache
+
+
+def test_release_cache_unsubscribe_releases_pending_entries():
+    cache = ReleaseCache()
+    cache.subscribe("rw", "a")
+    unsubscribe_b = cache.subscribe("rw", "b")
+
+    asyncio.run(cache.async_fetch("rw", _RELEASE, "a", _CountingFetch()))
+    assert ("rw", _RELEASE) in cache
+
+    unsubscribe_b()
+    assert ("rw", _RELEASE) not in cache
+
+
+def test_release_cache_does_not_cache_failures():
+    cache = ReleaseCache()
+    cache.subscribe("sf", "a")
+    cache.subscribe("sf", "b")
+    failing = _CountingFetch(error=ConnectionError("boom"))
+    working = _CountingFetch()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(cache.async_fetch("sf", _RELEASE, "a", failing))
+    assert ("sf", _RELEASE) not in cache
+
+    assert asyncio.run(cache.async_fetch("sf", _RELEASE, "b", working)) == b"tar"
+    assert working.calls == 1
+
+
+def test_latest_release_cache_shares_one_build_per_release():
+    cache = LatestReleaseCache()
+
+    async def run():
+        gate = asyncio.Event()
+        build = _CountingFetch(gate=gate)
+        waiters = [
+            asyncio.ensure_future(cache.async_get(_RELEASE, build)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters)
+        again = await cache.async_get(_RELEASE, build)
+        return build.calls, results, again
+
+    calls, results, again = asyncio.run(run())
+    assert calls == 1
+    assert results == [b"tar"] * 3 and again == b"tar"
+    assert cache.release == _RELEASE
+
+
+def test_latest_release_cache_keeps_only_the_newest_release():
+    cache = LatestReleaseCache()
+    newer = _RELEASE + timedelta(minutes=5)
+    old_build, newer_build = _CountingFetch(), _CountingFetch()
+
+    async def run():
+        await cache.async_get(newer, newer_build)
+        # An older release is built for its caller but does not evict the newer.
+        await cache.async_get(_RELEASE, old_build)
+        await cache.async_get(_RELEASE, old_build)
+        await cache.async_get(newer, newer_build)
+
+    asyncio.run(run())
+    assert old_build.calls == 2
+    assert newer_build.calls == 1
+    assert cache.release == newer
+
+    cache.clear()
+    assert cache.release is None
+
+
+def test_latest_release_cache_does_not_cache_failures():
+    cache = LatestReleaseCache()
+    failing = _CountingFetch(error=ConnectionError("boom"))
+    working = _CountingFetch()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(cache.async_get(_RELEASE, failing))
+    assert cache.release is None
+
+    assert asyncio.run(cache.async_get(_RELEASE, working)) == b"tar"
+    assert working.calls == 1
+
+
+# ===========================================================================
+# ReleaseDelayEstimator — learned publication delay
+# ===========================================================================
+
+_STATIC = timedelta(minutes=28)
+
+
+def _minutes(*values):
+    return [timedelta(minutes=v) for v in values]
+
+
+def test_delay_estimator_uses_static_until_enough_samples():
+    est = ReleaseDelayEstimator(_STATIC, timedelta(hours=1), min_samples=3)
+    for delay in _minutes(20, 21):
+        est.observe(delay)
+    assert est.learned is None
+    assert est.delay == _STATIC
+
+
+def test_delay_estimator_high_percentile_plus_margin():
+    est = ReleaseDelayEstimator(_STATIC, timedelta(hours=1), quantile=0.9)
+    for delay in _minutes(*range(20, 30)):  # 20..29 min
+        est.observe(delay)
+    # nearest-rank p90 of 10 samples is the 9th: 28 min, plus the 10 s margin
+    assert est.delay == timedelta(minutes=28, seconds=10)
+
+
+def test_delay_estimator_is_clamped_around_static():
+    fast = ReleaseDelayEstimator(_STATIC, timedelta(hours=1))
+    slow = ReleaseDelayEstimator(_STATIC, timedelta(hours=1))
+    for _ in range(5):
+        fast.observe(timedelta(minutes=2))
+        slow.observe(timedelta(minutes=70))
+    assert fast.delay == _STATIC * 0.5
+    assert slow.delay == _STATIC * 2
+
+
+def test_delay_estimator_ignores_uninformative_observations():
+    est = ReleaseDelayEstimator(_STATIC, timedelta(hours=1))
+    assert not est.observe(timedelta(minutes=-1))
+    assert not est.observe(timedelta(hours=3))  # catch-up fetch of an old release
+    assert est.observe(timedelta(minutes=25))
+    assert len(est) == 1
+
+
+def test_delay_estimator_window_rolls():
+    est = ReleaseDelayEstimator(_STATIC, timedelta(hours=1), window=3)
+    for delay in _minutes(40, 40, 40, 20, 20, 20):
+        est.observe(delay)
+    assert len(est) == 3
+    assert est.delay == timedelta(minutes=20, seconds=10)
+
+
+# ===========================================================================
+# RetryPolicy — fast-poll backoff
+# ===========================================================================
+
+
+def test_retry_policy_grows_exponentially_up_to_cap():
+    policy = RetryPolicy(initial=timedelta(seconds=20), factor=2.0, jitter=0.0)
+    hour = timedelta(hours=1)
+    waits = [policy.delay(n, hour).total_seconds() for n in range(8)]
+    assert waits[:5] == [20, 40, 80, 160, 320]
+    assert max(waits) == policy.cap(hour).total_seconds() == 900
+
+
+def test_retry_policy_cap_follows_release_interval():
+    policy = RetryPolicy(jitter=0.0)
+    assert policy.cap(timedelta(minutes=5)) == timedelta(seconds=75)
+    assert policy.delay(10, timedelta(minutes=5)) == timedelta(seconds=75)
+
+
+def test_retry_policy_stays_at_the_cap_for_any_attempt():
+    # A daily release missing for hours: the exponent alone would overflow.
+    policy = RetryPolicy(jitter=0.0)
+    day = timedelta(days=1)
+    for attempt in (42, 1_000, 10**9):
+        assert policy.delay(attempt, day) == policy.cap(day) == timedelta(minutes=15)
+
+
+def test_retry_policy_jitter_spreads_coordinators():
+    policy = RetryPolicy(jitter=0.2)
+    waits = {
+        policy.delay(0, timedelta(hours=1), random.Random(seed)) for seed in range(20)
+    }
+    assert len(waits) > 1
+    assert all(timedelta(seconds=16) <= w <= timedelta(seconds=24) for w in waits)
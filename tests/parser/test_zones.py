@@ -0,0 +1,215 @@
+"""Parser unit tests for radar/zones.py — GeoJSON zones and their cell index."""
+
+import json
+
+import numpy as np
+import pytest
+
+from radar.georef import (
+    get_radolan_grid,
+    get_radolan_grid_index,
+    get_radolan_grid_position,
+)
+from radar.odim import RS_GRID_SHAPE, get_rs_grid_index, rs_grid_position
+from radar.zones import ZoneIndex, cell_weights, parse_zones
+
+
+def _square(lon0, lat0, lon1, lat1):
+    return [[lon0, lat0], [lon1, lat0], [lon1, lat1], [lon0, lat1], [lon0, lat0]]
+
+
+def _feature(geometry, name=None):
+    return {
+        "type": "Feature",
+        "properties": {} if name is None else {"name": name},
+        "geometry": geometry,
+    }
+
+
+def _grid_position(lat, lon):
+    """Place (lon, lat) test vertices directly at (row=lat, col=lon)."""
+    return lat, lon
+
+
+def test_parse_zones_accepts_collections_features_and_geometries():
+    polygon = {"type": "Polygon", "coordinates": [_square(9, 50, 10, 51)]}
+    multi = {
+        "type": "MultiPolygon",
+        "coordinates": [[_square(9, 50, 10, 51)], [_square(11, 50, 12, 51)]],
+    }
+    collection = {
+        "type": "FeatureCollection",
+        "features": [_feature(polygon, "Catchment"), _feature(multi)],
+    }
+
+    zones = parse_zones(json.dumps(collection))
+    assert list(zones) == ["Catchment", "Zone 2"]
+    assert len(zones["Zone 2"]) == 2
+    assert zones["Catchment"][0][1] == (10.0, 50.0)
+
+    assert list(parse_zones(json.dumps(_feature(polygon, "Home")))) == ["Home"]
+    assert list(parse_zones(json.dumps(multi))) == ["Zone 1"]
+
+
+@pytest.mark.parametrize(
+    ("document", "message"),
+    [
+        ("{", "Invalid JSON"),
+        ("[]", "must be an object"),
+        ('{"type": "FeatureCollection", "features": []}', "No zones"),
+        ('{"type": "Point", "coordinates": [9, 50]}', "Unsupported geometry"),
+        ('{"type": "Polygon", "coordinates": [[[9, 50], [10, 50], [9, 50]]]}',
+         "three positions"),
+        ('{"type": "Polygon", "coordinates": [[[50, 9], [51, 9], [51, 100]]]}',
+         "longitude, latitude"),
+        ('{"type": "Feature", "properties": {"name": "A"}}', "no geometry"),
+        ('{"type": "Feature", "properties": ["A"], "geometry": '
+         '{"type": "Polygon", "coordinates": [[[9, 50], [10, 50], [10, 51]]]}}',
+         "must be an object"),
+    ],
+)
+def test_parse_zones_rejects_invalid_documents(document, message):
+    with pytest.raises(ValueError, match=message):
+        parse_zones(document)
+
+
+def test_parse_zones_rejects_duplicate_names():
+    polygon = {"type": "Polygon", "coordinates": [_square(9, 50, 10, 51)]}
+    collection = {
+        "type": "FeatureCollection",
+        "features": [_feature(polygon, "A"), _feature(polygon, "A")],
+    }
+    with pytest.raises(ValueError, match="Duplicate zone name"):
+        parse_zones(json.dumps(collection))
+
+
+def _weights(rings, shape=(10, 10), supersample=8):
+    rings = [np.array(ring, dtype=float) for ring in rings]
+    flat, share = cell_weights(rings, shape, supersample)
+    grid = np.zeros(shape)
+    grid.ravel()[flat] = share
+    return grid
+
+
+def test_cell_weights_are_the_covered_share_of_each_cell():
+    # Edges on cell boundaries: 3 × 3 whole cells.
+    grid = _weights([[(1.5, 1.5), (1.5, 4.5), (4.5, 4.5), (4.5, 1.5)]])
+    assert grid[2:5, 2:5].tolist() == np.ones((3, 3)).tolist()
+    assert grid.sum() == 9
+
+    # Edges through cell centres: halves along the sides, quarters at corners.
+    grid = _weights([[(2, 2), (2, 4), (4, 4), (4, 2)]])
+    np.testing.assert_allclose(
+        grid[2:5, 2:5], [[0.25, 0.5, 0.25], [0.5, 1.0, 0.5], [0.25, 0.5, 0.25]]
+    )
+    assert grid.sum() == pytest.approx(4.0)
+
+
+def test_cell_weights_follow_the_even_odd_rule_and_the_grid_edge():
+    outer = [(0.5, 0.5), (0.5, 6.5), (6.5, 6.5), (6.5, 0.5)]
+    hole = [(2.5, 2.5), (2.5, 4.5), (4.5, 4.5), (4.5, 2.5)]
+    grid = _weights([outer, hole])
+    assert grid.sum() == pytest.approx(36 - 4)
+    assert (grid[3:5, 3:5] == 0).all()
+
+    # A triangle's area is preserved up to the sampling resolution.
+    grid = _weights([[(0.5, 0.5), (0.5, 8.5), (8.5, 0.5)]], supersample=16)
+    assert grid.sum() == pytest.approx(32.0, rel=0.02)
+
+    # Clipped to the grid; nothing left when entirely outside.
+    grid = _weights([[(-5, -5), (-5, 1.5), (1.5, 1.5), (1.5, -5)]])
+    assert grid.sum() == 4
+    flat, share = cell_weights(
+        [np.array([(20, 20), (20, 30), (30, 30)], dtype=float)], (10, 10)
+    )
+    assert flat.size == share.size == 0
+
+
+def _zone_index(shape=(10, 10)):
+    zones = {
+        "west": [_square(0.5, 0.5, 3.5, 5.5)],
+        "east": [_square(2.5, 1.5, 7.5, 5.5)],  # overlaps "west" in column 3
+    }
+    return ZoneIndex.build(zones, _grid_position, shape)
+
+
+def test_index_is_one_flat_sorted_set_of_arrays():
+    index = _zone_index()
+
+    assert index.names == ("west", "east") and len(index) == 2
+    assert np.all(np.diff(index.flat) >= 0)
+    assert not index.flat.flags.writeable
+    # Column 3 belongs to both zones, so its cells appear twice.
+    assert len(index.cells) == len(index.flat) - 4
+    assert index.weights.sum() == pytest.approx(15 + 20)
+
+
+def test_reduce_matches_a_brute_force_weighted_mean():
+    index = _zone_index()
+    grid = np.random.default_rng(1).random((10, 10), dtype=np.float32)
+    grid[3, 1] = np.nan  # nodata cells are left out
+
+    means = index.reduce(grid)
+
+    west, east = grid[1:6, 1:4], grid[2:6, 3:8]
+    assert means["west"] == pytest.approx(np.nanmean(west), rel=1e-6)
+    assert means["east"] == pytest.approx(np.nanmean(east), rel=1e-6)
+
+
+def test_reduce_cells_from_a_batch_extraction():
+    index = _zone_index()
+    grid = np.random.default_rng(2).random((10, 10), dtype=np.float32)
+
+    # More cells than the zones need, in any order.
+    cells = [(9, 9), *reversed(index.cells), (0, 0)]
+    values = np.array([grid[cell] for cell in cells])
+    assert index.reduce_cells(values, cells) == pytest.approx(index.reduce(grid))
+
+    with pytest.raises(KeyError, match="do not cover"):
+        index.reduce_cells(values[1:5], cells[1:5])
+    with pytest.raises(ValueError, match="does not match"):
+        index.reduce(np.zeros((5, 5), dtype=np.float32))
+
+
+def test_zone_without_valid_cells_or_outside_the_grid():
+    index = _zone_index()
+    grid = np.zeros((10, 10), dtype=np.float32)
+    grid[:, :4] = np.nan
+
+    assert index.reduce(grid) == {"west": None, "east": 0.0}
+    with pytest.raises(ValueError, match="'far' does not overlap"):
+        ZoneIndex.build({"far": [_square(20, 20, 30, 30)]}, _grid_position, (10, 10))
+
+
+def test_grid_positions_round_to_the_nearest_cell():
+    for lat, lon in ((51.05, 13.73), (53.55, 9.99), (47.6, 7.6)):
+        row, col = rs_grid_position(lat, lon)
+        assert (round(row), round(col)) == get_rs_grid_index(lat, lon)
+        # RADOLAN grid points are lower-left pixel corners, half a pixel off.
+        row, col = get_radolan_grid_position(lat, lon)
+        assert (round(row + 0.5), round(col + 0.5)) == get_radolan_grid_index(lat, lon)
+
+
+def test_zone_on_the_rs_grid_covers_its_centre_cell():
+    zones = parse_zones(json.dumps(
+        {"type": "Polygon", "coordinates": [_square(13.6, 51.0, 13.9, 51.1)]}
+    ))
+    index = ZoneIndex.build(zones, rs_grid_position, RS_GRID_SHAPE)
+
+    assert get_rs_grid_index(51.05, 13.75) in index.cells
+    # ~21 km × 11 km at about 1 km resolution.
+    assert 180 < index.weights.sum() < 300
+
+
+def test_zone_inside_one_radolan_pixel_covers_just_that_pixel():
+    centres = get_radolan_grid(crs="trig", wgs84=True, mode="center")
+    lon, lat = centres[400, 500]
+    assert get_radolan_grid_position(lat, lon) == (
+        pytest.approx(400.0, abs=1e-6),
+        pytest.approx(500.0, abs=1e-6),
+    )
+
+    d = 0.002
+    zones = {"pixel": [_square(lon - d, lat - d, lon + d, lat + d)]}
+    index = ZoneIndex.build(zones, get_radolan_grid_position, (900, 900))
+    assert index.cells == ((400, 500),)